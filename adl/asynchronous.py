@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+
+# coroutines for filling from asyncio applications (Python 3.7 and later; the rest of adl does not need this module)
+
+import asyncio
+
+import adl.reader
+
+###################################################### filling without blocking the event loop
+
+async def fill(run, chunks, source=None, progress=None, depth=2, maxbytes=None):
+    # like Run.fill, but chunks are read in a prefetching thread and filled in the loop's default executor,
+    # so progress(numchunks, numevents) is called from an executor thread, not the loop's thread;
+    # filling goes into an empty shard that is merged into run.aggregation only after the last chunk, so
+    # if this is cancelled or filling fails, run.aggregation is unchanged (the executor thread stops at
+    # the next chunk and its shard is discarded)
+    loop = asyncio.get_running_loop()
+    shard = run.shard()
+    prefetcher = adl.reader.Prefetcher(chunks, depth=depth, maxbytes=maxbytes)
+    try:
+        aggregation = await loop.run_in_executor(None, shard.fill, prefetcher, source, progress)
+    finally:
+        # closing joins the prefetching thread, which must not happen on the loop's thread; it is shielded,
+        # so the thread is still joined if this coroutine is cancelled again while waiting for it
+        await asyncio.shield(loop.run_in_executor(None, prefetcher.close))
+
+    run.aggregation += aggregation
+    return run.aggregation
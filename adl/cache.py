@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+import collections
+import hashlib
+import os
+import pickle
+import stat
+import threading
+import warnings
+import zlib
+
+import adl.version
+
+###################################################### content-addressed cache of parsed documents
+
+class DocumentCache(object):
+    # Files on disk are pickles, and unpickling can run arbitrary code, so the directory must be private:
+    # it is created with mode 0700, and an existing directory that is not owned by this user or that others
+    # can write to is ignored (with a warning). Don't point ADL_CACHE_DIR at a shared directory.
+    suffix = ".adlc"
+
+    def __init__(self, maxsize=128, directory=None, maxbytes=64*1024**2):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.maxbytes = maxbytes
+        self._lock = threading.Lock()
+        self._suites = collections.OrderedDict()
+        self._warned = False
+
+    def __repr__(self):
+        return "<DocumentCache {0}/{1} in memory{2}>".format(len(self._suites), self.maxsize, "" if self.directory is None else ", on disk in " + repr(self.directory))
+
+    def __len__(self):
+        return len(self._suites)
+
+    @staticmethod
+    def key(code):
+        # invalidated by a new adl version or a change in the grammar
+        import adl.parsertable
+        digest = hashlib.sha256()
+        digest.update(adl.version.__version__.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(adl.parsertable._lr_signature.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(code.encode("utf-8"))
+        return digest.hexdigest()
+
+    def parse(self, code):
+        key = self.key(code)
+        with self._lock:
+            suite = self._suites.get(key)
+            if suite is not None:
+                self._suites.move_to_end(key)
+                return suite
+
+        suite = self._load(key)
+        if suite is None:
+            # only a cache miss needs the parser (and PLY)
+            import adl.parser
+            suite = adl.parser.parse(code)
+            self._store(key, suite)
+
+        with self._lock:
+            self._suites[key] = suite
+            while len(self._suites) > self.maxsize:
+                self._suites.popitem(last=False)
+        return suite
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._suites.clear()
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for filename in os.listdir(self.directory):
+                if filename.endswith(self.suffix):
+                    os.remove(os.path.join(self.directory, filename))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _private(self):
+        try:
+            status = os.stat(self.directory)
+        except OSError:
+            return False
+        if (not hasattr(os, "getuid") or status.st_uid == os.getuid()) and status.st_mode & (stat.S_IRWXG | stat.S_IRWXO) == 0:
+            return True
+        if not self._warned:
+            self._warned = True
+            warnings.warn("not using the ADL document cache in {0} because other users can write to it (it must be owned by this user with mode 0700)".format(repr(self.directory)))
+        return False
+
+    def _load(self, key):
+        if self.directory is None or not self._private():
+            return None
+        try:
+            with open(self._path(key), "rb") as file:
+                suite = pickle.loads(zlib.decompress(file.read()))
+            os.utime(self._path(key), None)
+            return suite
+        except Exception:
+            # missing, truncated, or written by an incompatible Python: parse again
+            return None
+
+    def _store(self, key, suite):
+        # best effort: a full disk or an unwritable directory only means that the next process parses again
+        if self.directory is None:
+            return
+        import tempfile
+        tmp = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, 0o700)
+                os.chmod(self.directory, 0o700)
+            if not self._private():
+                return
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(zlib.compress(pickle.dumps(suite, pickle.HIGHEST_PROTOCOL)))
+            os.replace(tmp, self._path(key))
+            tmp = None
+            self._evict()
+        except (OSError, pickle.PicklingError):
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+
+    def _evict(self):
+        # least recently used files go first (loading a file touches it)
+        if self.maxbytes is None:
+            return
+        files = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(self.suffix):
+                try:
+                    status = os.stat(os.path.join(self.directory, filename))
+                except OSError:
+                    continue
+                files.append((status.st_mtime, status.st_size, filename))
+        total = sum(x[1] for x in files)
+        for mtime, size, filename in sorted(files):
+            if total <= self.maxbytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, filename))
+            except OSError:
+                pass
+            total -= size
+
+default = DocumentCache(directory=os.environ.get("ADL_CACHE_DIR"))
+
+def parse(code):
+    return default.parse(code)
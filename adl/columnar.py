@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+
+import numbers
+
+import numpy
+
+###################################################### jagged arrays
+
+class JaggedArray(object):
+    @classmethod
+    def fromcounts(cls, counts, content):
+        counts = numpy.asarray(counts, dtype=numpy.int64)
+        offsets = numpy.empty(len(counts) + 1, dtype=numpy.int64)
+        offsets[0] = 0
+        numpy.cumsum(counts, out=offsets[1:])
+        return cls(offsets, content)
+
+    @classmethod
+    def fromiter(cls, iterable):
+        lists = [list(x) for x in iterable]
+        return cls.fromcounts([len(x) for x in lists], numpy.array([y for x in lists for y in x]))
+
+    def __init__(self, offsets, content):
+        self.offsets = numpy.asarray(offsets, dtype=numpy.int64)
+        self.content = content
+        if len(self.offsets) == 0 or self.offsets[0] < 0 or (len(self.offsets) > 1 and self.offsets[-1] > len(content)):
+            raise ValueError("offsets must be a non-empty, non-negative array that does not exceed the content")
+
+    def __repr__(self):
+        return "<JaggedArray {0}>".format(self.tolist() if len(self) <= 6 else "of {0} lists".format(len(self)))
+
+    @property
+    def starts(self):
+        return self.offsets[:-1]
+
+    @property
+    def stops(self):
+        return self.offsets[1:]
+
+    @property
+    def counts(self):
+        return self.offsets[1:] - self.offsets[:-1]
+
+    @property
+    def parents(self):
+        return numpy.repeat(numpy.arange(len(self), dtype=numpy.int64), self.counts)
+
+    @property
+    def localindex(self):
+        return numpy.arange(self.offsets[-1] - self.offsets[0], dtype=numpy.int64) - numpy.repeat(self.starts - self.offsets[0], self.counts)
+
+    def flatten(self):
+        return self.content[self.offsets[0]:self.offsets[-1]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, where):
+        if isinstance(where, (numbers.Integral, numpy.integer)):
+            if where < 0:
+                where += len(self)
+            if not 0 <= where < len(self):
+                raise IndexError("index out of range for JaggedArray of length {0}".format(len(self)))
+            return self.content[self.offsets[where]:self.offsets[where + 1]]
+
+        elif isinstance(where, slice):
+            start, stop, step = where.indices(len(self))
+            if step != 1:
+                raise IndexError("JaggedArray slices must have step 1")
+            return JaggedArray(self.offsets[start:max(start, stop) + 1], self.content)
+
+        else:
+            raise TypeError("JaggedArray indexes must be integers or slices")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def tolist(self):
+        return [self.content[self.offsets[i]:self.offsets[i + 1]].tolist() for i in range(len(self))]
+
+###################################################### Lorentz vector arrays
+
+def delta_r(eta1, phi1, eta2, phi2):
+    with numpy.errstate(invalid="ignore"):
+        dphi = (phi1 - phi2 + numpy.pi) % (2*numpy.pi) - numpy.pi
+        return numpy.sqrt(dphi**2 + (eta1 - eta2)**2)
+
+def delta_r_matrix(eta1, phi1, eta2, phi2):
+    eta1, phi1, eta2, phi2 = [numpy.asarray(x, dtype=numpy.float64) for x in (eta1, phi1, eta2, phi2)]
+    return delta_r(eta1[:, numpy.newaxis], phi1[:, numpy.newaxis], eta2[numpy.newaxis, :], phi2[numpy.newaxis, :])
+
+def _errstate(f):
+    def out(*args, **kwds):
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return f(*args, **kwds)
+    out.__name__ = f.__name__
+    return out
+
+def _signedsqrt(x):
+    return numpy.copysign(numpy.sqrt(numpy.absolute(x)), x)
+
+class LorentzVectorArray(object):
+    systems = (("px", "py", "pz", "energy"),
+               ("px", "py", "pz", "mass"),
+               ("pt", "eta", "phi", "energy"),
+               ("pt", "eta", "phi", "mass"))
+
+    members = ("px", "py", "pz", "energy", "pt", "eta", "phi", "mass", "p", "Et", "mt", "theta", "rapidity", "beta", "gamma", "dot", "delta_phi", "delta_r")
+
+    matching = ("delta_r_matrix", "nearest", "isolated_from")
+
+    def __init__(self, offsets=None, **coordinates):
+        for system in self.systems:
+            if set(coordinates) == set(system):
+                break
+        else:
+            raise TypeError("LorentzVectorArray coordinates must be one of {0}, not {1}".format(", ".join("(" + ", ".join(x) + ")" for x in self.systems), ", ".join(sorted(coordinates))))
+
+        self._columns = {}
+        for n, x in coordinates.items():
+            if isinstance(x, JaggedArray):
+                if offsets is None:
+                    offsets = x.offsets
+                elif not numpy.array_equal(offsets, x.offsets):
+                    raise ValueError("jagged coordinate {0} does not have the same structure as the others".format(repr(n)))
+                x = x.content
+            self._columns[n] = numpy.asarray(x, dtype=numpy.float64)
+
+        lengths = set(len(x) for x in self._columns.values())
+        if len(lengths) != 1:
+            raise ValueError("LorentzVectorArray coordinates must all have the same length")
+
+        if offsets is not None:
+            offsets = numpy.asarray(offsets, dtype=numpy.int64)
+            if offsets[0] != 0:
+                self._columns = dict((n, x[offsets[0]:offsets[-1]]) for n, x in self._columns.items())
+                offsets = offsets - offsets[0]
+            if offsets[-1] != len(self._columns[system[0]]):
+                raise ValueError("jagged offsets do not match the length of the coordinates")
+
+        self.offsets = offsets
+        self.system = system
+        self._cache = {}
+
+    @classmethod
+    def _fromcolumns(cls, offsets, system, columns, cache):
+        out = cls.__new__(cls)
+        out.offsets = offsets
+        out.system = system
+        out._columns = columns
+        out._cache = cache
+        return out
+
+    def __repr__(self):
+        return "<LorentzVectorArray ({0}) of {1} {2}>".format(", ".join(self.system), len(self), "lists" if self.isjagged else "vectors")
+
+    @property
+    def isjagged(self):
+        return self.offsets is not None
+
+    @property
+    def counts(self):
+        if self.offsets is None:
+            raise TypeError("flat LorentzVectorArray has no counts")
+        return self.offsets[1:] - self.offsets[:-1]
+
+    def __len__(self):
+        if self.offsets is None:
+            return len(self._columns[self.system[0]])
+        else:
+            return len(self.offsets) - 1
+
+    def __getitem__(self, where):
+        if isinstance(where, (numbers.Integral, numpy.integer)):
+            if where < 0:
+                where += len(self)
+            if not 0 <= where < len(self):
+                raise IndexError("index out of range for LorentzVectorArray of length {0}".format(len(self)))
+            if self.offsets is None:
+                return dict((n, float(self._columns[n][where])) for n in self.system)
+            else:
+                return self._slice(self.offsets[where], self.offsets[where + 1], None)
+
+        elif isinstance(where, slice):
+            start, stop, step = where.indices(len(self))
+            if step != 1:
+                raise IndexError("LorentzVectorArray slices must have step 1")
+            stop = max(start, stop)
+            if self.offsets is None:
+                return self._slice(start, stop, None)
+            else:
+                offsets = self.offsets[start:stop + 1]
+                return self._slice(offsets[0], offsets[-1], offsets - offsets[0])
+
+        elif self.offsets is None:
+            where = numpy.asarray(where)
+            if where.dtype != numpy.bool_ and not issubclass(where.dtype.type, numpy.integer):
+                raise TypeError("LorentzVectorArray indexes must be integers, slices, or integer or boolean arrays")
+            columns = dict((n, x[where]) for n, x in self._columns.items())
+            cache = dict((n, x[where]) for n, x in self._cache.items())
+            return self._fromcolumns(None, self.system, columns, cache)
+
+        else:
+            raise TypeError("jagged LorentzVectorArray indexes must be integers or slices")
+
+    def _slice(self, start, stop, offsets):
+        # views of the stored and already-derived columns; nothing is recomputed
+        columns = dict((n, x[start:stop]) for n, x in self._columns.items())
+        cache = dict((n, x[start:stop]) for n, x in self._cache.items())
+        return self._fromcolumns(offsets, self.system, columns, cache)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _wrap(self, content):
+        if self.offsets is None:
+            return content
+        else:
+            return JaggedArray(self.offsets, content)
+
+    def _content(self, name):
+        out = self._columns.get(name)
+        if out is None:
+            out = self._cache.get(name)
+            if out is None:
+                out = self._cache[name] = getattr(self, "_calc_" + name)()
+        return out
+
+    def _other(self, other, name):
+        # content-level coordinate of another vector, broadcast to this array's content
+        if isinstance(other, LorentzVectorArray):
+            x = other._content(name)
+            if self.offsets is not None and other.offsets is None and len(other) == len(self):
+                x = numpy.repeat(x, self.counts)
+            elif self.offsets is not None and other.offsets is not None and not numpy.array_equal(self.counts, other.counts):
+                raise ValueError("LorentzVectorArrays have different jagged structure")
+            return x
+        else:
+            return LorentzVectorArray.fromrecord(other)._content(name)[0]
+
+    @classmethod
+    def fromrecord(cls, record):
+        def has(n):
+            return n in record if isinstance(record, dict) else hasattr(record, n)
+        def get(n):
+            return record[n] if isinstance(record, dict) else getattr(record, n)
+        for system in cls.systems:
+            if all(has(n) for n in system):
+                return cls(**dict((n, [get(n)]) for n in system))
+        else:
+            raise TypeError("value is not a Lorentz vector: {0}".format(record))
+
+    ################################################## content-level kinematics
+
+    @_errstate
+    def _calc_px(self):
+        return self._content("pt") * numpy.cos(self._content("phi"))
+
+    @_errstate
+    def _calc_py(self):
+        return self._content("pt") * numpy.sin(self._content("phi"))
+
+    @_errstate
+    def _calc_pz(self):
+        return self._content("pt") * numpy.sinh(self._content("eta"))
+
+    @_errstate
+    def _calc_energy(self):
+        mass = self._content("mass")
+        return numpy.sqrt(self._content("p2") + numpy.copysign(mass**2, mass))
+
+    @_errstate
+    def _calc_pt(self):
+        return numpy.hypot(self._content("px"), self._content("py"))
+
+    @_errstate
+    def _calc_eta(self):
+        return numpy.arcsinh(self._content("pz") / self._content("pt"))
+
+    @_errstate
+    def _calc_phi(self):
+        return numpy.arctan2(self._content("py"), self._content("px"))
+
+    @_errstate
+    def _calc_mass(self):
+        return numpy.sqrt(self._content("energy")**2 - self._content("p2"))
+
+    @_errstate
+    def _calc_p2(self):
+        if "px" in self._columns:
+            return self._content("px")**2 + self._content("py")**2 + self._content("pz")**2
+        else:
+            return (self._content("pt") * numpy.cosh(self._content("eta")))**2
+
+    @_errstate
+    def _calc_p(self):
+        return numpy.sqrt(self._content("p2"))
+
+    @_errstate
+    def _calc_Et(self):
+        return self._content("energy") * self._content("pt") / self._content("p")
+
+    @_errstate
+    def _calc_mt(self):
+        return _signedsqrt(self._content("energy")**2 - self._content("pz")**2)
+
+    @_errstate
+    def _calc_theta(self):
+        return numpy.arctan2(self._content("pt"), self._content("pz"))
+
+    @_errstate
+    def _calc_rapidity(self):
+        energy = self._content("energy")
+        pz = self._content("pz")
+        return numpy.log((energy + pz) / (energy - pz)) / 2.0
+
+    @_errstate
+    def _calc_beta(self):
+        return self._content("p") / self._content("energy")
+
+    @_errstate
+    def _calc_gamma(self):
+        beta = self._content("beta")
+        return numpy.where(numpy.absolute(beta) < 1, 1.0 / numpy.sqrt(1.0 - beta**2), numpy.inf)
+
+    ################################################## public interface
+
+    px       = property(lambda self: self._wrap(self._content("px")))
+    py       = property(lambda self: self._wrap(self._content("py")))
+    pz       = property(lambda self: self._wrap(self._content("pz")))
+    energy   = property(lambda self: self._wrap(self._content("energy")))
+    pt       = property(lambda self: self._wrap(self._content("pt")))
+    eta      = property(lambda self: self._wrap(self._content("eta")))
+    phi      = property(lambda self: self._wrap(self._content("phi")))
+    mass     = property(lambda self: self._wrap(self._content("mass")))
+    p        = property(lambda self: self._wrap(self._content("p")))
+    Et       = property(lambda self: self._wrap(self._content("Et")))
+    mt       = property(lambda self: self._wrap(self._content("mt")))
+    theta    = property(lambda self: self._wrap(self._content("theta")))
+    rapidity = property(lambda self: self._wrap(self._content("rapidity")))
+    beta     = property(lambda self: self._wrap(self._content("beta")))
+    gamma    = property(lambda self: self._wrap(self._content("gamma")))
+
+    @_errstate
+    def dot(self, other):
+        return self._wrap(self._content("energy")*self._other(other, "energy") - self._content("px")*self._other(other, "px") - self._content("py")*self._other(other, "py") - self._content("pz")*self._other(other, "pz"))
+
+    @_errstate
+    def delta_phi(self, other):
+        return self._wrap((self._content("phi") - self._other(other, "phi") + numpy.pi) % (2*numpy.pi) - numpy.pi)
+
+    @_errstate
+    def delta_r(self, other):
+        return self._wrap(delta_r(self._content("eta"), self._content("phi"), self._other(other, "eta"), self._other(other, "phi")))
+
+    def sum(self):
+        columns = dict((n, self._content(n)) for n in self.systems[0])
+        if self.offsets is None:
+            return dict((n, float(x.sum())) for n, x in columns.items())
+        else:
+            # one segmented reduction per coordinate; empty lists sum to zero
+            parents = numpy.repeat(numpy.arange(len(self), dtype=numpy.int64), self.counts)
+            columns = dict((n, numpy.bincount(parents, weights=x, minlength=len(self))) for n, x in columns.items())
+            return self._fromcolumns(None, self.systems[0], columns, {})
+
+    ################################################## matching
+
+    def _asjagged(self, other):
+        if not isinstance(other, LorentzVectorArray):
+            other = LorentzVectorArray.fromrecord(other)
+        if other.offsets is None and len(other) == len(self):
+            # one vector per event: a jagged array with exactly one item in each list
+            other = other._fromcolumns(numpy.arange(len(other) + 1, dtype=numpy.int64), other.system, other._columns, other._cache)
+        if other.offsets is None or len(other) != len(self):
+            raise ValueError("cannot match a jagged LorentzVectorArray of {0} lists with {1}".format(len(self), repr(other)))
+        return other
+
+    def _pairs(self, other):
+        # every (self item, other item) pair within each event, ordered row-major like a per-event matrix
+        n = self.counts
+        m = other.counts
+        pairoffsets = numpy.empty(len(self) + 1, dtype=numpy.int64)
+        pairoffsets[0] = 0
+        numpy.cumsum(n * m, out=pairoffsets[1:])
+        event = numpy.repeat(numpy.arange(len(self), dtype=numpy.int64), n * m)
+        local = numpy.arange(pairoffsets[-1], dtype=numpy.int64) - pairoffsets[:-1][event]
+        width = m[event]
+        i = self.offsets[:-1][event] + local // numpy.maximum(width, 1)
+        j = local % numpy.maximum(width, 1)
+        return pairoffsets, i, other.offsets[:-1][event] + j, j
+
+    def _nearest(self, other):
+        if self.offsets is None:
+            if not isinstance(other, LorentzVectorArray):
+                other = LorentzVectorArray.fromrecord(other)
+            table = self.delta_r_matrix(other)
+            if table.shape[1] == 0:
+                return numpy.full(len(self), -1, dtype=numpy.int64), numpy.full(len(self), numpy.inf)
+            else:
+                return numpy.argmin(table, axis=1), numpy.min(table, axis=1)
+
+        other = self._asjagged(other)
+        pairoffsets, i, j, jlocal = self._pairs(other)
+        dr = delta_r(self._content("eta")[i], self._content("phi")[i], other._content("eta")[j], other._content("phi")[j])
+        index = numpy.full(len(self._content("eta")), -1, dtype=numpy.int64)
+        mindr = numpy.full(len(self._content("eta")), numpy.inf)
+        if len(dr) > 0:
+            order = numpy.lexsort((dr, i))
+            first = numpy.ones(len(order), dtype=numpy.bool_)
+            first[1:] = i[order][1:] != i[order][:-1]
+            best = order[first]
+            index[i[best]] = jlocal[best]
+            mindr[i[best]] = dr[best]
+        return index, mindr
+
+    def delta_r_matrix(self, other):
+        if self.offsets is None:
+            if not isinstance(other, LorentzVectorArray):
+                other = LorentzVectorArray.fromrecord(other)
+            return delta_r_matrix(self._content("eta"), self._content("phi"), other._content("eta"), other._content("phi"))
+        else:
+            other = self._asjagged(other)
+            pairoffsets, i, j, jlocal = self._pairs(other)
+            return JaggedArray(pairoffsets, delta_r(self._content("eta")[i], self._content("phi")[i], other._content("eta")[j], other._content("phi")[j]))
+
+    def nearest(self, other):
+        index, mindr = self._nearest(other)
+        return self._wrap(index)
+
+    def isolated_from(self, other, dr):
+        index, mindr = self._nearest(other)
+        mask = mindr > dr
+        if self.offsets is None:
+            return self[mask]
+        else:
+            parents = numpy.repeat(numpy.arange(len(self), dtype=numpy.int64), self.counts)
+            offsets = numpy.empty(len(self) + 1, dtype=numpy.int64)
+            offsets[0] = 0
+            numpy.cumsum(numpy.bincount(parents[mask], minlength=len(self)), out=offsets[1:])
+            columns = dict((n, x[mask]) for n, x in self._columns.items())
+            cache = dict((n, x[mask]) for n, x in self._cache.items())
+            return self._fromcolumns(offsets, self.system, columns, cache)
+
+    ################################################## arithmetic
+
+    def __add__(self, other):
+        columns = dict((n, self._content(n) + self._other(other, n)) for n in ("px", "py", "pz", "energy"))
+        return self._fromcolumns(self.offsets, self.systems[0], columns, {})
+
+    __radd__ = __add__
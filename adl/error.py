@@ -12,7 +12,7 @@ class ADLSourceError(ADLError):
 
         elif lineno == lineno2:
             message = "Line {0}: {1}".format(lineno, message)
-            quoted = source.split("\n")[lineno - 1]
+            quoted = code.split("\n")[lineno - 1]
             arrow = "-" * (col_offset + 4) + "^" * (col_offset2 - col_offset)
             super(ADLSourceError, self).__init__(message + "\n    " + quoted + "\n" + arrow)
 
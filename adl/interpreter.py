@@ -1,17 +1,31 @@
 #!/usr/bin/env python
 
-import copy
+import array
 import fnmatch
 import math
 import numbers
-
-import numpy
-
+import operator
+import pickle
+import struct
+import sys
+import threading
+import zlib
+
+# NumPy, adl.columnar, adl.reader, and the parser (with PLY) are imported where they are first needed,
+# so that a process that only runs cached documents on Python data does not pay for them
+import adl.cache
 import adl.error
-import adl.parser
 import adl.util
+import adl.version
 from adl.syntaxtree import *
 
+def numpymodule():
+    # NumPy is imported by the first caller that needs it; after that, this is one lookup in sys.modules
+    module = sys.modules.get("numpy")
+    if module is None:
+        import numpy as module
+    return module
+
 ###################################################### interpretation of the AST
 
 class SymbolTable(object):
@@ -175,7 +189,7 @@ def handle(statement, source, symboltable, aggregation):
     elif isinstance(statement, Region):
         for namepredicate in statement.namepredicates:
             accept = calculate(namepredicate.predicate, symboltable)
-            if not isinstance(accept, (bool, numpy.bool_, numpy.bool)):
+            if not adl.util.isbool(accept):
                 raise adl.error.ADLTypeError("predicate returned a non-boolean: {0}".format(accept), namepredicate.predicate)
 
             if accept:
@@ -260,9 +274,144 @@ def initialize(statement, name, aggregation):
     else:
         raise adl.error.ADLInternalError("cannot initialize {0}; it is not a statement".format(type(statement).__name__), statement)
 
+###################################################### revising a document
+
+def bindings(statement):
+    # names that a top-level statement defines for the statements after it
+    if isinstance(statement, Define):
+        return [statement.target.name]
+    elif isinstance(statement, FunctionDefine):
+        return [statement.target.function.name]
+    elif isinstance(statement, Source):
+        return [n for x in statement.block for n in bindings(x)]
+    else:
+        return []
+
+def definitions(suite):
+    out = {}
+    for x in suite.block:
+        for n in bindings(x):
+            out.setdefault(n, []).append(repr(x))
+    return out
+
+def visibility(suite):
+    # for each top-level statement, the definition (by repr) that each name is bound to when it runs
+    out = []
+    current = {}
+    for x in suite.block:
+        out.append(current)
+        names = bindings(x)
+        if len(names) > 0:
+            current = dict(current)
+            for n in names:
+                current[n] = repr(x)
+    return out
+
+def storagenodes(statement):
+    # nodes whose names are the entries that initialize makes for a top-level statement
+    if isinstance(statement, Collect):
+        return [statement]
+    elif isinstance(statement, Region):
+        return statement.namepredicates
+    elif isinstance(statement, Vary):
+        return statement.variations
+    elif isinstance(statement, (Source, For)):
+        return [y for x in statement.block for y in storagenodes(x)]
+    else:
+        return []
+
+def relink(statement, aggregation):
+    # point the storages that initialize made for a structurally identical statement at this statement's nodes
+    if isinstance(statement, (Source, For)):
+        for x in statement.block:
+            relink(x, aggregation)
+
+    elif isinstance(statement, Region):
+        for namepredicate in statement.namepredicates:
+            for storage in relinkaxes(aggregation[namepredicate.name.value], statement.axes):
+                for x in statement.block:
+                    relink(x, storage)
+
+    elif isinstance(statement, Vary):
+        for variation in statement.variations:
+            for x in statement.block:
+                relink(x, aggregation[variation.name.value])
+
+    elif isinstance(statement, Collect):
+        for storage in relinkaxes(aggregation[statement.name.value], statement.axes):
+            if hasattr(storage, "expression"):
+                storage.expression = statement.expression
+
+def relinkaxes(storage, axes):
+    # sets the binned expression of each level of binning and returns the storages in the innermost bins
+    storages = [storage]
+    for axis in axes:
+        inner = []
+        for x in storages:
+            x.expression = axis.expression
+            if x.contents is None:
+                inner.append(x.storage)
+            else:
+                inner.extend(x.contents)
+        storages = inner
+    return storages
+
+def statementstart(statement):
+    # a statement's own position is at its keyword or operator, which may come after its leftmost token
+    return min(statement.lexspan[0], statement.leftmost().lexspan[0])
+
+def statementend(code, block, i):
+    # end of the last line that a statement touches, which is the next statement's line if they share it
+    if i + 1 == len(block):
+        return len(code)
+    start = statementstart(block[i + 1])
+    lo = code.rfind("\n", 0, start) + 1
+    if code[lo:start].strip() == "":
+        return lo
+    hi = code.find("\n", start)
+    return len(code) if hi < 0 else hi
+
+def samelines(oldcode, oldblock, i, newcode, newblock, j):
+    # a statement can keep its syntax tree (positions and all) if it starts at the same place, on the same line,
+    # and every line that it touches is unchanged
+    start = statementstart(newblock[j])
+    if statementstart(oldblock[i]) != start or oldblock[i].positions.linecol(start)[0] != newblock[j].positions.linecol(start)[0]:
+        return False
+    lo = newcode.rfind("\n", 0, start) + 1
+    return oldcode[lo:statementend(oldcode, oldblock, i)] == newcode[lo:statementend(newcode, newblock, j)]
+
 ###################################################### statistical aggregation
 
-class Namespace(object):
+class Mergeable(object):
+    def checkmerge(self, other):
+        if type(self) is not type(other):
+            raise ValueError("cannot merge {0} with {1}".format(repr(self), repr(other)))
+        if self.name != other.name:
+            raise ValueError("cannot merge {0} with {1}: different names".format(repr(self), repr(other)))
+        if repr(getattr(self, "expression", None)) != repr(getattr(other, "expression", None)):
+            raise ValueError("cannot merge {0} with {1}: different expressions".format(repr(self), repr(other)))
+
+    def __iadd__(self, other):
+        # the whole tree is checked before anything is added, so a mismatch anywhere leaves self unchanged
+        self.checkmerge(other)
+        self.accumulate(other)
+        return self
+
+    def __add__(self, other):
+        self.checkmerge(other)
+        out = self.zeros_like(self.name)
+        out += self
+        out += other
+        return out
+
+    def merge(self, other, inplace=False):
+        if inplace:
+            self += other
+            return self
+        else:
+            return self + other
+
+class Namespace(Mergeable):
     def __init__(self, name):
         self.name = name
         self.values = {}
@@ -275,6 +424,17 @@ class Namespace(object):
         out.values.update({n: x.zeros_like(name + (n,)) for n, x in self.values.items()})
         return out
 
+    def checkmerge(self, other):
+        super(Namespace, self).checkmerge(other)
+        if set(self.values) != set(other.values):
+            raise ValueError("cannot merge {0} with {1}: different contents {2} and {3}".format(repr(self), repr(other), sorted(self.values), sorted(other.values)))
+        for n, x in self.values.items():
+            x.checkmerge(other.values[n])
+
+    def accumulate(self, other):
+        for n, x in other.values.items():
+            self.values[n].accumulate(x)
+
     def __getitem__(self, where):
         if where == ():
             return self
@@ -289,7 +449,44 @@ class Namespace(object):
     def __contains__(self, where):
         return where in self.values
 
-class Storage(object):
+class Storage(Mergeable):
+    fields = ()
+
+    def accumulate(self, other):
+        for n in self.fields:
+            setattr(self, n, getattr(self, n) + getattr(other, n))
+
+    @classmethod
+    def bound(cls):
+        # subclass whose fields live in an external array (a binning's bins) instead of the instance
+        if "boundclass" not in cls.__dict__:
+            def accessor(i):
+                def get(self):
+                    return self.array[self.offset + i]
+                def set(self, value):
+                    self.array[self.offset + i] = value
+                return property(get, set)
+            members = dict((n, accessor(i)) for i, n in enumerate(cls.fields))
+            members["__reduce__"] = lambda self: self.detached().__reduce__()
+            cls.boundclass = type("Bound" + cls.__name__, (cls,), members)
+        return cls.__dict__["boundclass"]
+
+    def view(self, array, offset, name):
+        # a storage like this one (same expression) whose fields are array[offset:offset + len(fields)]
+        out = object.__new__(self.bound())
+        out.__dict__.update((n, x) for n, x in self.__dict__.items() if n not in self.fields)
+        out.name = name
+        out.array = array
+        out.offset = offset
+        return out
+
+    def detached(self):
+        # a copy that owns its fields, for pickling a view without its whole array
+        out = self.zeros_like(self.name)
+        for n in self.fields:
+            setattr(out, n, getattr(self, n))
+        return out
+
     def __getitem__(self, where):
         if where == ():
             return self
@@ -306,6 +503,8 @@ class Storage(object):
         return float(self.value())
 
 class Count(Storage):
+    fields = ("sumw", "sumw2")
+
     def __init__(self, name):
         self.name = name
         self.sumw = 0
@@ -321,6 +520,10 @@ class Count(Storage):
         self.sumw += weight
         self.sumw2 += weight**2
 
+    def fillarray(self, array, offset, symboltable, weight):
+        array[offset] += weight
+        array[offset + 1] += weight**2
+
     def value(self, indeterminate=0.0):
         return self.sumw
 
@@ -340,6 +543,8 @@ class Count(Storage):
         yield self.error()
 
 class Sum(Storage):
+    fields = ("sumwx",)
+
     def __init__(self, name, expression):
         self.name = name
         self.expression = expression
@@ -354,6 +559,9 @@ class Sum(Storage):
     def fill(self, symboltable, weight):
         self.sumwx += weight * self.calculate(symboltable)
 
+    def fillarray(self, array, offset, symboltable, weight):
+        array[offset] += weight * self.calculate(symboltable)
+
     def value(self, indeterminate=0.0):
         return self.sumwx
 
@@ -361,6 +569,8 @@ class Sum(Storage):
         yield self.value()
 
 class Profile(Storage):
+    fields = ("sumw", "sumw2", "sumwx", "sumwx2")
+
     def __init__(self, name, expression):
         self.name = name
         self.expression = expression
@@ -382,6 +592,13 @@ class Profile(Storage):
         self.sumwx += weight * x
         self.sumwx2 += weight * x**2
 
+    def fillarray(self, array, offset, symboltable, weight):
+        x = self.calculate(symboltable)
+        array[offset] += weight
+        array[offset + 1] += weight**2
+        array[offset + 2] += weight * x
+        array[offset + 3] += weight * x**2
+
     def value(self, indeterminate=0.0):
         if self.sumw == 0:
             return indeterminate
@@ -406,6 +623,8 @@ class Profile(Storage):
         yield self.error()
 
 class Fraction(Storage):
+    fields = ("numerw", "denomw")
+
     def __init__(self, name, expression):
         self.name = name
         self.expression = expression
@@ -420,12 +639,20 @@ class Fraction(Storage):
 
     def fill(self, symboltable, weight):
         x = calculate(self.expression, symboltable)
-        if not isinstance(x, (bool, numpy.bool_, numpy.bool)):
+        if not adl.util.isbool(x):
             raise adl.error.ADLTypeError("predicate returned a non-boolean: {0}".format(x), self.expression)
         if x:
             self.numerw += weight
         self.denomw += weight
 
+    def fillarray(self, array, offset, symboltable, weight):
+        x = calculate(self.expression, symboltable)
+        if not adl.util.isbool(x):
+            raise adl.error.ADLTypeError("predicate returned a non-boolean: {0}".format(x), self.expression)
+        if x:
+            array[offset] += weight
+        array[offset + 1] += weight
+
     def value(self, indeterminate=0.0):
         if self.denomw == 0:
             return indeterminate
@@ -466,7 +693,7 @@ class Fraction(Storage):
     def error(self, method="normal", sigmas=1, indeterminate=0.0):
         return math.sqrt(self.error2(method=method, sigmas=sigmas, indeterminate=indeterminate))
 
-class Binning(object):
+class Binning(Mergeable):
     @staticmethod
     def binning(name, call, expression, storage):
         if isinstance(call, Call) and call.function.name == "regular":
@@ -489,11 +716,110 @@ class Binning(object):
         else:
             raise ADLTypeError("not a binning", call)
 
+    # bins are numbered 0 to numbins - 1, then underflow, overflow, and nanflow; bins of a storage (Count, Sum,
+    # Profile, or Fraction) are views of one flat array of floats, allocated when first needed, and bins of
+    # anything else (a Namespace or another Binning) are objects in a list
+    flows = ("underflow", "overflow", "nanflow")
+
+    # lock stripes, set while several processes fill the same shared array (see Run.run_parallel)
+    locks = None
+
+    def setup(self, storage):
+        if isinstance(storage, Storage):
+            self.storage = storage.zeros_like(self.name)
+            self.array = None
+            self.contents = None
+        else:
+            self.storage = None
+            self.array = None
+            self.contents = [storage.zeros_like(self.binname(i)) for i in range(self.numbins + 3)]
+
     def __repr__(self):
         return "<{0} {1} at 0x{2:012x}>".format(type(self).__name__, ", ".join(repr(x) for x in self.name), id(self))
 
+    def binname(self, i):
+        return self.name + ((i,) if i < self.numbins else (self.flows[i - self.numbins],))
+
+    @property
+    def template(self):
+        # what zeros_like copies for each bin
+        return self.storage if self.contents is None else self.contents[-1]
+
+    @property
+    def size(self):
+        # number of floats in the array of a binning of storages
+        return (self.numbins + 3) * len(self.storage.fields)
+
+    def buffer(self):
+        if self.array is None:
+            self.array = array.array("d", [0.0]) * self.size
+        return self.array
+
+    def bin(self, i):
+        if self.contents is None:
+            return self.storage.view(self.buffer(), i * len(self.storage.fields), self.binname(i))
+        else:
+            return self.contents[i]
+
+    @property
+    def values(self):
+        return [self.bin(i) for i in range(self.numbins)]
+
+    @property
+    def underflow(self):
+        return self.bin(self.numbins)
+
+    @property
+    def overflow(self):
+        return self.bin(self.numbins + 1)
+
+    @property
+    def nanflow(self):
+        return self.bin(self.numbins + 2)
+
+    def which(self, symboltable):
+        return self.bin(self.index(symboltable))
+
     def fill(self, symboltable, weight):
-        self.which(symboltable).fill(symboltable, weight)
+        # storages fill their fields in the array directly, without a view per event
+        i = self.index(symboltable)
+        if self.contents is not None:
+            self.contents[i].fill(symboltable, weight)
+        elif self.locks is None:
+            self.storage.fillarray(self.buffer(), i * len(self.storage.fields), symboltable, weight)
+        else:
+            with self.locks[i % len(self.locks)]:
+                self.storage.fillarray(self.buffer(), i * len(self.storage.fields), symboltable, weight)
+
+    def __getstate__(self):
+        # locks belong to one parallel fill and cannot be pickled
+        out = dict(self.__dict__)
+        out.pop("locks", None)
+        return out
+
+    def checkmerge(self, other):
+        super(Binning, self).checkmerge(other)
+        if self.numbins != other.numbins or (self.contents is None) != (other.contents is None):
+            raise ValueError("cannot merge {0} with {1}: different binning".format(repr(self), repr(other)))
+        if self.contents is None:
+            self.storage.checkmerge(other.storage)
+        else:
+            for x, y in zip(self.contents, other.contents):
+                x.checkmerge(y)
+
+    def accumulate(self, other):
+        if self.contents is None:
+            if other.array is not None:
+                self.accumulatearray(other.array)
+        else:
+            for x, y in zip(self.contents, other.contents):
+                x.accumulate(y)
+
+    def accumulatearray(self, other):
+        # other is any buffer of self.size floats, such as another binning's array or a region of shared memory
+        numpy = numpymodule()
+        out = numpy.frombuffer(self.buffer(), dtype=numpy.float64)
+        out += numpy.frombuffer(other, dtype=numpy.float64, count=self.size)
 
 class RegularBinning(Binning):
     def __init__(self, name, expression, numbins, low, high, storage):
@@ -502,16 +828,19 @@ class RegularBinning(Binning):
         self.numbins = int(numbins)
         self.low = float(low)
         self.high = float(high)
-        self.values = [storage.zeros_like(self.name + (i,)) for i, x in enumerate(range(self.numbins))]
-        self.underflow = storage.zeros_like(self.name + ("underflow",))
-        self.overflow = storage.zeros_like(self.name + ("overflow",))
-        self.nanflow = storage.zeros_like(self.name + ("nanflow",))
+        self.setup(storage)
 
     def zeros_like(self, name):
-        return RegularBinning(name, self.expression, self.numbins, self.low, self.high, self.nanflow)
+        return RegularBinning(name, self.expression, self.numbins, self.low, self.high, self.template)
+
+    def checkmerge(self, other):
+        super(RegularBinning, self).checkmerge(other)
+        if (self.numbins, self.low, self.high) != (other.numbins, other.low, other.high):
+            raise ValueError("cannot merge {0} with {1}: different binning".format(repr(self), repr(other)))
 
     @property
     def edges(self):
+        numpy = numpymodule()
         return numpy.linspace(self.low, self.high, self.numbins + 1).tolist()
 
     def __getitem__(self, where):
@@ -522,7 +851,7 @@ class RegularBinning(Binning):
         head, tail = where[0], where[1:]
 
         if adl.util.isint(head, 0, self.numbins - 1):
-            return self.values[head][tail]
+            return self.bin(head)[tail]
         elif head == -adl.util.inf or adl.util.isint(head, None, -1):
             return self.underflow[tail]
         elif head == adl.util.inf or adl.util.isint(head, self.numbins, None):
@@ -538,20 +867,20 @@ class RegularBinning(Binning):
         else:
             raise IndexError("improper index for {0}: {1}".format(type(self).__name__, repr(head)))
 
-    def which(self, symboltable):
+    def index(self, symboltable):
         x = calculate(self.expression, symboltable)
         if not adl.util.isnum(x):
             raise adl.error.ADLTypeError("expression returned a non-number: {0}".format(x), self.expression)
 
         index = self.numbins * (x - self.low) / (self.high - self.low)
         if index < 0:
-            return self.underflow
+            return self.numbins
         elif index >= self.numbins:
-            return self.overflow
+            return self.numbins + 1
         elif adl.util.isnan(index):
-            return self.nanflow
+            return self.numbins + 2
         else:
-            return self.values[int(math.trunc(index))]
+            return int(math.trunc(index))
 
     def plot(self):
         import matplotlib.pyplot
@@ -559,7 +888,7 @@ class RegularBinning(Binning):
         if isinstance(self.nanflow, Count):
             binwidth = (self.high - self.low) / self.numbins
             centers = [self.low + (i + 0.5)*binwidth for i in range(self.numbins)]
-            heights = [float(self.values[i]) for i in range(self.numbins)]
+            heights = [float(self.bin(i)) for i in range(self.numbins)]
             fig, ax = matplotlib.pyplot.subplots()
             ax.bar(centers, heights, width=binwidth)
             ax.set_title(", ".join(repr(x) for x in self.name))
@@ -573,13 +902,15 @@ class VariableBinning(Binning):
         self.name = name
         self.expression = expression
         self.edges = [float(x) for x in edges]
-        self.values = [storage.zeros_like(self.name + (i,)) for i, x in enumerate(range(self.numbins))]
-        self.underflow = storage.zeros_like(self.name + ("underflow",))
-        self.overflow = storage.zeros_like(self.name + ("overflow",))
-        self.nanflow = storage.zeros_like(self.name + ("nanflow",))
+        self.setup(storage)
 
     def zeros_like(self, name):
-        return VariableBinning(name, self.expression, self.edges, self.nanflow)
+        return VariableBinning(name, self.expression, self.edges, self.template)
+
+    def checkmerge(self, other):
+        super(VariableBinning, self).checkmerge(other)
+        if self.edges != other.edges:
+            raise ValueError("cannot merge {0} with {1}: different binning".format(repr(self), repr(other)))
 
     @property
     def numbins(self):
@@ -593,7 +924,7 @@ class VariableBinning(Binning):
         head, tail = where[0], where[1:]
 
         if adl.util.isint(head, 0, self.numbins - 1):
-            return self.values[head][tail]
+            return self.bin(head)[tail]
         elif head == -adl.util.inf or adl.util.isint(head, None, -1):
             return self.underflow[tail]
         elif head == adl.util.inf or adl.util.isint(head, self.numbins, None):
@@ -609,21 +940,21 @@ class VariableBinning(Binning):
         else:
             raise IndexError("improper index for {0}: {1}".format(type(self).__name__, repr(head)))
 
-    def which(self, symboltable):
+    def index(self, symboltable):
         x = calculate(self.expression, symboltable)
         if not adl.util.isnum(x):
             raise adl.error.ADLTypeError("expression returned a non-number: {0}".format(x), self.expression)
 
         if x < self.edges[0]:
-            return self.underflow
+            return self.numbins
         elif x >= self.edges[-1]:
-            return self.overflow
+            return self.numbins + 1
         elif adl.util.isnan(x):
-            return self.nanflow
+            return self.numbins + 2
         else:
             for i in range(self.numbins):
                 if self.edges[i] <= x < self.edges[i + 1]:
-                    return self.values[i]
+                    return i
 
     def plot(self):
         import matplotlib.pyplot
@@ -631,7 +962,7 @@ class VariableBinning(Binning):
         if isinstance(self.nanflow, Count):
             centers = [0.5*(self.edges[i + 1] + self.edges[i]) for i in range(self.numbins)]
             binwidths = [self.edges[i + 1] - self.edges[i] for i in range(self.numbins)]
-            heights = [float(self.values[i]) for i in range(self.numbins)]
+            heights = [float(self.bin(i)) for i in range(self.numbins)]
             fig, ax = matplotlib.pyplot.subplots()
             ax.bar(centers, heights, width=binwidths)
             ax.set_title(", ".join(repr(x) for x in self.name))
@@ -640,6 +971,209 @@ class VariableBinning(Binning):
         else:
             raise NotImplementedError
 
+def arraybinnings(aggregation):
+    # binnings whose bins are arrays, in an order that depends only on the document
+    if isinstance(aggregation, Namespace):
+        for n in sorted(aggregation.values):
+            for x in arraybinnings(aggregation.values[n]):
+                yield x
+    elif isinstance(aggregation, Binning):
+        if aggregation.contents is None:
+            yield aggregation
+        else:
+            for value in aggregation.contents:
+                for x in arraybinnings(value):
+                    yield x
+
+###################################################### static analysis of inputs
+
+# attributes that are computed on a list or vector, rather than read from the input
+listmethods = ("size", "map", "filter", "flatten", "cross", "pairs", "distincts", "min", "max", "sum", "delta_r_matrix", "nearest", "isolated_from", "minby", "maxby")
+
+# list methods that call a function on each element
+elementmethods = ("map", "filter", "minby", "maxby")
+
+class InputReferences(object):
+    def __init__(self, builtins):
+        self.builtins = builtins
+        self.names = set()
+        self.paths = set()
+
+    def path(self, expression, scope):
+        # the input path that an expression refers to (following aliases), or None if it is computed
+        if isinstance(expression, Identifier):
+            if expression.name in scope:
+                return scope[expression.name]
+            elif expression.name in self.builtins:
+                return None
+            else:
+                self.names.add(expression.name)
+                return (expression.name,)
+
+        elif isinstance(expression, Call) and isinstance(expression.function, Attribute) and isinstance(expression.arguments[1], Literal):
+            out = self.path(expression.arguments[0], scope)
+            if out is not None and expression.arguments[1].value in listmethods:
+                self.paths.add(out)
+                return None
+            elif out is not None:
+                return out + (expression.arguments[1].value,)
+            else:
+                return None
+
+        elif isinstance(expression, Call) and isinstance(expression.function, Call) and isinstance(expression.function.function, Attribute) and isinstance(expression.function.arguments[1], Literal) and expression.function.arguments[1].value in elementmethods and len(expression.arguments) == 1:
+            # a lambda's parameter is an element of the list, and filter, minby, and maxby return elements of it
+            out = self.path(expression.function.arguments[0], scope)
+            inline = expression.arguments[0]
+            if isinstance(inline, Inline) and len(inline.parameters) == 1:
+                subscope = dict(scope)
+                subscope[inline.parameters[0].name] = out
+                self.statements(inline.body[:-1], subscope)
+                self.expression(inline.body[-1], subscope)
+            else:
+                if out is not None:
+                    self.paths.add(out)
+                self.expression(inline, scope)
+            if expression.function.arguments[1].value == "map":
+                return None
+            else:
+                return out
+
+        elif isinstance(expression, Call) and isinstance(expression.function, Subscript):
+            # an element of a column has the same fields as the column
+            for x in expression.arguments[1:]:
+                self.expression(x, scope)
+            return self.path(expression.arguments[0], scope)
+
+        else:
+            self.expression(expression, scope)
+            return None
+
+    def expression(self, expression, scope):
+        if isinstance(expression, (Identifier, Call)) and (isinstance(expression, Identifier) or isinstance(expression.function, (Attribute, Subscript))):
+            out = self.path(expression, scope)
+            if out is not None:
+                self.paths.add(out)
+
+        elif isinstance(expression, Call):
+            if isinstance(expression.function, Expression):
+                self.expression(expression.function, scope)
+            for x in expression.arguments:
+                self.expression(x, scope)
+
+        elif isinstance(expression, Inline):
+            subscope = dict(scope)
+            for x in expression.parameters:
+                subscope[x.name] = None
+            self.statements(expression.body[:-1], subscope)
+            self.expression(expression.body[-1], subscope)
+
+    def bind(self, target, expression, scope, subscope):
+        # the expression is evaluated in scope and its target is bound in subscope; pure references become aliases
+        subscope[target.name] = self.path(expression, scope)
+
+    def axes(self, axes, scope):
+        # binnings are literal, so only the binned expression reads anything
+        for axis in axes:
+            self.expression(axis.expression, scope)
+
+    def statements(self, statements, scope):
+        for statement in statements:
+            if isinstance(statement, Define):
+                self.bind(statement.target, statement.expression, scope, scope)
+
+            elif isinstance(statement, FunctionDefine):
+                scope[statement.target.function.name] = None
+                subscope = dict(scope)
+                for x in statement.target.arguments:
+                    subscope[x.name] = None
+                self.statements(statement.body[:-1], subscope)
+                self.expression(statement.body[-1], subscope)
+
+            elif isinstance(statement, Collect):
+                if statement.expression is not None:
+                    self.expression(statement.expression, scope)
+                self.axes(statement.axes, scope)
+                if statement.weight is not None:
+                    self.expression(statement.weight, scope)
+
+            elif isinstance(statement, For):
+                subscope = dict(scope)
+                for loopvar in statement.loopvars:
+                    self.bind(loopvar.target, loopvar.expression, scope, subscope)
+                self.statements(statement.block, subscope)
+
+            elif isinstance(statement, Vary):
+                for variation in statement.variations:
+                    subscope = dict(scope)
+                    for x in variation.assignments:
+                        self.bind(x.target, x.expression, scope, subscope)
+                    self.statements(statement.block, subscope)
+
+            elif isinstance(statement, Region):
+                for namepredicate in statement.namepredicates:
+                    self.expression(namepredicate.predicate, scope)
+                self.axes(statement.axes, scope)
+                self.statements(statement.block, dict(scope))
+
+            elif isinstance(statement, Source):
+                self.statements(statement.block, scope)
+
+            else:
+                self.expression(statement, scope)
+
+        return self
+
+def inputreferences(suite, builtins):
+    return InputReferences(builtins).statements(suite.block, {})
+
+class Selection(object):
+    # events that pass none of the top-level region predicates cannot change the aggregation
+    @classmethod
+    def plan(cls, suite, builtins):
+        if not all(isinstance(x, (Define, FunctionDefine, Region)) for x in suite.block) or not any(isinstance(x, Region) for x in suite.block):
+            return None
+
+        # a backward pass in document order, so that each predicate sees only the definitions before it
+        # (a name redefined after a region does not change what that region's predicate reads)
+        steps = []
+        needed = set()
+        for x in suite.block[::-1]:
+            if isinstance(x, Region):
+                for y in x.namepredicates[::-1]:
+                    needed.update(InputReferences(builtins).statements([y.predicate], {}).names)
+                    steps.insert(0, y.predicate)
+            elif isinstance(x, Define) and x.target.name in needed:
+                needed.discard(x.target.name)
+                needed.update(InputReferences(builtins).statements([x.expression], {}).names)
+                steps.insert(0, x)
+            elif isinstance(x, FunctionDefine) and x.target.function.name in needed:
+                needed.discard(x.target.function.name)
+                needed.update(InputReferences(builtins).statements([x], {}).names)
+                steps.insert(0, x)
+
+        return cls(steps, inputreferences(Suite(steps), builtins).names)
+
+    def __init__(self, steps, columns):
+        # the kept definitions and the predicates, interleaved in document order
+        self.steps = steps
+        self.columns = columns
+
+    def __repr__(self):
+        return "<Selection on {0}>".format(", ".join(sorted(self.columns)))
+
+    def accept(self, builtins, data):
+        symboltable = SymbolTable.root(builtins, data)
+        for step in self.steps:
+            if isinstance(step, Statement):
+                handle(step, None, symboltable, None)
+            else:
+                accept = calculate(step, symboltable)
+                if not adl.util.isbool(accept):
+                    raise adl.error.ADLTypeError("predicate returned a non-boolean: {0}".format(accept), step)
+                if accept:
+                    return True
+        return False
+
 ###################################################### executable ADL document
 
 class Run(object):
@@ -664,17 +1198,116 @@ class Run(object):
                UnaryMinus: [],
                Power:      []}
 
-    def __init__(self, code):
-        if isinstance(code, str):
-            self.ast = adl.parser.parse(code)
-        else:
-            self.ast = adl.parser.parse(code.read())
+    def __init__(self, code, schema=None):
+        if not isinstance(code, str):
+            code = code.read()
+        self.code = code
+        self.ast = adl.cache.parse(code)
+        self.schema = schema
         self.clear()
 
     def clear(self):
         self.aggregation = Namespace(())
         initialize(self.ast, (), self.aggregation)
 
+    def revise(self, code):
+        # replace the document with an edited version, keeping what the edit did not touch: a top-level statement
+        # that is structurally identical and depends on no changed definition keeps its storages and their contents
+        # (and, if it has not moved, its syntax tree); everything else starts empty
+        if not isinstance(code, str):
+            code = code.read()
+        ast = adl.cache.parse(code)
+
+        previous = {}
+        for i, x in enumerate(self.ast.block):
+            previous.setdefault(repr(x), []).append(i)
+        olddefinitions = definitions(self.ast)
+        newdefinitions = definitions(ast)
+        dirty = set(n for n in set(olddefinitions).union(newdefinitions) if olddefinitions.get(n) != newdefinitions.get(n))
+        oldvisible = visibility(self.ast)
+        newvisible = visibility(ast)
+
+        block = []
+        moved = []
+        aggregation = Namespace(())
+        for i, x in enumerate(ast.block):
+            same = previous.get(repr(x))
+            # every name the statement reads, builtins included, since a new definition may shadow one;
+            # each must be unchanged and bound to the same definition, which a reordering can change
+            names = InputReferences({}).statements([x], {}).names
+            if same and len(names.intersection(dirty)) == 0:
+                j = next((j for j in same if all(oldvisible[j].get(n) == newvisible[i].get(n) for n in names)), None)
+            else:
+                j = None
+            if j is not None:
+                same.remove(j)
+                old = self.ast.block[j]
+            else:
+                old = None
+                dirty.update(bindings(x))
+
+            if old is None:
+                initialize(x, (), aggregation)
+                block.append(x)
+            else:
+                for node in storagenodes(old):
+                    adl.util.check_name(node, aggregation)
+                    aggregation[node.name.value] = self.aggregation[node.name.value]
+                if self.code is not None and samelines(self.code, self.ast.block, j, code, ast.block, i):
+                    block.append(old)
+                else:
+                    moved.append(x)
+                    block.append(x)
+
+        # same statements in new places: their storages evaluate the new nodes, so that errors point to the right lines
+        for x in moved:
+            relink(x, aggregation)
+
+        self.code = code
+        self.ast = Suite(block)
+        self.aggregation = aggregation
+        return self
+
+    def __getstate__(self):
+        # the compiled form: syntax tree, schema, and aggregation (no per-event closures or caches)
+        return {"code": self.code, "ast": self.ast, "schema": self.schema, "aggregation": self.aggregation}
+
+    def __setstate__(self, state):
+        self.code = state.get("code")
+        self.ast = state["ast"]
+        self.schema = state["schema"]
+        self.aggregation = state["aggregation"]
+
+    # binary form of the compiled state: magic, format version, adl version, then a compressed pickle;
+    # loading it needs only adl.syntaxtree and this module, not the parser
+    magic = b"ADLRUN"
+    blobversion = 2
+
+    def to_bytes(self):
+        version = adl.version.__version__.encode("utf-8")
+        header = self.magic + struct.pack("<HH", self.blobversion, len(version)) + version
+        return header + zlib.compress(pickle.dumps(self.__getstate__(), pickle.HIGHEST_PROTOCOL))
+
+    # the body is unpickled, which can run arbitrary code: only load blobs from a trusted source,
+    # such as this process's own to_bytes or a worker it started
+    @classmethod
+    def from_bytes(cls, blob):
+        blob = bytes(blob)
+        start = len(cls.magic) + 4
+        if len(blob) < start or blob[:len(cls.magic)] != cls.magic:
+            raise ValueError("not a serialized ADL Run")
+        blobversion, size = struct.unpack("<HH", blob[len(cls.magic):start])
+        if blobversion != cls.blobversion:
+            raise ValueError("serialized ADL Run has format version {0}, but this adl reads version {1}".format(blobversion, cls.blobversion))
+        if len(blob) < start + size:
+            raise ValueError("serialized ADL Run is truncated")
+        version = blob[start:start + size].decode("utf-8")
+        if version != adl.version.__version__:
+            raise ValueError("serialized ADL Run was written by adl {0}, but this is adl {1}".format(version, adl.version.__version__))
+        out = cls.__new__(cls)
+        out.__setstate__(pickle.loads(zlib.decompress(blob[start + size:])))
+        return out
+
     def __iter__(self, source=None, **data):
         functions = {n: x for n, x in data.items() if callable(x)}
         justdata = {n: x for n, x in data.items() if not callable(x)}
@@ -698,6 +1331,7 @@ class Run(object):
                     yield self.single(source=source, **onedata)
 
     def __call__(self, source=None, **data):
+        # every top-level symbol, as a list per event (or as values, if the data are a single event)
         functions = {n: x for n, x in data.items() if callable(x)}
         justdata = {n: x for n, x in data.items() if not callable(x)}
 
@@ -727,16 +1361,322 @@ class Run(object):
                             out[n].append(x)
                 return out
 
+    def keep(self, names, data, source=None):
+        # like calling the Run, but data is a mapping (so a column may have any name) and only the named
+        # symbols are returned, as NumPy arrays allocated once per call; names=None or () fills the
+        # aggregation and returns {}; a single event gives arrays of length 1
+        if names is not None:
+            names = (names,) if isinstance(names, str) else tuple(names)
+        functions = {n: x for n, x in data.items() if callable(x)}
+        justdata = {n: x for n, x in data.items() if not callable(x)}
+
+        if len(justdata) == 0:
+            return {}
+
+        try:
+            assert all(not isinstance(x, dict) for x in justdata.values())
+            lengths = [len(x) for x in justdata.values()]
+            assert all(x == lengths[0] for x in lengths)
+        except (TypeError, AssertionError):
+            numevents = 1
+            events = [dict(justdata)]
+        else:
+            numevents = lengths[0]
+            events = ({n: x[i] for n, x in justdata.items()} for i in range(numevents))
+
+        out = {n: None for n in names or ()}
+        for i, onedata in enumerate(events):
+            onedata.update(functions)
+            single = self.single(source=source, **onedata)
+            for n in out:
+                out[n] = keptstore(out[n], numevents, i, keptsymbol(single, n))
+        return out
+
+    @property
+    def selection(self):
+        return Selection.plan(self.ast, self.builtins)
+
+    def select(self, chunk, selection=None):
+        # indexes of the events in a chunk that can contribute, reading only the selection's columns
+        numpy = numpymodule()
+        if selection is None:
+            selection = self.selection
+        functions = {n: x for n, x in chunk.items() if callable(x)}
+        justdata = {n: x for n, x in chunk.items() if not callable(x)}
+        length = chunklength(justdata)
+        if selection is None:
+            return numpy.arange(length, dtype=numpy.int64)
+
+        columns = [n for n in selection.columns if n in justdata]
+        out = numpy.empty(length, dtype=numpy.int64)
+        numpass = 0
+        for i in range(length):
+            onedata = {n: justdata[n][i] for n in columns}
+            onedata.update(functions)
+            if selection.accept(self.builtins, self.bind(onedata)):
+                out[numpass] = i
+                numpass += 1
+        return out[:numpass]
+
+    def fill(self, chunks, source=None, progress=None):
+        # aggregation only: chunks are consumed one at a time and no per-event output is kept
+        selection = self.selection
+        numchunks = 0
+        numevents = 0
+        for chunk in chunks:
+            functions = {n: x for n, x in chunk.items() if callable(x)}
+            justdata = {n: x for n, x in chunk.items() if not callable(x)}
+            length = chunklength(justdata, numchunks)
+
+            # other columns are only touched for events that pass the selection
+            index = range(length) if selection is None else self.select(chunk, selection)
+            for i in index:
+                onedata = {n: x[i] for n, x in justdata.items()}
+                for n, x in functions.items():
+                    onedata[n] = x
+                self.single(source=source, **onedata)
+
+            numchunks += 1
+            numevents += length
+            if progress is not None:
+                progress(numchunks, numevents)
+
+        return self.aggregation
+
+    def bind(self, data):
+        if self.schema is None:
+            return data
+        data = dict(data)
+        for n, tpe in self.schema.items():
+            if n in data and isinstance(tpe, (RecordType, ListType)):
+                data[n] = tpe.bind(data[n])
+        return data
+
     def single(self, source=None, **data):
+        raw = data
+        data = self.bind(data)
         symboltable = SymbolTable.root(self.builtins, data)
-        for statement in self.ast.block:
-            handle(statement, source, symboltable, self.aggregation)
+        previous = getattr(vectorcache, "vectors", None)
+        vectorcache.vectors = {}
+        try:
+            for statement in self.ast.block:
+                handle(statement, source, symboltable, self.aggregation)
+        finally:
+            vectorcache.vectors = previous
         symboltable.dropfunctions()
+
+        if self.schema is not None:
+            for n in self.schema:
+                if n in raw:
+                    symboltable.symbols[n] = raw[n]
         return symboltable.symbols
 
+    def shard(self):
+        # same document and schema, with its own empty aggregation
+        out = self.__class__.__new__(self.__class__)
+        out.__setstate__(self.__getstate__())
+        out.clear()
+        return out
+
+    def run_threaded(self, chunks, threads=None, source=None):
+        # chunks are filled in a thread pool, each thread into its own shard; the per-event work is interpreted
+        # Python, which holds the GIL, so this is only faster than fill on a free-threaded (GIL-free) build
+        import concurrent.futures
+        import multiprocessing
+        chunks = list(chunks)
+        if threads is None:
+            threads = multiprocessing.cpu_count()
+        threads = max(1, min(threads, len(chunks)))
+
+        shards = [self.shard() for i in range(threads)]
+        shares = [(shards[i], source, chunks[i::threads]) for i in range(threads)]
+        if threads == 1:
+            partials = [runshare(x) for x in shares]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+                partials = list(executor.map(runshare, shares))
+
+        # same reduction as run_parallel: in shard order
+        for partial in partials:
+            self.aggregation += partial
+        return self.aggregation
+
+    def run_parallel(self, chunks, workers=None, source=None, shared=False):
+        import multiprocessing
+        chunks = list(chunks)
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        workers = max(1, min(workers, len(chunks)))
+
+        # workers receive the compiled blob, serialized once, rather than the source text or a Run per share
+        empty = self.shard().to_bytes()
+        if shared:
+            return self._run_shared(empty, chunks, workers, source)
+
+        shares = [(empty, source, chunks[i::workers]) for i in range(workers)]
+        if workers == 1:
+            partials = [runshare(x) for x in shares]
+        else:
+            pool = multiprocessing.Pool(workers)
+            try:
+                partials = pool.map(runshare, shares, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+        # merge in share order, so that the result does not depend on which worker finished first
+        for partial in partials:
+            self.aggregation += partial
+        return self.aggregation
+
+    def _run_shared(self, empty, chunks, workers, source):
+        # binnings of storages are filled in place: every worker's arrays are regions of one shared block,
+        # so each worker holds no histogram of its own and there is no per-worker copy to merge; a bin is
+        # updated under one of a fixed set of locks, chosen by bin number
+        import multiprocessing
+        import multiprocessing.shared_memory
+        numpy = numpymodule()
+
+        binnings = list(arraybinnings(self.aggregation))
+        size = sum(x.size for x in binnings)
+        memory = multiprocessing.shared_memory.SharedMemory(create=True, size=max(8, size * 8))
+        region = None
+        try:
+            region = numpy.ndarray(size, dtype=numpy.float64, buffer=memory.buf)
+            region[...] = 0.0
+            region = None
+
+            locks = [multiprocessing.Lock() for i in range(64)]
+            shares = [(empty, source, chunks[i::workers], memory.name) for i in range(workers)]
+            pool = multiprocessing.Pool(workers, initializer=setsharedlocks, initargs=(locks,))
+            try:
+                # the workers return their aggregations with the shared arrays detached, so only
+                # storages outside of binnings (a handful of numbers) are merged
+                partials = pool.map(runsharedshare, shares, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+            for partial in partials:
+                self.aggregation += partial
+            offset = 0
+            for binning in binnings:
+                region = numpy.ndarray(binning.size, dtype=numpy.float64, buffer=memory.buf, offset=offset * 8)
+                binning.accumulatearray(region)
+                offset += binning.size
+
+        finally:
+            # close() raises BufferError while any view of the buffer remains, which would hide a worker's error
+            region = None
+            memory.close()
+            memory.unlink()
+
+        return self.aggregation
+
+    @property
+    def inputs(self):
+        # names that must be provided as inputs (builtins are assumed not to be overridden)
+        return inputreferences(self.ast, self.builtins).names
+
+    @property
+    def paths(self):
+        # dotted paths through the inputs that the document reads, such as "jets.pt"; paths are syntactic,
+        # so a computed Lorentz member like "jets.pt" of px/py/pz inputs is reported as if it were a column
+        return set(".".join(x) for x in inputreferences(self.ast, self.builtins).paths)
+
     def __getitem__(self, where):
         return self.aggregation[where]
 
+def chunklength(justdata, chunkindex=0):
+    lengths = [len(x) for x in justdata.values()]
+    if not all(x == lengths[0] for x in lengths):
+        raise ValueError("columns in chunk {0} have different lengths: {1}".format(chunkindex, ", ".join("{0} ({1})".format(n, len(x)) for n, x in justdata.items())))
+    return lengths[0] if len(lengths) > 0 else 0
+
+def keptsymbol(symbols, name):
+    try:
+        return symbols[name]
+    except KeyError:
+        raise KeyError("symbol {0} was requested in keep, but it is not defined at the top level of the document".format(repr(name)))
+
+def keptdtype(value):
+    numpy = numpymodule()
+    if adl.util.isbool(value):
+        return numpy.bool_
+    elif isinstance(value, numbers.Integral):
+        return numpy.int64 if -2**63 <= value < 2**63 else object
+    elif isinstance(value, numbers.Real):
+        return numpy.float64
+    else:
+        return object
+
+def keptwiden(array, filled, dtype):
+    # the first filled items in a wider dtype; int64 becomes float64 in place, a block at a time,
+    # so that the output never exists twice
+    numpy = numpymodule()
+    if array.dtype == numpy.int64 and numpy.dtype(dtype) == numpy.float64:
+        out = array.view(numpy.float64)
+        for start in range(0, filled, 65536):
+            out[start:min(filled, start + 65536)] = array[start:min(filled, start + 65536)]
+    else:
+        out = numpy.empty(len(array), dtype=dtype)
+        out[:filled] = array[:filled]
+    return out
+
+def keptstore(array, length, i, value):
+    # array has room for all length events (allocated at the first), and the first i are filled
+    numpy = numpymodule()
+    dtype = keptdtype(value)
+    if array is None:
+        array = numpy.empty(length, dtype=dtype)
+    elif array.dtype != object and numpy.dtype(dtype) != array.dtype:
+        array = keptwiden(array, i, numpy.result_type(array.dtype, dtype) if dtype is not object else object)
+    try:
+        array[i] = value
+    except OverflowError:
+        # too large for the numeric dtype chosen so far
+        array = keptwiden(array, i, object)
+        array[i] = value
+    return array
+
+def runshare(share):
+    run, source, chunks = share
+    if isinstance(run, bytes):
+        run = Run.from_bytes(run)
+    return run.fill(chunks, source=source)
+
+sharedlocks = None
+
+def setsharedlocks(locks):
+    global sharedlocks
+    sharedlocks = locks
+
+def runsharedshare(share):
+    import multiprocessing.shared_memory
+    run, source, chunks, name = share
+    run = Run.from_bytes(run)
+    memory = multiprocessing.shared_memory.SharedMemory(name=name)
+    binnings = list(arraybinnings(run.aggregation))
+    regions = []
+    try:
+        offset = 0
+        for binning in binnings:
+            regions.append(memory.buf[offset * 8:(offset + binning.size) * 8].cast("d"))
+            binning.array = regions[-1]
+            binning.locks = sharedlocks
+            offset += binning.size
+        run.fill(chunks, source=source)
+    finally:
+        # views made while filling may survive in a traceback, so the regions are released explicitly,
+        # or close() would raise BufferError in place of the original error
+        for binning in binnings:
+            binning.array = None
+            binning.locks = None
+        for region in regions:
+            region.release()
+        memory.close()
+    return run.aggregation
+
 ###################################################### library for the interpreter
 
 def typerequire(*types):
@@ -746,9 +1686,9 @@ def typerequire(*types):
         for val, arg, tpe in zip(values, expression.arguments, types):
             if tpe is bool and val is not True and val is not False:
                 raise adl.error.ADLTypeError("value is not a boolean: {0}".format(repr(val), arg), expression)
-            elif tpe is float and not isinstance(val, (numbers.Real, numpy.integer, numpy.floating)):
+            elif tpe is float and not isinstance(val, numbers.Real):
                 raise adl.error.ADLTypeError("value is not a number: {0}".format(repr(val), arg), expression)
-            elif tpe is int and not isinstance(val, (numbers.Integral, numpy.integer)):
+            elif tpe is int and not isinstance(val, numbers.Integral):
                 raise adl.error.ADLTypeError("value is not an integer: {0}".format(repr(val), arg), expression)
         return True
     return out
@@ -760,9 +1700,9 @@ def typetest(*types):
         for val, arg, tpe in zip(values, expression.arguments, types):
             if tpe is bool and value is not True and value is not False:
                 return False
-            elif tpe is float and not isinstance(x, (numbers.Real, numpy.integer, numpy.floating)):
+            elif tpe is float and not isinstance(x, numbers.Real):
                 return False
-            elif tpe is int and not isinstance(x, (numbers.Integral, numpy.integer)):
+            elif tpe is int and not isinstance(x, numbers.Integral):
                 return False
         return True
     return out
@@ -838,6 +1778,23 @@ def listfunctions(expression, data, name):
         else:
             return max(data)
 
+    elif name == "sum":
+        if len(data) == 0:
+            return 0
+        elif is_pxpypz(data[:1], True) or is_ptetaphi(data[:1], True):
+            return vectorsum(expression, data)
+        else:
+            return sum(data)
+
+    elif name == "delta_r_matrix":
+        return lambda other: deltarmatrix(expression, data, other)
+
+    elif name == "nearest":
+        return lambda other: nearest(expression, data, other)
+
+    elif name == "isolated_from":
+        return lambda other, dr: isolatedfrom(expression, data, other, dr)
+
     elif name == "minby":
         return lambda f: extremeby(expression, data, f, True)
 
@@ -854,6 +1811,10 @@ Run.special[Attribute].append((islist, listfunctions))
 def is_pxpypz(values, expression):
     if len(values) == 0:
         return False
+    elif isinstance(values[0], LorentzVector):
+        return expression
+    elif isinstance(values[0], Record):
+        return expression if values[0].type.system is not None else False
     elif not has(values[0], "px") or not has(values[0], "py") or not has(values[0], "pz") or not (has(values[0], "energy") or has(values[0], "mass")):
         return False
     else:
@@ -867,286 +1828,411 @@ def is_ptetaphi(values, expression):
     else:
         return expression
 
-def mass2energy(data):
-    out = copy.copy(data)
-    mass = get(out, "mass")
-    if has(out, "px") and has(out, "py") and has(out, "pz"):
-        px = get(out, "px")
-        py = get(out, "py")
-        pz = get(out, "pz")
-    elif has(out, "pt") and has(out, "eta") and has(out, "phi"):
-        pt = get(out, "pt")
-        eta = get(out, "eta")
-        phi = get(out, "phi")
-        px = pt * math.cos(phi)
-        py = pt * math.sin(phi)
-        pz = pt * math.sinh(eta)
-    else:
-        assert False
-    energy = math.sqrt(px**2 + py**2 + pz**2 + mass**2*(1 if mass >= 0 else -1))
-    try:
-        out.energy = energy
-    except:
-        out["energy"] = energy
-    return out
+class LorentzVector(object):
+    __slots__ = ("data", "cache")
+
+    members = ("px", "py", "pz", "energy", "pt", "eta", "phi", "mass", "p", "Et", "mt", "theta", "rapidity", "beta", "gamma", "dot", "delta_phi", "delta_r")
+
+    def __init__(self, data, expression=None):
+        self.data = data
+        self.cache = cache = {}
+        if has(data, "px") and has(data, "py") and has(data, "pz"):
+            cache["px"] = get(data, "px")
+            cache["py"] = get(data, "py")
+            cache["pz"] = get(data, "pz")
+        elif has(data, "pt") and has(data, "eta") and has(data, "phi"):
+            cache["pt"] = get(data, "pt")
+            cache["eta"] = get(data, "eta")
+            cache["phi"] = get(data, "phi")
+        else:
+            raise adl.error.ADLTypeError("value is not a Lorentz vector: {0}".format(data), expression)
+        if has(data, "energy"):
+            cache["energy"] = get(data, "energy")
+        elif has(data, "mass"):
+            cache["mass"] = get(data, "mass")
+        else:
+            raise adl.error.ADLTypeError("value is not a Lorentz vector: {0}".format(data), expression)
 
-def cylindrical2cartesian(data):
-    out = copy.copy(data)
-    pt = get(out, "pt")
-    eta = get(out, "eta")
-    phi = get(out, "phi")
-    px = pt * math.cos(phi)
-    py = pt * math.sin(phi)
-    pz = pt * math.sinh(eta)
-    try:
-        out.px = px
-        out.py = py
-        out.pz = pz
-    except:
-        out["px"] = px
-        out["py"] = py
-        out["pz"] = pz
-    return out
+    @classmethod
+    def fromsystem(cls, system, values, data=None):
+        out = cls.__new__(cls)
+        out.data = data
+        out.cache = dict(zip(system, values))
+        return out
 
-def cartesian2cylindrical(data):
-    out = copy.copy(data)
-    px = get(out, "px")
-    py = get(out, "py")
-    pz = get(out, "pz")
-    theta = math.atan2(math.sqrt(px**2 + py**2), pz)
-    pt = math.sqrt(px**2 + py**2)
-    eta = -math.log((1.0 - math.cos(theta)) / (1.0 + math.cos(theta)))/2.0
-    phi = math.atan2(py, px)
-    try:
-        out.pt = pt
-        out.eta = eta
-        out.phi = phi
-    except:
-        out["pt"] = pt
-        out["eta"] = eta
-        out["phi"] = phi
-    return out
+    @classmethod
+    def fromcartesian(cls, px, py, pz, energy):
+        out = cls.__new__(cls)
+        out.data = None
+        out.cache = {"px": px, "py": py, "pz": pz, "energy": energy}
+        return out
 
-def pxpy2phi(data):
-    out = copy.copy(data)
-    px = get(out, "px")
-    py = get(out, "py")
-    phi = math.atan2(py, px)
-    try:
-        out.phi = phi
-    except:
-        out["phi"] = phi
-    return out
+    def __repr__(self):
+        return "<LorentzVector px={0} py={1} pz={2} energy={3}>".format(self.px, self.py, self.pz, self.energy)
 
-def ensure_pxpypzE(data, expression):
-    if has(data, "px") and has(data, "py") and has(data, "pz") and has(data, "energy"):
-        return data
-    elif has(data, "px") and has(data, "py") and has(data, "pz") and has(data, "mass"):
-        return mass2energy(data)
-    elif has(data, "pt") and has(data, "eta") and has(data, "phi") and has(data, "energy"):
-        return cylindrical2cartesian(data)
-    elif has(data, "pt") and has(data, "eta") and has(data, "phi") and has(data, "energy"):
-        return mass2energy(cylindrical2cartesian(data))
-    else:
-        raise adl.error.ADLTypeError("value is not a Lorentz vector: {0}".format(data), expression)
+    def __add__(self, other):
+        other = vector(other)
+        return LorentzVector.fromcartesian(self.get("px") + other.get("px"), self.get("py") + other.get("py"), self.get("pz") + other.get("pz"), self.get("energy") + other.get("energy"))
 
-def ensure_ptetaphi(data, expression):
-    if has(data, "px") and has(data, "py") and has(data, "pz"):
-        return cartesian2cylindrical(data)
-    elif has(data, "pt") and has(data, "eta") and has(data, "phi"):
-        return data
-    else:
-        raise adl.error.ADLTypeError("value is not a Lorentz vector: {0}".format(data), expression)
+    def get(self, name):
+        out = self.cache.get(name)
+        if out is None:
+            out = self.cache[name] = getattr(self, "_calc_" + name)()
+        return out
 
-def ensure_phi(data, expression):
-    if has(data, "px") and has(data, "py"):
-        return pxpy2phi(data)
-    elif has(data, "phi"):
-        return data
-    else:
-        raise adl.error.ADLTypeError("value is not a Lorentz vector: {0}".format(data), expression)
+    def _calc_px(self):
+        return self.get("pt") * math.cos(self.get("phi"))
 
-def pxpypz_members(expression, data, name):
-    px = get(data, "px")
-    py = get(data, "py")
-    pz = get(data, "pz")
+    def _calc_py(self):
+        return self.get("pt") * math.sin(self.get("phi"))
 
-    def energy():
-        if has(data, "energy"):
-            return get(data, "energy")
-        else:
-            return mass2energy(data)
+    def _calc_pz(self):
+        return self.get("pt") * math.sinh(self.get("eta"))
+
+    def _calc_energy(self):
+        mass = self.get("mass")
+        return math.sqrt(self.get("p2") + mass**2*(1 if mass >= 0 else -1))
+
+    def _calc_pt(self):
+        return math.sqrt(self.get("px")**2 + self.get("py")**2)
+
+    def _calc_eta(self):
+        return math.asinh(self.get("pz") / self.get("pt"))
 
-    def phi():
-        return math.atan2(py, px)
+    def _calc_phi(self):
+        return math.atan2(self.get("py"), self.get("px"))
 
-    def eta():
-        return -math.log((1.0 - math.cos(theta())) / (1.0 + math.cos(theta())))/2.0
+    def _calc_mass(self):
+        mass2 = self.get("energy")**2 - self.get("p2")
+        if mass2 >= 0:
+            return math.sqrt(mass2)
+        else:
+            return float("nan")
 
-    def mt():
-        mt2 = energy()**2 - pz**2
-        if mt2 >= 0:
-            return math.sqrt(mt2)
+    def _calc_p2(self):
+        if "px" in self.cache:
+            return self.get("px")**2 + self.get("py")**2 + self.get("pz")**2
         else:
-            return -math.sqrt(mt2)
+            return (self.get("pt") * math.cosh(self.get("eta")))**2
+
+    def _calc_p(self):
+        return math.sqrt(self.get("p2"))
+
+    def _calc_Et(self):
+        return self.get("energy") * self.get("pt") / self.get("p")
+
+    def _calc_mt(self):
+        mt2 = self.get("energy")**2 - self.get("pz")**2
+        return math.copysign(math.sqrt(abs(mt2)), mt2)
 
-    def theta():
-        return math.atan2(math.sqrt(px**2 + py**2), pz)
+    def _calc_theta(self):
+        return math.atan2(self.get("pt"), self.get("pz"))
 
-    def beta():
-        return math.sqrt(px**2 + py**2 + pz**2) / energy()
+    def _calc_rapidity(self):
+        energy = self.get("energy")
+        pz = self.get("pz")
+        return math.log((energy + pz) / (energy - pz)) / 2.0
 
-    def gamma():
-        b = beta()
+    def _calc_beta(self):
+        return self.get("p") / self.get("energy")
+
+    def _calc_gamma(self):
+        b = self.get("beta")
         if -1 < b < 1:
             return (1.0 - b**2)**(-0.5)
         else:
             return float("inf")
 
-    def dot(other):
-        other = ensure_pxpypzE(other, expression.arguments[1])
-        return energy()*get(other, "energy") - px*get(other, "px") - py*get(other, "py") - pz*get(other, "pz")
+    px       = property(lambda self: self.get("px"))
+    py       = property(lambda self: self.get("py"))
+    pz       = property(lambda self: self.get("pz"))
+    energy   = property(lambda self: self.get("energy"))
+    pt       = property(lambda self: self.get("pt"))
+    eta      = property(lambda self: self.get("eta"))
+    phi      = property(lambda self: self.get("phi"))
+    mass     = property(lambda self: self.get("mass"))
+    p        = property(lambda self: self.get("p"))
+    Et       = property(lambda self: self.get("Et"))
+    mt       = property(lambda self: self.get("mt"))
+    theta    = property(lambda self: self.get("theta"))
+    rapidity = property(lambda self: self.get("rapidity"))
+    beta     = property(lambda self: self.get("beta"))
+    gamma    = property(lambda self: self.get("gamma"))
+
+    def dot(self, other):
+        other = vector(other)
+        return self.get("energy")*other.get("energy") - self.get("px")*other.get("px") - self.get("py")*other.get("py") - self.get("pz")*other.get("pz")
+
+    def delta_phi(self, other):
+        return (self.get("phi") - vector(other).get("phi") + math.pi) % (2*math.pi) - math.pi
+
+    def delta_r(self, other):
+        other = vector(other)
+        return math.sqrt(self.delta_phi(other)**2 + (self.get("eta") - other.get("eta"))**2)
+
+# wrappers live as long as the event being processed (see Run.single), keyed by the identity of the wrapped record
+vectorcache = threading.local()
+
+def vector(data, expression=None):
+    if isinstance(data, LorentzVector):
+        return data
+    if isinstance(data, Record):
+        return data.vector(expression)
+    vectors = getattr(vectorcache, "vectors", None)
+    if vectors is None:
+        return LorentzVector(data, expression)
+    out = vectors.get(id(data))
+    if out is None or out.data is not data:
+        out = vectors[id(data)] = LorentzVector(data, expression)
+    return out
+
+def ensure_pxpypzE(data, expression):
+    return vector(data, expression)
 
-    def delta_phi(other):
-        other = ensure_phi(other, expression.arguments[1])
-        return (phi() - get(other, "phi") + math.pi) % (2*math.pi) - math.pi
+def ensure_ptetaphi(data, expression):
+    return vector(data, expression)
 
-    def delta_r(other):
-        other = ensure_ptetaphi(other, expression.arguments[1])
-        return math.sqrt(delta_phi(other)**2 + (eta() - get(other, "eta"))**2)
+def ensure_phi(data, expression):
+    return vector(data, expression)
 
-    def mass():
-        if has(data, "mass"):
-            return get(data, "mass")
-        else:
-            mass2 = energy()**2 - px**2 - py**2 - pz**2
-            if mass2 >= 0:
-                return math.sqrt(mass2)
-            else:
-                return float("nan")
-
-    if   name == "px":        return px
-    elif name == "py":        return py
-    elif name == "pz":        return pz
-    elif name == "energy":    return energy()
-    elif name == "eta":       return eta()
-    elif name == "phi":       return phi()
-    elif name == "mass":      return mass()
-    elif name == "p":         return math.sqrt(px**2 + py**2 + pz**2)
-    elif name == "pt":        return math.sqrt(px**2 + py**2)
-    elif name == "Et":        return energy() * math.sqrt(px**2 + py**2) / math.sqrt(px**2 + py**2 + pz**2)
-    elif name == "mt":        return mt()
-    elif name == "theta":     return theta()
-    elif name == "rapidity":  return math.log((energy() + pz) / (energy() - pz)) / 2.0
-    elif name == "beta":      return beta()
-    elif name == "gamma":     return gamma()
-    elif name == "dot":       return dot
-    elif name == "delta_phi": return delta_phi
-    elif name == "delta_r":   return delta_r
-    else:
+def vector_members(expression, data, name):
+    if name in LorentzVector.members:
+        return getattr(vector(data, expression.arguments[0]), name)
+    elif isinstance(data, LorentzVector) and data.data is None:
         raise adl.error.ADLTypeError("Lorentz vectors do not have a member named {0}".format(repr(name)), expression)
+    elif isinstance(data, LorentzVector):
+        return dodot(data.data, name)
+    else:
+        return dodot(data, name)
 
-def ptetaphi_members(expression, data, name):
-    pt = get(data, "pt")
-    eta = get(data, "eta")
-    phi = get(data, "phi")
+Run.special[Attribute].append((is_pxpypz, vector_members))
+Run.special[Attribute].append((is_ptetaphi, vector_members))
 
-    def energy():
-        if has(data, "energy"):
-            return get(data, "energy")
-        else:
-            return mass2energy(data)
+def pxpypz_plus(expression, left, right):
+    return vector(left, expression.arguments[0]) + vector(right, expression.arguments[1])
+
+def vectorsum(expression, data):
+    px = py = pz = energy = 0.0
+    for x in data:
+        x = vector(x, expression)
+        px += x.get("px")
+        py += x.get("py")
+        pz += x.get("pz")
+        energy += x.get("energy")
+    return LorentzVector.fromcartesian(px, py, pz, energy)
+
+Run.special[Plus].append((is_pxpypz, pxpypz_plus))
+Run.special[Plus].append((is_ptetaphi, pxpypz_plus))
 
-    def mt():
-        mt2 = energy() - (pt * math.sinh(eta))**2
-        if mt2 >= 0:
-            return math.sqrt(mt2)
+###################################################### delta-R matching
+
+def etaphi(expression, data):
+    numpy = numpymodule()
+    if islorentzarray(data):
+        return data.eta, data.phi
+    eta = numpy.empty(len(data))
+    phi = numpy.empty(len(data))
+    for i, x in enumerate(data):
+        x = vector(x, expression)
+        eta[i] = x.get("eta")
+        phi[i] = x.get("phi")
+    return eta, phi
+
+def matchable(other):
+    if islist([other], True):
+        return other
+    else:
+        return [other]
+
+def deltarmatrix(expression, data, other):
+    other = matchable(other)
+    eta1, phi1 = etaphi(expression, data)
+    eta2, phi2 = etaphi(expression, other)
+    import adl.columnar
+    return adl.columnar.delta_r_matrix(eta1, phi1, eta2, phi2)
+
+def nearest(expression, data, other):
+    # same contract as LorentzVectorArray.nearest: the index of each item's partner in other, or -1 if other is empty
+    other = matchable(other)
+    if len(other) == 0:
+        return [-1] * len(data)
+    else:
+        numpy = numpymodule()
+        return [int(j) for j in numpy.argmin(deltarmatrix(expression, data, other), axis=1)]
+
+def isolatedfrom(expression, data, other, dr):
+    isolated = (deltarmatrix(expression, data, other) > dr).all(axis=1)
+    if islorentzarray(data):
+        return data[isolated]
+    else:
+        return [x for x, keep in zip(data, isolated) if keep]
+
+###################################################### columnar Lorentz vectors
+
+def islorentzarray(x):
+    # columnar arrays cannot exist unless adl.columnar has been imported (by whoever made them)
+    columnar = sys.modules.get("adl.columnar")
+    return columnar is not None and isinstance(x, columnar.LorentzVectorArray)
+
+def is_lorentzarray(values, expression):
+    if not any(islorentzarray(x) for x in values):
+        return False
+    else:
+        return expression
+
+def lorentzarray_members(expression, data, name):
+    if name == "sum":
+        out = data.sum()
+        if islorentzarray(out):
+            return out
         else:
-            return -math.sqrt(mt2)
+            return LorentzVector.fromcartesian(out["px"], out["py"], out["pz"], out["energy"])
+    elif name in type(data).members or (data.isjagged and name in type(data).matching):
+        return getattr(data, name)
+    else:
+        return listfunctions(expression, data, name)
 
-    def rapidity():
-        E = energy()
-        pz = pt * math.sinh(eta)
-        return math.log((E + pz) / (E - pz)) / 2.0
+def lorentzarray_plus(expression, left, right):
+    return left + right
 
-    def beta():
-        return pt * math.cosh(eta) / energy()   # FIXME: not checked
+# ahead of the generic list and record handlers, which would otherwise claim these arrays
+Run.special[Attribute].insert(0, (is_lorentzarray, lorentzarray_members))
+Run.special[Plus].insert(0, (is_lorentzarray, lorentzarray_plus))
 
-    def gamma():
-        b = beta()
-        if -1 < b < 1:
-            return (1.0 - b**2)**(-0.5)
+###################################################### input schema
+
+class RecordType(object):
+    def __init__(self, name, fields, vector=False):
+        self.name = name
+        self.fields = tuple(fields)
+        self.system = None
+        if vector:
+            import adl.columnar
+            for system in adl.columnar.LorentzVectorArray.systems:
+                if all(x in self.fields for x in system):
+                    self.system = system
+                    break
+            else:
+                raise TypeError("record type {0} is declared as a Lorentz vector, but its fields {1} do not include a complete coordinate system".format(repr(name), self.fields))
+        self.accessors = {}
+
+    def __repr__(self):
+        return "RecordType({0}, {1}{2})".format(repr(self.name), repr(self.fields), "" if self.system is None else ", vector=True")
+
+    def __getstate__(self):
+        # accessors are a per-process cache keyed by the caller's classes, which may not be picklable
+        return {"name": self.name, "fields": self.fields, "system": self.system}
+
+    def __setstate__(self, state):
+        self.name = state["name"]
+        self.fields = state["fields"]
+        self.system = state["system"]
+        self.accessors = {}
+
+    def getters(self, cls):
+        out = self.accessors.get(cls)
+        if out is None:
+            if issubclass(cls, dict):
+                out = dict((n, operator.itemgetter(n)) for n in self.fields)
+            else:
+                out = dict((n, operator.attrgetter(n)) for n in self.fields)
+            self.accessors[cls] = out
+        return out
+
+    def bind(self, data):
+        return Record(self, self.getters(type(data)), data)
+
+class ListType(object):
+    def __init__(self, items):
+        self.items = items
+
+    def __repr__(self):
+        return "ListType({0})".format(repr(self.items))
+
+    def bind(self, data):
+        if islorentzarray(data):
+            return data
+        elif isinstance(self.items, RecordType):
+            # getters are looked up once per run of same-typed items, not once per item
+            out = []
+            cls = getters = None
+            for x in data:
+                if type(x) is not cls:
+                    cls = type(x)
+                    getters = self.items.getters(cls)
+                out.append(Record(self.items, getters, x))
+            return out
         else:
-            return float("inf")
+            return [self.items.bind(x) for x in data]
 
-    def dot(other):
-        self = ensure_pxpypzE(data, expression.arguments[0])
-        other = ensure_pxpypzE(other, expression.arguments[1])
-        return get(self, "energy")*get(other, "energy") - get(self, "px")*get(other, "px") - get(self, "py")*get(other, "py") - get(self, "pz")*get(other, "pz")
-
-    def delta_phi(other):
-        other = ensure_phi(other, expression.arguments[1])
-        return (phi - get(other, "phi") + math.pi) % (2*math.pi) - math.pi
-
-    def delta_r(other):
-        other = ensure_ptetaphi(other, expression.arguments[1])
-        return math.sqrt(delta_phi(other)**2 + (eta - get(other, "eta"))**2)
-
-    if   name == "px":        return pt * math.cos(phi)
-    elif name == "py":        return pt * math.sin(phi)
-    elif name == "pz":        return pt * math.sinh(eta)
-    elif name == "energy":    return energy()
-    elif name == "eta":       return eta
-    elif name == "phi":       return phi
-    elif name == "mass":      return get(data, "mass") if has(data, "mass") else math.sqrt(energy()**2 - px**2 - py**2 - pz**2)
-    elif name == "p":         return pt * math.cosh(eta)              # FIXME: not checked
-    elif name == "pt":        return pt
-    elif name == "Et":        return energy() / math.cosh(eta)        # FIXME: not checked
-    elif name == "mt":        return mt()
-    elif name == "theta":     return math.atan2(1.0, math.sinh(eta))  # FIXME: not checked
-    elif name == "rapidity":  return rapidity()
-    elif name == "beta":      return beta()
-    elif name == "gamma":     return gamma()
-    elif name == "dot":       return dot
-    elif name == "delta_phi": return delta_phi
-    elif name == "delta_r":   return delta_r
-    else:
-        raise adl.error.ADLTypeError("Lorentz vectors do not have a member named {0}".format(repr(name)), expression)
+class Record(object):
+    __slots__ = ("type", "getters", "data", "lorentz")
 
-Run.special[Attribute].append((is_pxpypz, pxpypz_members))
-Run.special[Attribute].append((is_ptetaphi, ptetaphi_members))
+    def __init__(self, type, getters, data):
+        self.type = type
+        self.getters = getters
+        self.data = data
+        self.lorentz = None
 
-def pxpypz_plus(expression, left, right):
-    left = ensure_pxpypzE(left, expression.arguments[0])
-    right = ensure_pxpypzE(right, expression.arguments[1])
+    def __repr__(self):
+        return "<{0} record {1}>".format(self.type.name, repr(self.data))
 
-    px = get(left, "px") + get(right, "px")
-    py = get(left, "py") + get(right, "py")
-    pz = get(left, "pz") + get(right, "pz")
-    energy = get(left, "energy") + get(right, "energy")
+    def get(self, name, expression=None):
+        getter = self.getters.get(name)
+        if getter is None:
+            raise adl.error.ADLTypeError("{0} records do not have a field named {1}".format(repr(self.type.name), repr(name)), expression)
+        return getter(self.data)
 
-    out = copy.copy(left)
-    try:
-        out.px = px
-        out.py = py
-        out.pz = pz
-        out.energy = energy
-    except:
-        out["px"] = px
-        out["py"] = py
-        out["pz"] = pz
-        out["energy"] = energy
-    return out
+    def vector(self, expression=None):
+        if self.lorentz is None:
+            if self.type.system is None:
+                raise adl.error.ADLTypeError("{0} records are not Lorentz vectors".format(repr(self.type.name)), expression)
+            self.lorentz = LorentzVector.fromsystem(self.type.system, [self.getters[n](self.data) for n in self.type.system], self)
+        return self.lorentz
 
-Run.special[Plus].append((is_pxpypz, pxpypz_plus))
-Run.special[Plus].append((is_ptetaphi, pxpypz_plus))
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __contains__(self, name):
+        return name in self.getters
+
+    # without this, iter() would fall back to __getitem__(0, 1, ...) and records would look like lists
+    __iter__ = None
+
+    def __getattr__(self, name):
+        if name in Record.__slots__ or name not in self.getters:
+            raise AttributeError("{0} records do not have a field named {1}".format(repr(self.type.name), repr(name)))
+        return self.getters[name](self.data)
+
+def isrecord(values, expression):
+    if len(values) == 0 or not isinstance(values[0], Record):
+        return False
+    else:
+        return expression
+
+def record_members(expression, record, name):
+    getter = record.getters.get(name)
+    if getter is not None:
+        return getter(record.data)
+    elif record.type.system is not None and name in LorentzVector.members:
+        return getattr(record.vector(expression.arguments[0]), name)
+    else:
+        raise adl.error.ADLTypeError("{0} records do not have a field named {1}".format(repr(record.type.name), repr(name)), expression)
+
+# fields are resolved once per record type, so these bypass all of the duck-typed probing below
+Run.special[Attribute].insert(0, (isrecord, record_members))
 
 ###################################################### syntactical functions
 
 def dodot(obj, attr):
+    if isinstance(obj, dict):
+        if attr in obj:
+            return obj[attr]
+        else:
+            return getattr(obj, attr)
     try:
         return obj[attr]
-    except:
+    except (TypeError, KeyError, IndexError, ValueError):
         return getattr(obj, attr)
 
 Run.special[Attribute] .append((lambda values, expression: True,             dodot))
@@ -1172,13 +2258,27 @@ Run.special[Power]     .append((typerequire(float, float),                   lam
 
 ###################################################### builtin mathematical functions
 
+# the few without a math module equivalent import NumPy when they are first called
+
+def exp2(x):
+    return float(numpymodule().exp2(float(x)))
+
+def logaddexp(x, y):
+    return float(numpymodule().logaddexp(x, y))
+
+def logaddexp2(x, y):
+    return float(numpymodule().logaddexp2(x, y))
+
+def nexttoward(x, y):
+    return float(numpymodule().nextafter(x, y))
+
 # constants (just pi; `e` is too easily confused with user-defined variables, and it's `exp(1)`)
 Run.builtins["pi"] = math.pi
 
 # basic math
 Run.builtins["sqrt"] = math.sqrt
 Run.builtins["exp"] = math.exp
-Run.builtins["exp2"] = lambda x: float(numpy.exp2(float(x)))
+Run.builtins["exp2"] = exp2
 Run.builtins["log"] = math.log
 Run.builtins["log2"] = math.log2
 Run.builtins["log10"] = math.log10
@@ -1218,8 +2318,8 @@ Run.builtins["heaviside"] = lambda x, middle=0.5: 0 if x < 0 else 1 if x > 0 els
 Run.builtins["expm1"] = math.expm1
 Run.builtins["log1p"] = math.log1p
 Run.builtins["ldexp"] = math.ldexp
-Run.builtins["logaddexp"] = lambda x, y: float(numpy.logaddexp(x, y))
-Run.builtins["logaddexp2"] = lambda x, y: float(numpy.logaddexp2(x, y))
+Run.builtins["logaddexp"] = logaddexp
+Run.builtins["logaddexp2"] = logaddexp2
 
 # number type
 Run.builtins["isfinite"] = math.isfinite
@@ -1227,6 +2327,6 @@ Run.builtins["isinf"] = math.isinf
 Run.builtins["isnan"] = math.isnan
 
 # bit-level detail
-Run.builtins["nextafter"] = lambda x: float(numpy.nextafter(x, numpy.inf))
-Run.builtins["nextbefore"] = lambda x: float(numpy.nextafter(x, -numpy.inf))
-Run.builtins["nexttoward"] = lambda x, y: float(numpy.nextafter(x, y))
+Run.builtins["nextafter"] = lambda x: nexttoward(x, math.inf)
+Run.builtins["nextbefore"] = lambda x: nexttoward(x, -math.inf)
+Run.builtins["nexttoward"] = nexttoward
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
-import ply.yacc
+import copy
+import os
+import threading
 
 import adl.syntaxtree
 import adl.tokenizer
@@ -11,27 +13,14 @@ class ADLParser(object):
 
     def pos(self, p, n):
         lo, hi = p.lexspan(n)
-        lolineno = hilineno = len(p.lexer.linepos)
-        while p.lexer.linepos[lolineno - 1] > lo:
-            lolineno -= 1
-        while p.lexer.linepos[hilineno - 1] > hi:
-            hilineno -= 1
-        return {"code": p.lexer.lexdata,
-                "lexspan": p.lexspan(n),
-                "lineno": lolineno,
-                "col_offset": lo - p.lexer.linepos[lolineno - 1],
-                "lineno2": hilineno,
-                "col_offset2": hi - p.lexer.linepos[hilineno - 1]}
+        positions = p.lexer.positions
+        return {"positions": positions, "index": positions.add(lo, hi)}
 
     def span(self, p1, p2):
         p1 = p1.leftmost()
         p2 = p2.rightmost()
-        return {"code": p1.code,
-                "lexspan": (p1.lexspan[0], p2.lexspan[1]),
-                "lineno": p1.lineno,
-                "col_offset": p1.col_offset,
-                "lineno2": p2.lineno,
-                "col_offset2": p2.col_offset}
+        positions = p1.positions
+        return {"positions": positions, "index": positions.add(positions.lo[p1.index], positions.hi[p2.index])}
 
     def require_separator(self, left, right):
         if "\n" not in left.code[left.rightmost().lexspan[1]:right.leftmost().lexspan[0]]:
@@ -77,12 +66,14 @@ class ADLParser(object):
         "namepredicates : namepredicates namepredicate"
         #                             1              2
         self.require_separator(p[1][-1], p[2])
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
     def p_namepredicates_extend_semi(self, p):
         "namepredicates : namepredicates SEMICOLON namepredicate"
         #                             1          2             3
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_namepredicate(self, p):
         "namepredicate : string COLON expression"
@@ -105,12 +96,14 @@ class ADLParser(object):
         "loopvars : loopvars loopvar"
         #                  1       2
         self.require_separator(p[1][-1], p[2])
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
     def p_loopvars_extend_semi(self, p):
         "loopvars : loopvars SEMICOLON loopvar"
         #                  1         2       3
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_loopvar(self, p):
         "loopvar : IDENTIFIER IN expression"
@@ -121,6 +114,7 @@ class ADLParser(object):
     def p_vary(self, p):
         "vary : VARY variations OPENCURLY block CLOSECURLY"
         #          1          2         3     4          5
+        p[2].reverse()
         p[0] = adl.syntaxtree.Vary(p[2], p[4], **self.pos(p, 1))
 
     def p_variations(self, p):
@@ -128,16 +122,21 @@ class ADLParser(object):
         #                            1
         p[0] = [p[1]]
 
+    # right-recursive (a semicolon may continue either the assignments or the variations),
+    # so the list is built in reverse and put in order by p_vary
+
     def p_variations_extend(self, p):
         "variations : namedassignments variations"
         #                            1          2
-        self.require_separator(p[1].assignments[-1], p[2][0])
-        p[0] = [p[1]] + p[2]
+        self.require_separator(p[1].assignments[-1], p[2][-1])
+        p[2].append(p[1])
+        p[0] = p[2]
 
     def p_variations_extend_semi(self, p):
         "variations : namedassignments SEMICOLON variations"
         #                            1         2          3
-        p[0] = [p[1]] + p[3]
+        p[3].append(p[1])
+        p[0] = p[3]
 
     def p_namedassignments(self, p):
         "namedassignments : string COLON onlyassignment"
@@ -159,130 +158,45 @@ class ADLParser(object):
 
     ###################################################### block
 
-    def p_block_source(self, p):
-        "block : source"
-        #             1
-        p[0] = [p[1]]
-
-    def p_block_extend_source(self, p):
-        "block : source block"
-        #             1     2
-        p[0] = [p[1]] + p[2]
+    # blocks are left-recursive and extended in place, so that long documents parse in linear time
 
-    def p_block_notsource(self, p):
-        "block : notsource"
+    def p_block(self, p):
+        "block : statement"
         #                1
         p[0] = [p[1]]
 
-    def p_block_extend_notsource(self, p):
-        "block : notsource block"
-        #                1     2
-        p[0] = [p[1]] + p[2]
-
-    def p_block_region(self, p):
-        "block : region"
-        #             1
-        p[0] = [p[1]]
-
-    def p_block_extend_region(self, p):
-        "block : region block"
-        #             1     2
-        p[0] = [p[1]] + p[2]
-
-    def p_block_for(self, p):
-        "block : for"
-        #          1
-        p[0] = [p[1]]
-
-    def p_block_vary(self, p):
-        "block : vary"
-        #           1
-        p[0] = [p[1]]
-
-    def p_block_extend_vary(self, p):
-        "block : vary block"
-        #           1     2
-        p[0] = [p[1]] + p[2]
-
-    def p_block_count(self, p):
-        "block : count"
-        #            1
-        p[0] = [p[1]]
-
-    def p_block_extend_count(self, p):
-        "block : count block"
-        #            1     2
-        self.require_separator(p[1], p[2][0])
-        p[0] = [p[1]] + p[2]
-
-    def p_block_extend_count_semi(self, p):
-        "block : count SEMICOLON block"
-        #            1         2     3
-        p[0] = [p[1]] + p[3]
-
-    def p_block_sum(self, p):
-        "block : sum"
-        #          1
-        p[0] = [p[1]]
-
-    def p_block_extend_sum(self, p):
-        "block : sum block"
-        #          1     2
-        self.require_separator(p[1], p[2][0])
-        p[0] = [p[1]] + p[2]
-
-    def p_block_extend_sum_semi(self, p):
-        "block : sum SEMICOLON block"
-        #              1         2     3
-        p[0] = [p[1]] + p[3]
-
-    def p_block_profile(self, p):
-        "block : profile"
-        #              1
-        p[0] = [p[1]]
-
-    def p_block_extend_profile(self, p):
-        "block : profile block"
-        #              1     2
-        self.require_separator(p[1], p[2][0])
-        p[0] = [p[1]] + p[2]
-
-    def p_block_extend_profile_semi(self, p):
-        "block : profile SEMICOLON block"
-        #              1         2     3
-        p[0] = [p[1]] + p[3]
-
-    def p_block_fraction(self, p):
-        "block : fraction"
-        #               1
-        p[0] = [p[1]]
-
-    def p_block_extend_fraction(self, p):
-        "block : fraction block"
-        #               1     2
-        self.require_separator(p[1], p[2][0])
-        p[0] = [p[1]] + p[2]
-
-    def p_block_extend_fraction_semi(self, p):
-        "block : fraction SEMICOLON block"
-        #               1         2     3
-        p[0] = [p[1]] + p[3]
-
-    def p_block_assignment(self, p):
-        "block : assignment"
-        #                 1
-        p[0] = [p[1]]
+    def p_block_extend(self, p):
+        "block : block statement"
+        #            1         2
+        if self.needs_separator(p[1][-1]):
+            self.require_separator(p[1][-1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
-    def p_block_extend_assignment(self, p):
-        "block : assignment block"
-        #                 1     2
-        self.require_separator(p[1], p[2][0])
-        p[0] = [p[1]] + p[2]
+    def p_block_extend_semi(self, p):
+        "block : block SEMICOLON statement"
+        #            1         2         3
+        if not self.needs_separator(p[1][-1]):
+            raise adl.error.ADLSyntaxError("illegal syntax", p.lexer.lexdata, *p.lexer.positions.linecol(p.lexpos(2)))
+        p[1].append(p[3])
+        p[0] = p[1]
 
-    def p_block_extend_assignment_semi(self, p):
-        "block : assignment SEMICOLON block"
-        #                 1         2     3
-        p[0] = [p[1]] + p[3]
+    def needs_separator(self, statement):
+        # statements that don't end with a closing curly bracket
+        return isinstance(statement, (adl.syntaxtree.Collect, adl.syntaxtree.Define, adl.syntaxtree.FunctionDefine))
+
+    def p_statement(self, p):
+        """statement : source
+                     | notsource
+                     | region
+                     | for
+                     | vary
+                     | count
+                     | sum
+                     | profile
+                     | fraction
+                     | assignment"""
+        p[0] = p[1]
 
     ###################################################### body
 
@@ -291,16 +205,36 @@ class ADLParser(object):
         #                1
         p[0] = [p[1]]
 
-    def p_body_extend_assignment(self, p):
-        "body : assignment body"
-        #                1    2
-        self.require_separator(p[1], p[2][0])
-        p[0] = [p[1]] + p[2]
+    def p_body_assignments(self, p):
+        "body : assignments expression"
+        #                 1          2
+        self.require_separator(p[1][-1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
+
+    def p_body_assignments_semi(self, p):
+        "body : assignments SEMICOLON expression"
+        #                 1         2          3
+        p[1].append(p[3])
+        p[0] = p[1]
+
+    def p_assignments(self, p):
+        "assignments : assignment"
+        #                       1
+        p[0] = [p[1]]
+
+    def p_assignments_extend(self, p):
+        "assignments : assignments assignment"
+        #                        1          2
+        self.require_separator(p[1][-1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
-    def p_body_extend_assignment_semi(self, p):
-        "body : assignment SEMICOLON body"
-        #                1         2    3
-        p[0] = [p[1]] + p[3]
+    def p_assignments_extend_semi(self, p):
+        "assignments : assignments SEMICOLON assignment"
+        #                        1         2          3
+        p[1].append(p[3])
+        p[0] = p[1]
 
     ###################################################### count
 
@@ -409,7 +343,8 @@ class ADLParser(object):
     def p_axis_extend(self, p):
         "axis : axis call LEFTARROW expression"
         #          1    2         3          4
-        p[0] = p[1] + [adl.syntaxtree.Axis(p[2], p[4], **self.pos(p, 3))]
+        p[1].append(adl.syntaxtree.Axis(p[2], p[4], **self.pos(p, 3)))
+        p[0] = p[1]
 
     ###################################################### assignment (identifiers and functions)
 
@@ -654,6 +589,11 @@ class ADLParser(object):
         #                1   2          3
         p[0] = adl.syntaxtree.Call.maybe(adl.syntaxtree.Attribute(**self.pos(p, 2)), [p[1], adl.syntaxtree.Literal(p[3], **self.pos(p, 3))], **self.pos(p, 2))
 
+    def p_trailer_attribute_sum(self, p):    # "sum" is a keyword, but also the name of a list method
+        "trailer : trailer DOT SUM"
+        #                1   2   3
+        p[0] = adl.syntaxtree.Call.maybe(adl.syntaxtree.Attribute(**self.pos(p, 2)), [p[1], adl.syntaxtree.Literal(p[3], **self.pos(p, 3))], **self.pos(p, 2))
+
     def p_trailer_subscript(self, p):
         "trailer : trailer OPENBRACKET exprlist CLOSEBRACKET"
         #                1           2       3            4
@@ -721,7 +661,8 @@ class ADLParser(object):
     def p_stringlist_extend(self, p):
         "stringlist : stringlist COMMA string"
         #                      1     2      3
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_string_literal_multilinestring(self, p):
         "string : MULTILINESTRING"
@@ -751,9 +692,10 @@ class ADLParser(object):
         p[0] = [p[1]]
 
     def p_arglist_extend(self, p):
-        "arglist : arg COMMA arglist"
-        #            1     2       3
-        p[0] = [p[1]] + p[3]
+        "arglist : arglist COMMA arg"
+        #                1     2   3
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_exprlist_single(self, p):
         "exprlist : expression"
@@ -761,9 +703,10 @@ class ADLParser(object):
         p[0] = [p[1]]
 
     def p_exprlist_extend(self, p):
-        "exprlist : expression COMMA exprlist"
-        #                    1     2        3
-        p[0] = [p[1]] + p[3]
+        "exprlist : exprlist COMMA expression"
+        #                  1     2          3
+        p[1].append(p[3])
+        p[0] = p[1]
 
     ###################################################### error handling
 
@@ -771,16 +714,44 @@ class ADLParser(object):
         if p is None:
             raise adl.error.ADLError("an ADL file/string ended prematurely")
         else:
-            raise adl.error.ADLSyntaxError("illegal syntax", p.lexer.lexdata, len(p.lexer.linepos), p.lexpos - p.lexer.linepos[-1])
+            raise adl.error.ADLSyntaxError("illegal syntax", p.lexer.lexdata, *p.lexer.positions.linecol(p.lexpos))
 
     def build(self, **kwargs):
+        import ply.yacc
         self.parser = ply.yacc.yacc(module=self, **kwargs)
 
-def parse(code):
-    parser = ADLParser()
-    lexer = adl.tokenizer.ADLLexer()
+###################################################### shared parser
+
+# the LALR tables are shipped as adl/parsertable.py and never written at runtime;
+# regenerate them with "python -m adl.parser" after changing the grammar;
+# PLY itself is imported the first time a document is actually parsed
+prototype = None
+prototypelock = threading.Lock()
+perthread = threading.local()
 
-    parser.build(write_tables=True, tabmodule="parsertable", debug=False, debuglog=ply.yacc.NullLogger(), errorlog=ply.yacc.NullLogger())
-    lexer.build()
+def writetables():
+    import ply.yacc
+    parser = ADLParser()
+    parser.build(write_tables=True, tabmodule="parsertable", outputdir=os.path.dirname(os.path.abspath(__file__)), debug=False, errorlog=ply.yacc.NullLogger())
+
+def getprototype():
+    global prototype
+    with prototypelock:
+        if prototype is None:
+            import ply.yacc
+            parser = ADLParser()
+            parser.build(write_tables=False, tabmodule="adl.parsertable", debug=False, debuglog=ply.yacc.NullLogger(), errorlog=ply.yacc.NullLogger())
+            prototype = parser.parser
+    return prototype
 
-    return parser.parser.parse(code, lexer=lexer.lexer, tracking=True)
+def parse(code):
+    # PLY keeps parsing state on the parser object, so each thread gets its own copy of the prototype
+    if getattr(perthread, "parser", None) is None:
+        perthread.parser = copy.copy(getprototype())
+    scanner = adl.tokenizer.ADLScanner()
+    scanner.input(code)
+    scanner.positions = adl.syntaxtree.Positions(code, scanner.linepos)
+    return perthread.parser.parse(lexer=scanner, tracking=True)
+
+if __name__ == "__main__":
+    writetables()
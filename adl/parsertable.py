@@ -0,0 +1,154 @@
+
+# parsertable.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'AND BY CLOSEBRACKET CLOSECURLY CLOSEPAREN COLON COLONEQ COMMA COUNT DEC_NUMBER DIV DOT EQEQUAL FALSE FLOAT_NUMBER FOR FRACTION GREATER GREATEREQ IDENTIFIER IN LEFTARROW LESS LESSEQ MINUS MOD MULTILINESTRING NOT NOTEQUAL OPENBRACKET OPENCURLY OPENPAREN OR PLUS POWER PROFILE REGION RIGHTARROW SEMICOLON SOURCE STRING SUM TIMES TRUE VARY WEIGHTsuite : blocksource : SOURCE stringlist OPENCURLY block CLOSECURLYnotsource : NOT SOURCE stringlist OPENCURLY block CLOSECURLYregion : REGION namepredicates OPENCURLY block CLOSECURLYregion : REGION namepredicates BY axis OPENCURLY block CLOSECURLYnamepredicates : namepredicatenamepredicates : namepredicates namepredicatenamepredicates : namepredicates SEMICOLON namepredicatenamepredicate : string COLON expressionfor : FOR loopvars OPENCURLY block CLOSECURLYloopvars : loopvarloopvars : loopvars loopvarloopvars : loopvars SEMICOLON loopvarloopvar : IDENTIFIER IN expressionvary : VARY variations OPENCURLY block CLOSECURLYvariations : namedassignmentsvariations : namedassignments variationsvariations : namedassignments SEMICOLON variationsnamedassignments : string COLON onlyassignmentnamedassignments : namedassignments onlyassignmentnamedassignments : namedassignments SEMICOLON onlyassignmentblock : statementblock : block statementblock : block SEMICOLON statementstatement : source\n                     | notsource\n                     | region\n                     | for\n                     | vary\n                     | count\n                     | sum\n                     | profile\n                     | fraction\n                     | assignmentbody : expressionbody : assignments expressionbody : assignments SEMICOLON expressionassignments : assignmentassignments : assignments assignmentassignments : assignments SEMICOLON assignmentcount : COUNT stringcount : COUNT string WEIGHT expressioncount : COUNT string BY axiscount : COUNT string BY axisweightsum : SUM string expressionsum : SUM string expression WEIGHT expressionsum : SUM string expression BY axissum : SUM string expression BY axisweightprofile : PROFILE string expressionprofile : PROFILE string expression WEIGHT expressionprofile : PROFILE string expression BY axisprofile : PROFILE string expression BY axisweightfraction : FRACTION string expressionfraction : FRACTION string expression WEIGHT expressionfraction : FRACTION string expression BY axisfraction : FRACTION string expression BY axisweightaxisweight : axis WEIGHT expressionaxis : call LEFTARROW expressionaxis : axis call LEFTARROW expressiononlyassignment : IDENTIFIER COLONEQ expressionassignment : IDENTIFIER COLONEQ expressionassignment : call COLONEQ expressionassignment : call COLONEQ OPENCURLY body CLOSECURLYinline : IDENTIFIER RIGHTARROW expressioninline : OPENPAREN IDENTIFIER CLOSEPAREN RIGHTARROW expressioninline : OPENPAREN arglist CLOSEPAREN RIGHTARROW expressioninline : IDENTIFIER RIGHTARROW OPENCURLY body CLOSECURLYinline : OPENPAREN IDENTIFIER CLOSEPAREN RIGHTARROW OPENCURLY body CLOSECURLYinline : OPENPAREN arglist CLOSEPAREN RIGHTARROW OPENCURLY body CLOSECURLYexpression : andchainexpression : andchain OR andchainandchain : notchainandchain : notchain AND notchainnotchain : comparenotchain : NOT comparecompare : arithcompare : arith EQEQUAL arithcompare : compare EQEQUAL arithcompare : arith NOTEQUAL arithcompare : compare NOTEQUAL arithcompare : arith LESSEQ arithcompare : compare LESSEQ arithcompare : arith LESS arithcompare : compare LESS arithcompare : arith GREATEREQ arithcompare : compare GREATEREQ arithcompare : arith GREATER arithcompare : compare GREATER aritharith : termarith : term PLUS termarith : term MINUS termterm : factorterm : factor TIMES factorterm : factor DIV factorterm : factor MOD factorfactor : powerfactor : PLUS powerfactor : MINUS powerpower : trailerpower : trailer POWER trailertrailer : atomtrailer : trailer DOT IDENTIFIERtrailer : trailer DOT SUMtrailer : trailer OPENBRACKET exprlist CLOSEBRACKETtrailer : callcall : trailer OPENPAREN arglist CLOSEPARENcall : trailer OPENPAREN CLOSEPARENatom : OPENPAREN expression CLOSEPARENatom : stringatom : FLOAT_NUMBERatom : DEC_NUMBERatom : TRUEatom : FALSEatom : IDENTIFIERstringlist : stringstringlist : stringlist COMMA stringstring : MULTILINESTRINGstring : STRINGarg : expressionarg : inlinearglist : argarglist : arglist COMMA argexprlist : expressionexprlist : exprlist COMMA expression'
+    
+_lr_action_items = {'SOURCE':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[14,14,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,39,-109,-101,-110,-111,-112,-113,-117,-118,-23,14,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,14,14,14,14,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,14,14,14,14,14,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,14,-4,14,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,14,-58,-57,-5,-59,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,27,28,29,30,31,32,33,34,35,36,49,50,51,52,53,54,55,57,59,60,61,63,64,67,68,69,70,71,72,73,76,80,81,84,85,91,93,94,95,96,97,98,99,101,106,107,110,111,112,119,128,129,134,136,137,142,145,148,150,151,152,153,155,157,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[15,15,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,62,-101,-110,-111,-112,-113,-117,-118,-23,15,-41,62,62,62,62,62,62,62,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,15,15,62,15,62,15,62,-45,-49,-53,-61,-62,62,62,-107,-102,-103,-108,62,62,-75,-97,-98,15,15,15,15,15,62,-42,-43,-44,62,62,62,62,-38,-106,62,62,-104,62,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,15,-4,15,62,-10,-15,62,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,62,-39,62,-3,15,62,-58,-57,-40,62,62,-5,-59,62,62,]),'REGION':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[16,16,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,16,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,16,16,16,16,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,16,16,16,16,16,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,16,-4,16,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,16,-58,-57,-5,-59,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[17,17,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,17,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,17,17,17,17,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,17,17,17,17,17,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,17,-4,17,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,17,-58,-57,-5,-59,]),'VARY':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[18,18,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,18,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,18,18,18,18,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,18,18,18,18,18,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,18,-4,18,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,18,-58,-57,-5,-59,]),'COUNT':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[19,19,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,19,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,19,19,19,19,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,19,19,19,19,19,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,19,-4,19,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,19,-58,-57,-5,-59,]),'SUM':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,56,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[21,21,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,21,-41,107,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,21,21,21,21,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,21,21,21,21,21,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,21,-4,21,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,21,-58,-57,-5,-59,]),'PROFILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[22,22,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,22,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,22,22,22,22,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,22,22,22,22,22,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,22,-4,22,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,22,-58,-57,-5,-59,]),'FRACTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,36,49,59,60,61,63,64,67,68,69,70,71,72,73,76,81,85,93,94,95,96,97,101,106,107,110,119,128,129,134,136,137,142,145,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,202,203,204,205,206,207,208,209,210,211,221,222,224,225,231,232,],[23,23,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,23,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,23,23,23,23,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,23,23,23,23,23,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,23,-4,23,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,23,-58,-57,-5,-59,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,17,20,27,28,29,30,31,32,33,34,35,36,43,44,47,49,50,51,52,53,54,55,56,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,77,80,81,82,83,84,85,87,88,90,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,142,143,144,145,147,148,149,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[24,24,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,45,-109,70,-101,-110,-111,-112,-113,-117,-118,-23,24,45,-11,89,-41,70,70,70,70,70,105,106,70,-70,-72,-74,70,-76,-89,70,70,-92,-96,-99,-114,-105,-24,24,24,70,70,24,-12,45,70,24,89,-20,89,70,70,-45,-49,-53,-61,-62,24,164,-107,-102,-103,-108,70,70,70,70,70,70,70,70,-75,70,70,70,70,70,70,70,70,-97,-98,70,70,70,70,24,24,24,70,24,-13,-14,24,-21,70,-19,-42,70,-44,70,70,70,70,70,70,24,-38,-106,105,70,-104,70,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,24,-4,24,70,-10,-15,-60,70,-46,70,-48,-50,70,-52,-54,70,-56,-63,24,-39,24,-3,24,70,-58,-57,-40,70,70,-5,-59,24,24,]),'OPENPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,24,25,26,27,28,29,30,31,32,33,34,35,36,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,77,80,81,84,85,91,92,93,94,95,96,97,98,99,101,105,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,142,145,148,150,151,152,153,154,155,156,157,158,161,162,163,164,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[27,27,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-114,-105,55,27,-101,-110,-111,-112,-113,-117,-118,-23,27,-41,27,27,27,27,27,99,27,-70,-72,-74,27,-76,-89,27,27,-92,-96,55,-114,-105,-24,27,27,27,27,27,27,27,27,27,-45,-49,-53,-61,-62,27,99,-107,-114,-102,-103,-108,27,27,27,27,27,27,27,27,-75,27,27,27,27,27,27,27,27,-97,-98,27,27,27,27,27,27,27,27,-105,27,27,27,-42,27,-44,27,27,27,27,27,27,27,-38,55,-114,-106,99,27,-104,27,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,55,-2,27,-4,27,-105,27,-10,-15,27,-46,27,-48,-50,27,-52,-54,27,-56,-63,27,-39,27,-3,27,27,-58,-57,-40,27,27,-5,-59,27,27,]),'FLOAT_NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,27,28,29,30,31,32,33,34,35,36,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,77,80,81,84,85,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,142,145,148,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[29,29,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,29,-101,-110,-111,-112,-113,-117,-118,-23,29,-41,29,29,29,29,29,29,29,-70,-72,-74,29,-76,-89,29,29,-92,-96,-99,-114,-105,-24,29,29,29,29,29,29,29,29,29,-45,-49,-53,-61,-62,29,29,-107,-102,-103,-108,29,29,29,29,29,29,29,29,-75,29,29,29,29,29,29,29,29,-97,-98,29,29,29,29,29,29,29,29,29,29,29,-42,29,-44,29,29,29,29,29,29,29,-38,-106,29,29,-104,29,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,29,-4,29,29,-10,-15,29,-46,29,-48,-50,29,-52,-54,29,-56,-63,29,-39,29,-3,29,29,-58,-57,-40,29,29,-5,-59,29,29,]),'DEC_NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,27,28,29,30,31,32,33,34,35,36,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,77,80,81,84,85,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,142,145,148,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[30,30,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,30,-101,-110,-111,-112,-113,-117,-118,-23,30,-41,30,30,30,30,30,30,30,-70,-72,-74,30,-76,-89,30,30,-92,-96,-99,-114,-105,-24,30,30,30,30,30,30,30,30,30,-45,-49,-53,-61,-62,30,30,-107,-102,-103,-108,30,30,30,30,30,30,30,30,-75,30,30,30,30,30,30,30,30,-97,-98,30,30,30,30,30,30,30,30,30,30,30,-42,30,-44,30,30,30,30,30,30,30,-38,-106,30,30,-104,30,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,30,-4,30,30,-10,-15,30,-46,30,-48,-50,30,-52,-54,30,-56,-63,30,-39,30,-3,30,30,-58,-57,-40,30,30,-5,-59,30,30,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,27,28,29,30,31,32,33,34,35,36,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,77,80,81,84,85,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,142,145,148,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[31,31,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,31,-101,-110,-111,-112,-113,-117,-118,-23,31,-41,31,31,31,31,31,31,31,-70,-72,-74,31,-76,-89,31,31,-92,-96,-99,-114,-105,-24,31,31,31,31,31,31,31,31,31,-45,-49,-53,-61,-62,31,31,-107,-102,-103,-108,31,31,31,31,31,31,31,31,-75,31,31,31,31,31,31,31,31,-97,-98,31,31,31,31,31,31,31,31,31,31,31,-42,31,-44,31,31,31,31,31,31,31,-38,-106,31,31,-104,31,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,31,-4,31,31,-10,-15,31,-46,31,-48,-50,31,-52,-54,31,-56,-63,31,-39,31,-3,31,31,-58,-57,-40,31,31,-5,-59,31,31,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,20,27,28,29,30,31,32,33,34,35,36,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,77,80,81,84,85,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,142,145,148,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[32,32,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,32,-101,-110,-111,-112,-113,-117,-118,-23,32,-41,32,32,32,32,32,32,32,-70,-72,-74,32,-76,-89,32,32,-92,-96,-99,-114,-105,-24,32,32,32,32,32,32,32,32,32,-45,-49,-53,-61,-62,32,32,-107,-102,-103,-108,32,32,32,32,32,32,32,32,-75,32,32,32,32,32,32,32,32,-97,-98,32,32,32,32,32,32,32,32,32,32,32,-42,32,-44,32,32,32,32,32,32,32,-38,-106,32,32,-104,32,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,32,-4,32,32,-10,-15,32,-46,32,-48,-50,32,-52,-54,32,-56,-63,32,-39,32,-3,32,32,-58,-57,-40,32,32,-5,-59,32,32,]),'MULTILINESTRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,16,18,19,20,21,22,23,27,28,29,30,31,32,33,34,35,36,39,40,41,47,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,76,77,78,79,80,81,84,85,87,88,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,140,141,142,145,147,148,149,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[33,33,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,33,33,33,33,-109,33,33,33,33,-101,-110,-111,-112,-113,-117,-118,-23,33,33,33,-6,33,-41,33,33,33,33,33,33,33,-70,-72,-74,33,-76,-89,33,33,-92,-96,-99,-114,-105,-24,33,33,33,33,-7,33,33,33,33,33,33,-20,33,33,-45,-49,-53,-61,-62,33,33,-107,-102,-103,-108,33,33,33,33,33,33,33,33,-75,33,33,33,33,33,33,33,33,-97,-98,33,33,33,33,33,33,33,33,-8,-9,33,33,-21,33,-19,-42,33,-44,33,33,33,33,33,33,33,-38,-106,33,33,-104,33,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,33,-4,33,33,-10,-15,-60,33,-46,33,-48,-50,33,-52,-54,33,-56,-63,33,-39,33,-3,33,33,-58,-57,-40,33,33,-5,-59,33,33,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,16,18,19,20,21,22,23,27,28,29,30,31,32,33,34,35,36,39,40,41,47,49,50,51,52,53,54,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,76,77,78,79,80,81,84,85,87,88,91,92,93,94,95,96,97,98,99,101,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,140,141,142,145,147,148,149,150,151,152,153,154,155,156,157,158,161,162,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,219,221,222,223,224,225,227,228,229,231,232,234,236,],[34,34,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,34,34,34,34,-109,34,34,34,34,-101,-110,-111,-112,-113,-117,-118,-23,34,34,34,-6,34,-41,34,34,34,34,34,34,34,-70,-72,-74,34,-76,-89,34,34,-92,-96,-99,-114,-105,-24,34,34,34,34,-7,34,34,34,34,34,34,-20,34,34,-45,-49,-53,-61,-62,34,34,-107,-102,-103,-108,34,34,34,34,34,34,34,34,-75,34,34,34,34,34,34,34,34,-97,-98,34,34,34,34,34,34,34,34,-8,-9,34,34,-21,34,-19,-42,34,-44,34,34,34,34,34,34,34,-38,-106,34,34,-104,34,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,34,-4,34,34,-10,-15,-60,34,-46,34,-48,-50,34,-52,-54,34,-56,-63,34,-39,34,-3,34,34,-58,-57,-40,34,34,-5,-59,34,34,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,49,59,60,61,63,64,67,68,69,70,71,72,93,94,95,96,97,101,106,107,110,119,128,129,150,151,152,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,198,199,202,203,204,205,206,207,208,209,210,211,221,224,225,231,232,],[0,-1,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,-42,-43,-44,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,-4,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-3,-58,-57,-5,-59,]),'SEMICOLON':([2,3,4,5,6,7,8,9,10,11,12,13,20,28,29,30,31,32,33,34,35,40,41,43,44,47,49,59,60,61,63,64,67,68,69,70,71,72,78,82,88,93,94,95,96,97,101,106,107,110,119,128,129,134,137,140,141,142,143,144,145,147,149,150,151,152,161,162,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,198,199,200,202,203,204,205,206,207,208,209,210,211,214,221,222,224,225,227,231,232,],[36,-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-101,-110,-111,-112,-113,-117,-118,-23,79,-6,83,-11,87,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,-7,-12,-20,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,36,36,-8,-9,36,-13,-14,36,-21,-19,-42,-43,-44,213,-38,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,36,-4,-10,-15,-60,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-39,-3,36,-58,-57,-40,-5,-59,]),'CLOSECURLY':([3,4,5,6,7,8,9,10,11,12,13,20,24,25,28,29,30,31,32,33,34,35,49,59,60,61,63,64,67,68,69,70,71,72,93,94,95,96,97,101,106,107,110,119,128,129,134,137,142,145,150,151,152,159,160,163,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,198,199,202,203,204,205,206,207,208,209,210,211,212,221,222,224,225,226,230,231,232,238,239,],[-22,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,-23,-41,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-24,-45,-49,-53,-61,-62,-107,-102,-103,-108,-75,-97,-98,192,194,198,199,-42,-43,-44,211,-35,-99,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-2,221,-4,-10,-15,-46,-47,-48,-50,-51,-52,-54,-55,-56,-63,-36,-3,231,-58,-57,-37,237,-5,-59,240,241,]),'DOT':([20,24,25,26,28,29,30,31,32,33,34,69,70,71,101,105,106,107,110,139,163,164,167,170,191,196,],[-109,-114,-105,56,-101,-110,-111,-112,-113,-117,-118,56,-114,-105,-107,-114,-102,-103,-108,-105,56,-114,-106,-104,56,-105,]),'OPENBRACKET':([20,24,25,26,28,29,30,31,32,33,34,69,70,71,101,105,106,107,110,139,163,164,167,170,191,196,],[-109,-114,-105,57,-101,-110,-111,-112,-113,-117,-118,57,-114,-105,-107,-114,-102,-103,-108,-105,57,-114,-106,-104,57,-105,]),'POWER':([20,24,25,28,29,30,31,32,33,34,69,70,71,101,105,106,107,110,163,164,167,170,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,133,-114,-105,-107,-114,-102,-103,-108,133,-114,-106,-104,]),'TIMES':([20,24,25,28,29,30,31,32,33,34,67,68,69,70,71,101,105,106,107,110,128,129,163,164,167,170,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,130,-96,-99,-114,-105,-107,-114,-102,-103,-108,-97,-98,-99,-114,-106,-104,-100,]),'DIV':([20,24,25,28,29,30,31,32,33,34,67,68,69,70,71,101,105,106,107,110,128,129,163,164,167,170,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,131,-96,-99,-114,-105,-107,-114,-102,-103,-108,-97,-98,-99,-114,-106,-104,-100,]),'MOD':([20,24,25,28,29,30,31,32,33,34,67,68,69,70,71,101,105,106,107,110,128,129,163,164,167,170,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,132,-96,-99,-114,-105,-107,-114,-102,-103,-108,-97,-98,-99,-114,-106,-104,-100,]),'PLUS':([20,24,25,27,28,29,30,31,32,33,34,50,51,52,53,54,55,57,59,60,61,62,63,64,67,68,69,70,71,80,84,91,96,97,98,99,101,105,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,148,153,155,157,161,162,163,164,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,211,213,214,219,223,227,228,229,234,236,],[-109,-114,-105,65,-101,-110,-111,-112,-113,-117,-118,65,65,65,65,65,65,65,-70,-72,-74,65,-76,126,-92,-96,-99,-114,-105,65,65,65,-61,-62,65,65,-107,-114,-102,-103,-108,65,65,65,65,65,65,65,65,-75,65,65,65,65,65,65,65,65,-97,-98,65,65,65,65,65,65,65,65,-38,-99,-114,-106,65,65,-104,65,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,65,65,-63,65,-39,65,65,-40,65,65,65,65,]),'MINUS':([20,24,25,27,28,29,30,31,32,33,34,50,51,52,53,54,55,57,59,60,61,62,63,64,67,68,69,70,71,80,84,91,96,97,98,99,101,105,106,107,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,148,153,155,157,161,162,163,164,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,211,213,214,219,223,227,228,229,234,236,],[-109,-114,-105,66,-101,-110,-111,-112,-113,-117,-118,66,66,66,66,66,66,66,-70,-72,-74,66,-76,127,-92,-96,-99,-114,-105,66,66,66,-61,-62,66,66,-107,-114,-102,-103,-108,66,66,66,66,66,66,66,66,-75,66,66,66,66,66,66,66,66,-97,-98,66,66,66,66,66,66,66,66,-38,-99,-114,-106,66,66,-104,66,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,66,66,-63,66,-39,66,66,-40,66,66,66,66,]),'EQEQUAL':([20,24,25,28,29,30,31,32,33,34,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,113,120,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,113,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'NOTEQUAL':([20,24,25,28,29,30,31,32,33,34,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,114,121,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,114,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'LESSEQ':([20,24,25,28,29,30,31,32,33,34,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,115,122,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,115,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'LESS':([20,24,25,28,29,30,31,32,33,34,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,116,123,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,116,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'GREATEREQ':([20,24,25,28,29,30,31,32,33,34,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,117,124,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,117,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'GREATER':([20,24,25,28,29,30,31,32,33,34,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,118,125,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,118,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'AND':([20,24,25,28,29,30,31,32,33,34,60,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,112,-74,-76,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,-75,-97,-98,-99,-114,-106,-104,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'OR':([20,24,25,28,29,30,31,32,33,34,59,60,61,63,64,67,68,69,70,71,101,105,106,107,110,119,128,129,163,164,167,170,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-114,-105,-101,-110,-111,-112,-113,-117,-118,111,-72,-74,-76,-89,-92,-96,-99,-114,-105,-107,-114,-102,-103,-108,-75,-97,-98,-99,-114,-106,-104,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'CLOSEPAREN':([20,28,29,30,31,32,33,34,55,58,59,60,61,63,64,67,68,69,70,71,100,101,102,103,104,105,106,107,110,119,128,129,164,165,166,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,217,218,233,235,237,240,241,],[-109,-101,-110,-111,-112,-113,-117,-118,101,110,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,167,-107,-121,-119,-120,-114,-102,-103,-108,-75,-97,-98,215,110,216,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-122,-64,-65,-66,-67,-68,-69,]),'WEIGHT':([20,28,29,30,31,32,33,34,49,59,60,61,63,64,67,68,69,70,71,93,94,95,101,106,107,110,119,128,129,151,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,203,206,209,224,232,],[-109,-101,-110,-111,-112,-113,-117,-118,91,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,153,155,157,-107,-102,-103,-108,-75,-97,-98,201,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,201,201,201,-58,-59,]),'BY':([20,28,29,30,31,32,33,34,40,41,49,59,60,61,63,64,67,68,69,70,71,78,93,94,95,101,106,107,110,119,128,129,140,141,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,],[-109,-101,-110,-111,-112,-113,-117,-118,77,-6,92,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-7,154,156,158,-107,-102,-103,-108,-75,-97,-98,-8,-9,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,]),'COMMA':([20,28,29,30,31,32,33,34,37,38,59,60,61,63,64,67,68,69,70,71,75,100,101,102,103,104,105,106,107,108,109,110,119,128,129,135,164,165,166,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,217,218,220,233,235,237,240,241,],[-109,-101,-110,-111,-112,-113,-117,-118,74,-115,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,74,168,-107,-121,-119,-120,-114,-102,-103,171,-123,-108,-75,-97,-98,-116,-114,-119,168,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-122,-64,-124,-65,-66,-67,-68,-69,]),'CLOSEBRACKET':([20,28,29,30,31,32,33,34,59,60,61,63,64,67,68,69,70,71,101,106,107,108,109,110,119,128,129,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,220,],[-109,-101,-110,-111,-112,-113,-117,-118,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,-107,-102,-103,170,-123,-108,-75,-97,-98,-106,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-124,]),'OPENCURLY':([20,28,29,30,31,32,33,34,37,38,40,41,43,44,46,47,54,59,60,61,63,64,67,68,69,70,71,75,78,82,86,88,101,106,107,110,119,128,129,135,138,140,141,143,144,146,147,149,167,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,200,224,228,229,232,],[-109,-101,-110,-111,-112,-113,-117,-118,73,-115,76,-6,81,-11,85,-16,98,-70,-72,-74,-76,-89,-92,-96,-99,-114,-105,136,-7,-12,-17,-20,-107,-102,-103,-108,-75,-97,-98,-116,195,-8,-9,-13,-14,-18,-21,-19,-106,219,-104,-71,-73,-78,-80,-82,-84,-86,-88,-77,-79,-81,-83,-85,-87,-90,-91,-93,-94,-95,-100,-60,-58,234,236,-59,]),'COLONEQ':([24,25,89,101,167,],[53,54,148,-107,-106,]),'COLON':([33,34,42,48,],[-117,-118,80,90,]),'IN':([45,],[84,]),'LEFTARROW':([101,139,167,196,],[-107,197,-106,223,]),'RIGHTARROW':([105,164,215,216,],[169,169,228,229,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'suite':([0,],[1,]),'block':([0,73,76,81,85,136,195,],[2,134,137,142,145,193,222,]),'statement':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[3,35,72,3,3,3,3,35,3,35,35,35,35,3,35,]),'source':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'notsource':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'region':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'for':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'vary':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'count':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'sum':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'profile':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'fraction':([0,2,36,73,76,81,85,134,136,137,142,145,193,195,222,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'assignment':([0,2,36,73,76,81,85,98,134,136,137,142,145,161,193,195,213,219,222,234,236,],[13,13,13,13,13,13,13,162,13,13,13,13,13,214,13,13,227,162,13,162,162,]),'string':([0,2,14,16,18,19,21,22,23,27,36,39,40,47,50,51,52,53,54,55,57,62,65,66,73,74,76,77,79,80,81,84,85,87,91,92,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,130,131,132,133,134,136,137,138,142,145,148,151,153,154,155,156,157,158,161,168,169,171,193,195,197,201,203,206,209,213,219,222,223,228,229,234,236,],[20,20,38,42,48,49,50,51,52,20,20,38,42,48,20,20,20,20,20,20,20,20,20,20,20,135,20,20,42,20,20,20,20,48,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'call':([0,2,27,36,50,51,52,53,54,55,57,62,65,66,73,76,77,80,81,84,85,91,92,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,130,131,132,133,134,136,137,138,142,145,148,151,153,154,155,156,157,158,161,168,169,171,193,195,197,201,203,206,209,213,219,222,223,228,229,234,236,],[25,25,71,25,71,71,71,71,71,71,71,71,71,71,25,25,139,71,25,71,25,71,139,25,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,25,25,25,196,25,25,71,196,71,139,71,139,71,139,25,71,71,71,25,25,71,71,196,196,196,25,25,25,71,71,71,25,25,]),'trailer':([0,2,27,36,50,51,52,53,54,55,57,62,65,66,73,76,77,80,81,84,85,91,92,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,130,131,132,133,134,136,137,138,142,145,148,151,153,154,155,156,157,158,161,168,169,171,193,195,197,201,203,206,209,213,219,222,223,228,229,234,236,],[26,26,69,26,69,69,69,69,69,69,69,69,69,69,26,26,26,69,26,69,26,69,26,163,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,191,26,26,26,26,26,26,69,26,69,26,69,26,69,26,163,69,69,69,26,26,69,69,26,26,26,163,163,26,69,69,69,163,163,]),'atom':([0,2,27,36,50,51,52,53,54,55,57,62,65,66,73,76,77,80,81,84,85,91,92,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,130,131,132,133,134,136,137,138,142,145,148,151,153,154,155,156,157,158,161,168,169,171,193,195,197,201,203,206,209,213,219,222,223,228,229,234,236,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'stringlist':([14,39,],[37,75,]),'namepredicates':([16,],[40,]),'namepredicate':([16,40,79,],[41,78,140,]),'loopvars':([17,],[43,]),'loopvar':([17,43,83,],[44,82,143,]),'variations':([18,47,87,],[46,86,146,]),'namedassignments':([18,47,87,],[47,47,47,]),'expression':([27,50,51,52,53,54,55,57,80,84,91,98,99,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[58,93,94,95,96,97,103,109,141,144,150,160,165,200,202,205,208,212,103,218,220,224,225,226,160,232,233,235,160,160,]),'andchain':([27,50,51,52,53,54,55,57,80,84,91,98,99,111,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[59,59,59,59,59,59,59,59,59,59,59,59,59,172,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'notchain':([27,50,51,52,53,54,55,57,80,84,91,98,99,111,112,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,173,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'compare':([27,50,51,52,53,54,55,57,62,80,84,91,98,99,111,112,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[61,61,61,61,61,61,61,61,119,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'arith':([27,50,51,52,53,54,55,57,62,80,84,91,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,174,175,176,177,178,179,180,181,182,183,184,185,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'term':([27,50,51,52,53,54,55,57,62,80,84,91,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,186,187,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'factor':([27,50,51,52,53,54,55,57,62,80,84,91,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,130,131,132,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,188,189,190,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'power':([27,50,51,52,53,54,55,57,62,65,66,80,84,91,98,99,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,130,131,132,148,153,155,157,161,168,169,171,197,201,213,219,223,228,229,234,236,],[68,68,68,68,68,68,68,68,68,128,129,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'onlyassignment':([47,87,90,],[88,147,149,]),'arglist':([55,99,],[100,166,]),'arg':([55,99,168,],[102,102,217,]),'inline':([55,99,168,],[104,104,104,]),'exprlist':([57,],[108,]),'axis':([77,92,154,156,158,],[138,151,203,206,209,]),'axisweight':([92,154,156,158,],[152,204,207,210,]),'body':([98,219,234,236,],[159,230,238,239,]),'assignments':([98,219,234,236,],[161,161,161,161,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> suite","S'",1,None,None,None),
+  ('suite -> block','suite',1,'p_suite_expression','parser.py',53),
+  ('source -> SOURCE stringlist OPENCURLY block CLOSECURLY','source',5,'p_source','parser.py',60),
+  ('notsource -> NOT SOURCE stringlist OPENCURLY block CLOSECURLY','notsource',6,'p_notsource','parser.py',65),
+  ('region -> REGION namepredicates OPENCURLY block CLOSECURLY','region',5,'p_region','parser.py',72),
+  ('region -> REGION namepredicates BY axis OPENCURLY block CLOSECURLY','region',7,'p_region_axis','parser.py',77),
+  ('namepredicates -> namepredicate','namepredicates',1,'p_namepredicates','parser.py',82),
+  ('namepredicates -> namepredicates namepredicate','namepredicates',2,'p_namepredicates_extend','parser.py',87),
+  ('namepredicates -> namepredicates SEMICOLON namepredicate','namepredicates',3,'p_namepredicates_extend_semi','parser.py',94),
+  ('namepredicate -> string COLON expression','namepredicate',3,'p_namepredicate','parser.py',100),
+  ('for -> FOR loopvars OPENCURLY block CLOSECURLY','for',5,'p_for','parser.py',107),
+  ('loopvars -> loopvar','loopvars',1,'p_loopvars','parser.py',112),
+  ('loopvars -> loopvars loopvar','loopvars',2,'p_loopvars_extend','parser.py',117),
+  ('loopvars -> loopvars SEMICOLON loopvar','loopvars',3,'p_loopvars_extend_semi','parser.py',124),
+  ('loopvar -> IDENTIFIER IN expression','loopvar',3,'p_loopvar','parser.py',130),
+  ('vary -> VARY variations OPENCURLY block CLOSECURLY','vary',5,'p_vary','parser.py',136),
+  ('variations -> namedassignments','variations',1,'p_variations','parser.py',142),
+  ('variations -> namedassignments variations','variations',2,'p_variations_extend','parser.py',150),
+  ('variations -> namedassignments SEMICOLON variations','variations',3,'p_variations_extend_semi','parser.py',157),
+  ('namedassignments -> string COLON onlyassignment','namedassignments',3,'p_namedassignments','parser.py',163),
+  ('namedassignments -> namedassignments onlyassignment','namedassignments',2,'p_namedassignments_extend','parser.py',168),
+  ('namedassignments -> namedassignments SEMICOLON onlyassignment','namedassignments',3,'p_namedassignments_extend_semi','parser.py',175),
+  ('block -> statement','block',1,'p_block','parser.py',185),
+  ('block -> block statement','block',2,'p_block_extend','parser.py',190),
+  ('block -> block SEMICOLON statement','block',3,'p_block_extend_semi','parser.py',198),
+  ('statement -> source','statement',1,'p_statement','parser.py',210),
+  ('statement -> notsource','statement',1,'p_statement','parser.py',211),
+  ('statement -> region','statement',1,'p_statement','parser.py',212),
+  ('statement -> for','statement',1,'p_statement','parser.py',213),
+  ('statement -> vary','statement',1,'p_statement','parser.py',214),
+  ('statement -> count','statement',1,'p_statement','parser.py',215),
+  ('statement -> sum','statement',1,'p_statement','parser.py',216),
+  ('statement -> profile','statement',1,'p_statement','parser.py',217),
+  ('statement -> fraction','statement',1,'p_statement','parser.py',218),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',219),
+  ('body -> expression','body',1,'p_body_expression','parser.py',225),
+  ('body -> assignments expression','body',2,'p_body_assignments','parser.py',230),
+  ('body -> assignments SEMICOLON expression','body',3,'p_body_assignments_semi','parser.py',237),
+  ('assignments -> assignment','assignments',1,'p_assignments','parser.py',243),
+  ('assignments -> assignments assignment','assignments',2,'p_assignments_extend','parser.py',248),
+  ('assignments -> assignments SEMICOLON assignment','assignments',3,'p_assignments_extend_semi','parser.py',255),
+  ('count -> COUNT string','count',2,'p_count','parser.py',263),
+  ('count -> COUNT string WEIGHT expression','count',4,'p_count_weight','parser.py',268),
+  ('count -> COUNT string BY axis','count',4,'p_count_axis','parser.py',273),
+  ('count -> COUNT string BY axisweight','count',4,'p_count_axisweight','parser.py',278),
+  ('sum -> SUM string expression','sum',3,'p_sum','parser.py',286),
+  ('sum -> SUM string expression WEIGHT expression','sum',5,'p_sum_weight','parser.py',291),
+  ('sum -> SUM string expression BY axis','sum',5,'p_sum_axis','parser.py',296),
+  ('sum -> SUM string expression BY axisweight','sum',5,'p_sum_axisweight','parser.py',301),
+  ('profile -> PROFILE string expression','profile',3,'p_profile','parser.py',309),
+  ('profile -> PROFILE string expression WEIGHT expression','profile',5,'p_profile_weight','parser.py',314),
+  ('profile -> PROFILE string expression BY axis','profile',5,'p_profile_axis','parser.py',319),
+  ('profile -> PROFILE string expression BY axisweight','profile',5,'p_profile_axisweight','parser.py',324),
+  ('fraction -> FRACTION string expression','fraction',3,'p_fraction','parser.py',332),
+  ('fraction -> FRACTION string expression WEIGHT expression','fraction',5,'p_fraction_weight','parser.py',337),
+  ('fraction -> FRACTION string expression BY axis','fraction',5,'p_fraction_axis','parser.py',342),
+  ('fraction -> FRACTION string expression BY axisweight','fraction',5,'p_fraction_axisweight','parser.py',347),
+  ('axisweight -> axis WEIGHT expression','axisweight',3,'p_axisweight','parser.py',355),
+  ('axis -> call LEFTARROW expression','axis',3,'p_axis_single','parser.py',360),
+  ('axis -> axis call LEFTARROW expression','axis',4,'p_axis_extend','parser.py',365),
+  ('onlyassignment -> IDENTIFIER COLONEQ expression','onlyassignment',3,'p_onlyassignment','parser.py',373),
+  ('assignment -> IDENTIFIER COLONEQ expression','assignment',3,'p_assignment','parser.py',378),
+  ('assignment -> call COLONEQ expression','assignment',3,'p_assignment_call_expression','parser.py',383),
+  ('assignment -> call COLONEQ OPENCURLY body CLOSECURLY','assignment',5,'p_assignment_call_body','parser.py',388),
+  ('inline -> IDENTIFIER RIGHTARROW expression','inline',3,'p_inline_identifier','parser.py',395),
+  ('inline -> OPENPAREN IDENTIFIER CLOSEPAREN RIGHTARROW expression','inline',5,'p_inline_identifier_','parser.py',400),
+  ('inline -> OPENPAREN arglist CLOSEPAREN RIGHTARROW expression','inline',5,'p_inline_arglist','parser.py',405),
+  ('inline -> IDENTIFIER RIGHTARROW OPENCURLY body CLOSECURLY','inline',5,'p_inline_identifier_body','parser.py',410),
+  ('inline -> OPENPAREN IDENTIFIER CLOSEPAREN RIGHTARROW OPENCURLY body CLOSECURLY','inline',7,'p_inline_identifier_body_','parser.py',415),
+  ('inline -> OPENPAREN arglist CLOSEPAREN RIGHTARROW OPENCURLY body CLOSECURLY','inline',7,'p_inline_arglist_body','parser.py',420),
+  ('expression -> andchain','expression',1,'p_expression','parser.py',427),
+  ('expression -> andchain OR andchain','expression',3,'p_expression_','parser.py',432),
+  ('andchain -> notchain','andchain',1,'p_andchain','parser.py',439),
+  ('andchain -> notchain AND notchain','andchain',3,'p_andchain_','parser.py',444),
+  ('notchain -> compare','notchain',1,'p_notchain','parser.py',451),
+  ('notchain -> NOT compare','notchain',2,'p_notchain_','parser.py',456),
+  ('compare -> arith','compare',1,'p_compare','parser.py',463),
+  ('compare -> arith EQEQUAL arith','compare',3,'p_compare_isequal','parser.py',468),
+  ('compare -> compare EQEQUAL arith','compare',3,'p_compare_isequal_chain','parser.py',473),
+  ('compare -> arith NOTEQUAL arith','compare',3,'p_compare_notequal','parser.py',479),
+  ('compare -> compare NOTEQUAL arith','compare',3,'p_compare_notequal_chain','parser.py',484),
+  ('compare -> arith LESSEQ arith','compare',3,'p_compare_lesseq','parser.py',490),
+  ('compare -> compare LESSEQ arith','compare',3,'p_compare_lesseq_chain','parser.py',495),
+  ('compare -> arith LESS arith','compare',3,'p_compare_less','parser.py',501),
+  ('compare -> compare LESS arith','compare',3,'p_compare_less_chain','parser.py',506),
+  ('compare -> arith GREATEREQ arith','compare',3,'p_compare_greatereq','parser.py',512),
+  ('compare -> compare GREATEREQ arith','compare',3,'p_compare_greatereq_chain','parser.py',517),
+  ('compare -> arith GREATER arith','compare',3,'p_compare_greater','parser.py',523),
+  ('compare -> compare GREATER arith','compare',3,'p_compare_greater_chain','parser.py',528),
+  ('arith -> term','arith',1,'p_arith','parser.py',536),
+  ('arith -> term PLUS term','arith',3,'p_arith_plus','parser.py',541),
+  ('arith -> term MINUS term','arith',3,'p_arith_minus','parser.py',546),
+  ('term -> factor','term',1,'p_term','parser.py',553),
+  ('term -> factor TIMES factor','term',3,'p_term_factor_times','parser.py',558),
+  ('term -> factor DIV factor','term',3,'p_term_factor_div','parser.py',563),
+  ('term -> factor MOD factor','term',3,'p_term_factor_mod','parser.py',568),
+  ('factor -> power','factor',1,'p_factor','parser.py',575),
+  ('factor -> PLUS power','factor',2,'p_factor_unaryplus','parser.py',580),
+  ('factor -> MINUS power','factor',2,'p_factor_unaryminus','parser.py',585),
+  ('power -> trailer','power',1,'p_power','parser.py',592),
+  ('power -> trailer POWER trailer','power',3,'p_power_trailer','parser.py',597),
+  ('trailer -> atom','trailer',1,'p_trailer_atom','parser.py',604),
+  ('trailer -> trailer DOT IDENTIFIER','trailer',3,'p_trailer_attribute','parser.py',609),
+  ('trailer -> trailer DOT SUM','trailer',3,'p_trailer_attribute_sum','parser.py',614),
+  ('trailer -> trailer OPENBRACKET exprlist CLOSEBRACKET','trailer',4,'p_trailer_subscript','parser.py',619),
+  ('trailer -> call','trailer',1,'p_trailer_call','parser.py',624),
+  ('call -> trailer OPENPAREN arglist CLOSEPAREN','call',4,'p_call_arglist','parser.py',629),
+  ('call -> trailer OPENPAREN CLOSEPAREN','call',3,'p_call_arglist_empty','parser.py',634),
+  ('atom -> OPENPAREN expression CLOSEPAREN','atom',3,'p_atom_parens','parser.py',641),
+  ('atom -> string','atom',1,'p_atom_literal_string','parser.py',646),
+  ('atom -> FLOAT_NUMBER','atom',1,'p_atom_literal_floatnumber','parser.py',651),
+  ('atom -> DEC_NUMBER','atom',1,'p_atom_literal_decnumber','parser.py',656),
+  ('atom -> TRUE','atom',1,'p_atom_literal_true','parser.py',661),
+  ('atom -> FALSE','atom',1,'p_atom_literal_false','parser.py',666),
+  ('atom -> IDENTIFIER','atom',1,'p_atom_identifier','parser.py',671),
+  ('stringlist -> string','stringlist',1,'p_stringlist','parser.py',678),
+  ('stringlist -> stringlist COMMA string','stringlist',3,'p_stringlist_extend','parser.py',683),
+  ('string -> MULTILINESTRING','string',1,'p_string_literal_multilinestring','parser.py',689),
+  ('string -> STRING','string',1,'p_string_literal_string','parser.py',694),
+  ('arg -> expression','arg',1,'p_arg_expression','parser.py',701),
+  ('arg -> inline','arg',1,'p_arg_inline','parser.py',706),
+  ('arglist -> arg','arglist',1,'p_arglist_single','parser.py',711),
+  ('arglist -> arglist COMMA arg','arglist',3,'p_arglist_extend','parser.py',716),
+  ('exprlist -> expression','exprlist',1,'p_exprlist_single','parser.py',722),
+  ('exprlist -> exprlist COMMA expression','exprlist',3,'p_exprlist_extend','parser.py',727),
+]
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+import collections
+import os
+import struct
+import threading
+import zipfile
+
+import numpy
+
+import adl.columnar
+
+###################################################### memory-mapped NumPy columns
+
+def mapnpy(path):
+    return numpy.load(path, mmap_mode="r", allow_pickle=False)
+
+def mapnpz(path):
+    # numpy.load ignores mmap_mode for .npz, so uncompressed members are mapped by their offset in the zip file
+    out = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            name = info.filename[:-4]
+
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    out[name] = numpy.lib.format.read_array(member, allow_pickle=False)
+                continue
+
+            file.seek(info.header_offset)
+            header = struct.unpack("<4s2B4HL2L2H", file.read(30))
+            file.seek(info.header_offset + 30 + header[10] + header[11])
+            version = numpy.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran, dtype = numpy.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran, dtype = numpy.lib.format.read_array_header_2_0(file)
+
+            if dtype.hasobject:
+                raise ValueError("{0} in {1} holds Python objects, which cannot be memory-mapped".format(repr(info.filename), repr(path)))
+            out[name] = numpy.memmap(path, dtype=dtype, mode="r", offset=file.tell(), shape=shape, order="F" if fortran else "C")
+
+    return out
+
+def assemble(arrays):
+    # "name.offsets" + "name.content" pairs become JaggedArrays named "name"
+    out = {}
+    for n, x in arrays.items():
+        if n.endswith(".offsets") and n[:-8] + ".content" in arrays:
+            out[n[:-8]] = adl.columnar.JaggedArray(x, arrays[n[:-8] + ".content"])
+        elif n.endswith(".content") and n[:-8] + ".offsets" in arrays:
+            pass
+        else:
+            out[n] = x
+    return out
+
+class ColumnReader(object):
+    def __init__(self, path):
+        self.path = path
+        if os.path.isdir(path):
+            arrays = {}
+            for filename in sorted(os.listdir(path)):
+                if filename.endswith(".npy"):
+                    arrays[filename[:-4]] = mapnpy(os.path.join(path, filename))
+
+        elif path.endswith(".npz"):
+            arrays = mapnpz(path)
+
+        elif path.endswith(".npy"):
+            array = mapnpy(path)
+            if array.dtype.names is not None:
+                arrays = {n: array[n] for n in array.dtype.names}
+            else:
+                arrays = {os.path.splitext(os.path.basename(path))[0]: array}
+
+        else:
+            raise ValueError("expected a .npy file, a .npz file, or a directory of .npy files, not {0}".format(repr(path)))
+
+        self.arrays = assemble(arrays)
+        lengths = set(len(x) for x in self.arrays.values())
+        if len(lengths) > 1:
+            raise ValueError("columns in {0} have different lengths: {1}".format(repr(path), ", ".join("{0} ({1})".format(n, len(x)) for n, x in sorted(self.arrays.items()))))
+
+    def __repr__(self):
+        return "<ColumnReader {0} ({1} columns, {2} events)>".format(repr(self.path), len(self.arrays), len(self))
+
+    @property
+    def columns(self):
+        return sorted(self.arrays)
+
+    def __len__(self):
+        for x in self.arrays.values():
+            return len(x)
+        return 0
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def chunks(self, size, columns=None, start=0, stop=None):
+        if size <= 0:
+            raise ValueError("chunk size must be positive")
+        if columns is None:
+            columns = self.columns
+        else:
+            missing = [n for n in columns if n not in self.arrays]
+            if len(missing) > 0:
+                raise KeyError("no columns named {0} in {1}".format(", ".join(repr(n) for n in missing), repr(self.path)))
+        if stop is None or stop > len(self):
+            stop = len(self)
+
+        # slices of memory-mapped arrays are views: nothing is read until the interpreter touches it
+        for i in range(start, stop, size):
+            j = min(i + size, stop)
+            yield {n: self.arrays[n][i:j] for n in columns}
+
+###################################################### background prefetching
+
+def chunkbytes(chunk):
+    out = 0
+    for x in chunk.values():
+        if isinstance(x, adl.columnar.JaggedArray):
+            out += x.offsets.nbytes + (x.offsets[-1] - x.offsets[0]) * x.content.itemsize
+        elif isinstance(x, numpy.ndarray):
+            out += x.nbytes
+        elif not callable(x):
+            try:
+                out += 8 * len(x)
+            except TypeError:
+                pass
+    return out
+
+def materialize(chunk):
+    # read memory-mapped slices into memory, so that the I/O happens in the prefetching thread
+    out = {}
+    for n, x in chunk.items():
+        if isinstance(x, adl.columnar.JaggedArray) and isinstance(x.content, numpy.memmap):
+            out[n] = adl.columnar.JaggedArray(x.offsets - x.offsets[0], numpy.array(x.content[x.offsets[0]:x.offsets[-1]]))
+        elif isinstance(x, numpy.memmap):
+            out[n] = numpy.array(x)
+        else:
+            out[n] = x
+    return out
+
+class Prefetcher(object):
+    def __init__(self, chunks, depth=2, maxbytes=None, load=materialize):
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.chunks = chunks
+        self.depth = depth
+        self.maxbytes = maxbytes
+        self.load = load
+        self._queue = collections.deque()
+        self._bytes = 0
+        self._done = False
+        self._error = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._produce, name="adl-prefetch")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _full(self, size):
+        # always admit one chunk, so that a chunk larger than maxbytes cannot stall the pipeline
+        if len(self._queue) == 0:
+            return False
+        return len(self._queue) >= self.depth or (self.maxbytes is not None and self._bytes + size > self.maxbytes)
+
+    def _produce(self):
+        try:
+            for chunk in self.chunks:
+                if self.load is not None:
+                    chunk = self.load(chunk)
+                size = chunkbytes(chunk)
+                with self._condition:
+                    while not self._closed and self._full(size):
+                        self._condition.wait()
+                    if self._closed:
+                        return
+                    self._queue.append((chunk, size))
+                    self._bytes += size
+                    self._condition.notify_all()
+        except Exception as err:
+            with self._condition:
+                self._error = err
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._condition:
+            while len(self._queue) == 0 and not self._done:
+                self._condition.wait()
+            if len(self._queue) > 0:
+                chunk, size = self._queue.popleft()
+                self._bytes -= size
+                self._condition.notify_all()
+                return chunk
+            elif self._error is not None:
+                err, self._error = self._error, None
+                raise err
+            else:
+                raise StopIteration
+
+    next = __next__
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._bytes = 0
+            self._condition.notify_all()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,15 +1,86 @@
 #!/usr/bin/env python
 
+import array
+import bisect
+
 import adl.error
 
-class AST(object):
-    def __init__(self, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
+###################################################### source positions
+
+class Positions(object):
+    # one per document: the source text, the start of each line, and the (lo, hi) span of each node,
+    # which is only turned into line and column numbers when an error message needs them
+    __slots__ = ("code", "linepos", "lo", "hi")
+
+    def __init__(self, code, linepos=None):
+        if linepos is None:
+            linepos = [0] + [i + 1 for i, c in enumerate(code) if c == "\n"]
         self.code = code
-        self.lexspan = lexspan
-        self.lineno = lineno
-        self.col_offset = col_offset
-        self.lineno2 = lineno2
-        self.col_offset2 = col_offset2
+        self.linepos = linepos
+        self.lo = array.array("l")
+        self.hi = array.array("l")
+
+    def __repr__(self):
+        return "<Positions of {0} nodes in {1} lines>".format(len(self.lo), len(self.linepos))
+
+    def __getstate__(self):
+        return (self.code, self.linepos, self.lo, self.hi)
+
+    def __setstate__(self, state):
+        self.code, self.linepos, self.lo, self.hi = state
+
+    def add(self, lo, hi):
+        self.lo.append(lo)
+        self.hi.append(hi)
+        return len(self.lo) - 1
+
+    def linecol(self, pos):
+        lineno = bisect.bisect_right(self.linepos, pos)
+        return lineno, pos - self.linepos[lineno - 1]
+
+    def location(self, index):
+        lineno, col_offset = self.linecol(self.lo[index])
+        lineno2, col_offset2 = self.linecol(self.hi[index])
+        return self.code, lineno, col_offset, lineno2, col_offset2
+
+def syntaxerror(message, positions, index):
+    if positions is None:
+        return adl.error.ADLError(message)
+    else:
+        return adl.error.ADLSyntaxError(message, *positions.location(index))
+
+###################################################### syntax tree nodes
+
+class AST(object):
+    __slots__ = ("positions", "index")
+
+    def __init__(self, positions=None, index=None):
+        self.positions = positions
+        self.index = index
+
+    @property
+    def code(self):
+        return None if self.positions is None else self.positions.code
+
+    @property
+    def lexspan(self):
+        return None if self.positions is None else (self.positions.lo[self.index], self.positions.hi[self.index])
+
+    @property
+    def lineno(self):
+        return None if self.positions is None else self.positions.linecol(self.positions.lo[self.index])[0]
+
+    @property
+    def col_offset(self):
+        return None if self.positions is None else self.positions.linecol(self.positions.lo[self.index])[1]
+
+    @property
+    def lineno2(self):
+        return None if self.positions is None else self.positions.linecol(self.positions.hi[self.index])[0]
+
+    @property
+    def col_offset2(self):
+        return None if self.positions is None else self.positions.linecol(self.positions.hi[self.index])[1]
 
     def children(self):
         return []
@@ -19,13 +90,16 @@ class AST(object):
 
     def rightmost(self):
         return self
-    
+
     def walk(self, topdown=True):
-        yield self
+        # every node under this one (including itself), parents before children or after them
+        return preorder(self) if topdown else postorder(self)
 
 class LeftRight(AST):
-    def __init__(self, left, right, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(LeftRight, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("left", "right")
+
+    def __init__(self, left, right, positions=None, index=None):
+        super(LeftRight, self).__init__(positions=positions, index=index)
         self.left = left
         self.right = right
 
@@ -41,19 +115,11 @@ class LeftRight(AST):
     def rightmost(self):
         return self.right.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.left.walk(topdown=topdown):
-            yield x
-        for x in self.right.walk(topdown=topdown):
-            yield x
-        if not topdown:
-            yield self
-
 class Right(AST):
-    def __init__(self, right, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Right, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("right",)
+
+    def __init__(self, right, positions=None, index=None):
+        super(Right, self).__init__(positions=positions, index=index)
         self.right = right
 
     def __repr__(self):
@@ -68,15 +134,9 @@ class Right(AST):
     def rightmost(self):
         return self.right.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.right.walk(topdown=topdown):
-            yield x
-        if not topdown:
-            yield self
-
 class Special(AST):
+    __slots__ = ()
+
     def __repr__(self):
         return "{0}()".format(type(self).__name__)
 
@@ -89,58 +149,64 @@ class Special(AST):
     def __ne__(self, other):
         return not self.__eq__(other)
 
-class Attribute(Special): pass
-class Subscript(Special): pass
-class Or(Special): pass
-class And(Special): pass
-class Not(Special): pass
-class IsEqual(Special): pass
-class NotEqual(Special): pass
-class LessEq(Special): pass
-class Less(Special): pass
-class GreaterEq(Special): pass
-class Greater(Special): pass
-class Plus(Special): pass
-class Minus(Special): pass
-class Times(Special): pass
-class Div(Special): pass
-class Mod(Special): pass
-class UnaryPlus(Special): pass
-class UnaryMinus(Special): pass
-class Power(Special): pass
-
-class Expression(AST): pass
-class Statement(AST): pass
+class Attribute(Special): __slots__ = ()
+class Subscript(Special): __slots__ = ()
+class Or(Special): __slots__ = ()
+class And(Special): __slots__ = ()
+class Not(Special): __slots__ = ()
+class IsEqual(Special): __slots__ = ()
+class NotEqual(Special): __slots__ = ()
+class LessEq(Special): __slots__ = ()
+class Less(Special): __slots__ = ()
+class GreaterEq(Special): __slots__ = ()
+class Greater(Special): __slots__ = ()
+class Plus(Special): __slots__ = ()
+class Minus(Special): __slots__ = ()
+class Times(Special): __slots__ = ()
+class Div(Special): __slots__ = ()
+class Mod(Special): __slots__ = ()
+class UnaryPlus(Special): __slots__ = ()
+class UnaryMinus(Special): __slots__ = ()
+class Power(Special): __slots__ = ()
+
+class Expression(AST): __slots__ = ()
+class Statement(AST): __slots__ = ()
 
 class Literal(Expression):
-    def __init__(self, value, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Literal, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("value",)
+
+    def __init__(self, value, positions=None, index=None):
+        super(Literal, self).__init__(positions=positions, index=index)
         self.value = value
 
     def __repr__(self):
         return "{0}({1})".format(type(self).__name__, repr(self.value))
 
 class Identifier(Expression):
-    def __init__(self, name, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Identifier, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("name",)
+
+    def __init__(self, name, positions=None, index=None):
+        super(Identifier, self).__init__(positions=positions, index=index)
         self.name = name
 
     def __repr__(self):
         return "{0}({1})".format(type(self).__name__, repr(self.name))
 
 class Call(Expression):
+    __slots__ = ("function", "arguments")
+
     @classmethod
-    def maybe(cls, function, arguments, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
+    def maybe(cls, function, arguments, positions=None, index=None):
         import adl.interpreter
-        out = cls(function, arguments, code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+        out = cls(function, arguments, positions=positions, index=index)
         if ((isinstance(function, Special) and function in adl.interpreter.Run.special) or (isinstance(function, Identifier) and function.name in adl.interpreter.Run.builtins)) and all(isinstance(x, Literal) for x in arguments):
             symboltable = adl.interpreter.SymbolTable.root(adl.interpreter.Run.builtins, {})
-            return Literal(adl.interpreter.calculate(out, symboltable), code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+            return Literal(adl.interpreter.calculate(out, symboltable), positions=positions, index=index)
         else:
             return out
 
-    def __init__(self, function, arguments, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Call, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    def __init__(self, function, arguments, positions=None, index=None):
+        super(Call, self).__init__(positions=positions, index=index)
         self.function = function
         self.arguments = arguments
 
@@ -159,20 +225,11 @@ class Call(Expression):
         else:
             return self.function.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.function.walk(topdown=topdown):
-            yield x
-        for x in self.arguments:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Inline(AST):
-    def __init__(self, parameters, body, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Inline, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("parameters", "body")
+
+    def __init__(self, parameters, body, positions=None, index=None):
+        super(Inline, self).__init__(positions=positions, index=index)
         self.parameters = parameters
         self.body = body
 
@@ -188,21 +245,11 @@ class Inline(AST):
     def rightmost(self):
         return self.body[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.parameters:
-            for y in x.walk(topdown=topdown):
-                yield y
-        for x in self.body:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Define(Statement):
-    def __init__(self, target, expression, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Define, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("target", "expression")
+
+    def __init__(self, target, expression, positions=None, index=None):
+        super(Define, self).__init__(positions=positions, index=index)
         self.target = target
         self.expression = expression
 
@@ -218,23 +265,15 @@ class Define(Statement):
     def rightmost(self):
         return self.expression.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.target.walk(topdown=topdown):
-            yield x
-        for x in self.expression.walk(topdown=topdown):
-            yield x
-        if not topdown:
-            yield self
-
 class FunctionDefine(Statement):
-    def __init__(self, target, body, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(FunctionDefine, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("target", "body")
+
+    def __init__(self, target, body, positions=None, index=None):
+        super(FunctionDefine, self).__init__(positions=positions, index=index)
         if not isinstance(target.function, Identifier):
-            raise adl.error.ADLSyntaxError("function name in a function definition must be an identifier", code, lineno, col_offset, lineno2=lineno2, col_offset2=col_offset2)
+            raise syntaxerror("function name in a function definition must be an identifier", positions, index)
         if not all(isinstance(x, Identifier) for x in target.arguments):
-            raise adl.error.ADLSyntaxError("all parameters in a function definition must be identifiers", code, lineno, col_offset, lineno2=lineno2, col_offset2=col_offset2)
+            raise syntaxerror("all parameters in a function definition must be identifiers", positions, index)
         self.target = target
         self.body = body
         
@@ -250,20 +289,11 @@ class FunctionDefine(Statement):
     def rightmost(self):
         return self.body[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.target.walk(topdown=topdown):
-            yield x
-        for x in self.body:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Axis(AST):
-    def __init__(self, binning, expression, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Axis, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("binning", "expression")
+
+    def __init__(self, binning, expression, positions=None, index=None):
+        super(Axis, self).__init__(positions=positions, index=index)
         self.binning = binning
         self.expression = expression
 
@@ -279,24 +309,16 @@ class Axis(AST):
     def rightmost(self):
         return self.expression.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.binning.walk(topdown=topdown):
-            yield x
-        for x in self.expression.walk(topdown=topdown):
-            yield x
-        if not topdown:
-            yield self
-
-class CountStatistic(Special): pass
-class SumStatistic(Special): pass
-class ProfileStatistic(Special): pass
-class FractionStatistic(Special): pass
+class CountStatistic(Special): __slots__ = ()
+class SumStatistic(Special): __slots__ = ()
+class ProfileStatistic(Special): __slots__ = ()
+class FractionStatistic(Special): __slots__ = ()
 
 class Collect(Statement):
-    def __init__(self, statistic, name, expression, axes, weight, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Collect, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("statistic", "name", "expression", "axes", "weight")
+
+    def __init__(self, statistic, name, expression, axes, weight, positions=None, index=None):
+        super(Collect, self).__init__(positions=positions, index=index)
         self.statistic = statistic
         self.name = name
         self.expression = expression
@@ -307,7 +329,7 @@ class Collect(Statement):
         return "{0}({1}, {2}, {3}, {4}, {5})".format(type(self).__name__, repr(self.statistic), repr(self.name), repr(self.expression), repr(self.axes), repr(self.weight))
 
     def children(self):
-        return [self.statistic, self.name, self.expression] + self.axes + ([self.weight] if self.weight is not None else [])
+        return [self.statistic, self.name] + ([self.expression] if self.expression is not None else []) + self.axes + ([self.weight] if self.weight is not None else [])
 
     def leftmost(self):
         return self.name.leftmost()
@@ -322,28 +344,11 @@ class Collect(Statement):
         else:
             return self.weight.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.statistic.walk(topdown=topdown):
-            yield x
-        for x in self.name.walk(topdown=topdown):
-            yield x
-        if self.expression is not None:
-            for x in self.expression.walk(topdown=topdown):
-                yield x
-        for x in self.axes:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if self.weight is not None:
-            for x in self.weight.walk(topdown=topdown):
-                yield x
-        if not topdown:
-            yield self
-
 class For(Statement):
-    def __init__(self, loopvars, block, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(For, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("loopvars", "block")
+
+    def __init__(self, loopvars, block, positions=None, index=None):
+        super(For, self).__init__(positions=positions, index=index)
         self.loopvars = loopvars
         self.block = block
 
@@ -359,21 +364,11 @@ class For(Statement):
     def rightmost(self):
         return self.block[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.loopvars:
-            for y in x.walk(topdown=topdown):
-                yield y
-        for x in self.block:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Variation(AST):
-    def __init__(self, name, assignments, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Variation, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("name", "assignments")
+
+    def __init__(self, name, assignments, positions=None, index=None):
+        super(Variation, self).__init__(positions=positions, index=index)
         self.name = name
         self.assignments = assignments
 
@@ -389,20 +384,11 @@ class Variation(AST):
     def rightmost(self):
         return self.assignments[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.name.walk(topdown=topdown):
-            yield x
-        for x in self.assignments:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Vary(Statement):
-    def __init__(self, variations, block, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Vary, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("variations", "block")
+
+    def __init__(self, variations, block, positions=None, index=None):
+        super(Vary, self).__init__(positions=positions, index=index)
         self.variations = variations
         self.block = block
 
@@ -418,21 +404,11 @@ class Vary(Statement):
     def rightmost(self):
         return self.block[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.variations:
-            for y in x.walk(topdown=topdown):
-                yield y
-        for x in self.block:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class NamePredicate(AST):
-    def __init__(self, name, predicate, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(NamePredicate, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("name", "predicate")
+
+    def __init__(self, name, predicate, positions=None, index=None):
+        super(NamePredicate, self).__init__(positions=positions, index=index)
         self.name = name
         self.predicate = predicate
 
@@ -448,19 +424,11 @@ class NamePredicate(AST):
     def rightmost(self):
         return self.name.rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.name.walk(topdown=topdown):
-            yield x
-        for x in self.predicate.walk(topdown=topdown):
-            yield x
-        if not topdown:
-            yield self
-
 class Region(Statement):
-    def __init__(self, namepredicates, axes, block, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Region, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("namepredicates", "axes", "block")
+
+    def __init__(self, namepredicates, axes, block, positions=None, index=None):
+        super(Region, self).__init__(positions=positions, index=index)
         self.namepredicates = namepredicates
         self.axes = axes
         self.block = block
@@ -477,24 +445,11 @@ class Region(Statement):
     def rightmost(self):
         return self.block[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.namepredicates:
-            for y in x.walk(topdown=topdown):
-                yield y
-        for x in self.axes:
-            for y in x.walk(topdown=topdown):
-                yield y
-        for x in self.block:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Source(Statement):
-    def __init__(self, names, block, inclusive, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Source, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("names", "block", "inclusive")
+
+    def __init__(self, names, block, inclusive, positions=None, index=None):
+        super(Source, self).__init__(positions=positions, index=index)
         self.names = names
         self.block = block
         self.inclusive = inclusive
@@ -511,21 +466,11 @@ class Source(Statement):
     def rightmost(self):
         return self.block[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.names:
-            for y in x.walk(topdown=topdown):
-                yield y
-        for x in self.block:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
-
 class Suite(AST):
-    def __init__(self, block, code=None, lexspan=None, lineno=None, col_offset=None, lineno2=None, col_offset2=None):
-        super(Suite, self).__init__(code=code, lexspan=lexspan, lineno=lineno, col_offset=col_offset, lineno2=lineno2, col_offset2=col_offset2)
+    __slots__ = ("block",)
+
+    def __init__(self, block, positions=None, index=None):
+        super(Suite, self).__init__(positions=positions, index=index)
         self.block = block
 
     def __repr__(self):
@@ -540,11 +485,101 @@ class Suite(AST):
     def rightmost(self):
         return self.block[-1].rightmost()
 
-    def walk(self, topdown=True):
-        if topdown:
-            yield self
-        for x in self.block:
-            for y in x.walk(topdown=topdown):
-                yield y
-        if not topdown:
-            yield self
+###################################################### traversal
+
+# iterative, so that each node is handled once (O(n) for the whole tree) and deep trees cannot hit the recursion limit
+
+def preorder(node):
+    stack = [node]
+    while len(stack) > 0:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children()))
+
+def postorder(node):
+    stack = [(node, False)]
+    while len(stack) > 0:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+        else:
+            stack.append((node, True))
+            stack.extend((x, False) for x in reversed(node.children()))
+
+def fields(cls):
+    out = []
+    for x in reversed(cls.__mro__):
+        for n in x.__dict__.get("__slots__", ()):
+            if n not in ("positions", "index"):
+                out.append(n)
+    return tuple(out)
+
+class Visitor(object):
+    # calls visit_<ClassName>(node), or generic_visit(node), on every node; top-down, a method that
+    # returns False skips that node's children; bottom-up (topdown = False), children come first
+
+    topdown = True
+
+    def __init__(self):
+        self._methods = {}
+
+    def method(self, cls):
+        out = self._methods.get(cls)
+        if out is None:
+            out = self._methods[cls] = getattr(self, "visit_" + cls.__name__, self.generic_visit)
+        return out
+
+    def generic_visit(self, node):
+        pass
+
+    def visit(self, node):
+        if not self.topdown:
+            for x in postorder(node):
+                self.method(type(x))(x)
+            return
+        stack = [node]
+        while len(stack) > 0:
+            node = stack.pop()
+            if self.method(type(node))(node) is not False:
+                stack.extend(reversed(node.children()))
+
+class Transformer(Visitor):
+    # bottom-up: each node's fields are replaced by what visit_<ClassName> (or generic_visit) returned for them,
+    # then the node itself is passed to its method, whose return value replaces it; nodes are modified in place.
+    # A node reachable along several paths is transformed once.
+
+    topdown = False
+
+    def __init__(self):
+        super(Transformer, self).__init__()
+        self._fields = {}
+
+    def generic_visit(self, node):
+        return node
+
+    def visit(self, node):
+        done = {}   # id -> (original, replacement), holding the original so that its id is not reused
+        stack = [(node, False)]
+        while len(stack) > 0:
+            x, expanded = stack.pop()
+            if id(x) in done:
+                continue
+            if expanded:
+                self.substitute(x, done)
+                done[id(x)] = (x, self.method(type(x))(x))
+            else:
+                stack.append((x, True))
+                stack.extend((y, False) for y in reversed(x.children()) if id(y) not in done)
+        return done[id(node)][1]
+
+    def substitute(self, node, done):
+        cls = type(node)
+        names = self._fields.get(cls)
+        if names is None:
+            names = self._fields[cls] = fields(cls)
+        for n in names:
+            x = getattr(node, n)
+            if isinstance(x, AST):
+                setattr(node, n, done[id(x)][1])
+            elif isinstance(x, list):
+                x[:] = [done[id(y)][1] if isinstance(y, AST) else y for y in x]
@@ -1,10 +1,9 @@
 #!/usr/bin/env python
 
 import ast
+import bisect
 import re
 
-import ply.lex
-
 import adl.error
 
 class ADLLexer(object):
@@ -102,5 +101,162 @@ class ADLLexer(object):
         raise adl.error.ADLSyntaxError("illegal character", t.lexer.lexdata, len(t.lexer.linepos), t.lexer.lexpos - t.lexer.linepos[-1])
 
     def build(self, **kwargs):
+        # PLY is only needed to build this reference lexer; parsing uses ADLScanner
+        import ply.lex
         self.lexer = ply.lex.lex(module=self, **kwargs)
         self.lexer.linepos = [0]
+
+###################################################### hand-written scanner
+
+class Token(object):
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return "Token({0}, {1}, {2}, {3})".format(self.type, repr(self.value), self.lineno, self.lexpos)
+
+class ADLScanner(object):
+    # Produces the same tokens as ADLLexer in one left-to-right pass: every pattern below is anchored and
+    # cannot backtrack across other tokens, and a triple-quoted string ends at its first closing quotes.
+    # Line starts are computed once, so positions are found by bisection.
+
+    identifier = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+    floatnumber = re.compile(r"(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?|\d+[eE][-+]?\d+")
+    decnumber = re.compile(r"0+|[1-9][0-9]*")
+    strings = {"'": re.compile(r"'[^\n'\\]*(?:\\.[^\n'\\]*)*'"),
+               '"': re.compile(r'"[^\n"\\]*(?:\\.[^\n"\\]*)*"')}
+    digits = frozenset("0123456789")
+    ignore = frozenset(" \t\f\r")
+
+    operators2 = {":=": "COLONEQ", "<-": "LEFTARROW", "=>": "RIGHTARROW", "==": "EQEQUAL", "!=": "NOTEQUAL",
+                  "<=": "LESSEQ", ">=": "GREATEREQ", "**": "POWER"}
+    operators1 = {":": "COLON", "<": "LESS", ">": "GREATER", "+": "PLUS", "-": "MINUS", "*": "TIMES", "/": "DIV",
+                  "%": "MOD", "(": "OPENPAREN", ")": "CLOSEPAREN", "[": "OPENBRACKET", "]": "CLOSEBRACKET",
+                  "{": "OPENCURLY", "}": "CLOSECURLY", ".": "DOT", ",": "COMMA", ";": "SEMICOLON"}
+
+    def __init__(self):
+        self.input("")
+
+    def clone(self):
+        return self.__class__()
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self.lineno = 1
+        self.linepos = [0]
+        i = data.find("\n")
+        while i != -1:
+            self.linepos.append(i + 1)
+            i = data.find("\n", i + 1)
+        self._tokens = self.scan()
+
+    def linecol(self, pos):
+        lineno = bisect.bisect_right(self.linepos, pos)
+        return lineno, pos - self.linepos[lineno - 1]
+
+    def token(self):
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def error(self, message, pos):
+        raise adl.error.ADLSyntaxError(message, self.lexdata, *self.linecol(pos))
+
+    def triplestring(self, pos):
+        # end of a triple-quoted string starting at pos, or -1 if it is not closed
+        data = self.lexdata
+        quote = data[pos:pos + 3]
+        i = pos + 3
+        close = data.find(quote, i)
+        while close != -1:
+            backslash = data.find("\\", i, close)
+            if backslash == -1:
+                return close + 3
+            i = backslash + 2
+            if i > close:
+                close = data.find(quote, i)
+        return -1
+
+    def literal(self, text, quotes):
+        body = text[quotes:-quotes]
+        if "\\" not in body:
+            return body
+        else:
+            return ast.literal_eval(text)
+
+    def scan(self):
+        data = self.lexdata
+        length = len(data)
+        pos = 0
+        linepos = self.linepos
+        lineno = 1
+
+        while pos < length:
+            c = data[pos]
+
+            if c in self.ignore:
+                pos += 1
+                continue
+
+            elif c == "\n":
+                pos += 1
+                continue
+
+            elif c == "#":
+                end = data.find("\n", pos)
+                pos = length if end == -1 else end
+                continue
+
+            self.lexpos = pos
+            while lineno < len(linepos) and linepos[lineno] <= pos:
+                lineno += 1
+            self.lineno = lineno
+
+            if c == "_" or c.isalpha():
+                m = self.identifier.match(data, pos)
+                if m is None:
+                    self.error("illegal character", pos)
+                value = m.group()
+                yield Token(ADLLexer.reserved.get(value, "IDENTIFIER"), value, lineno, pos)
+                pos = m.end()
+
+            elif c in self.digits or (c == "." and data[pos + 1:pos + 2] in self.digits):
+                m = self.floatnumber.match(data, pos)
+                if m is not None:
+                    yield Token("FLOAT_NUMBER", float(m.group()), lineno, pos)
+                else:
+                    m = self.decnumber.match(data, pos)
+                    yield Token("DEC_NUMBER", int(m.group()), lineno, pos)
+                pos = m.end()
+
+            elif c == "'" or c == '"':
+                end = -1
+                if data[pos:pos + 3] == c * 3:
+                    end = self.triplestring(pos)
+                if end != -1:
+                    yield Token("MULTILINESTRING", self.literal(data[pos:end], 3), lineno, pos)
+                    pos = end
+                else:
+                    m = self.strings[c].match(data, pos)
+                    if m is None:
+                        self.error("illegal character", pos)
+                    yield Token("STRING", self.literal(m.group(), 1), lineno, pos)
+                    pos = m.end()
+
+            elif data[pos:pos + 2] in self.operators2:
+                yield Token(self.operators2[data[pos:pos + 2]], data[pos:pos + 2], lineno, pos)
+                pos += 2
+
+            elif c in self.operators1:
+                yield Token(self.operators1[c], c, lineno, pos)
+                pos += 1
+
+            else:
+                self.error("illegal character", pos)
+
+        self.lexpos = pos
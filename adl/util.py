@@ -2,16 +2,23 @@
 
 import math
 import numbers
-
-import numpy
+import sys
 
 import adl.error
 
 inf = float("inf")
 nan = float("nan")
 
+# NumPy registers its scalar types with the numbers ABCs, so these checks do not need to import it
+
+def isbool(x):
+    if isinstance(x, bool):
+        return True
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(x, numpy.bool_)
+
 def isint(x, min=None, max=None):
-    if not isinstance(x, (numbers.Integral, numpy.integer)):
+    if not isinstance(x, numbers.Integral):
         return False
     if min is not None and x < min:
         return False
@@ -20,7 +27,7 @@ def isint(x, min=None, max=None):
     return True
 
 def isnum(x, min=None, max=None):
-    if not isinstance(x, (numbers.Real, numpy.integer, numpy.floating)):
+    if not isinstance(x, numbers.Real):
         return False
     if min is not None and x < min:
         return False
@@ -29,7 +36,7 @@ def isnum(x, min=None, max=None):
     return True
 
 def isnan(x):
-    return isinstance(x, (numbers.Real, numpy.floating)) and math.isnan(x)
+    return isinstance(x, numbers.Real) and math.isnan(x)
 
 def check_args(call, min=0, max=None):
     if len(call.arguments) < min:
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# Time for a fresh interpreter to run `import adl.interpreter`, which short-lived worker
+# processes pay every time they start, compared with a bare interpreter. NumPy and PLY
+# should not be among the modules it loads.
+#
+#     python benchmarks/imports.py [--repeat N] [--max-ms MS]
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def startup(statement, repeat):
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        subprocess.check_call([sys.executable, "-c", statement], cwd=root)
+        seconds = time.time() - start
+        if best is None or seconds < best:
+            best = seconds
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    bare = startup("pass", args.repeat)
+    full = startup("import adl.interpreter", args.repeat)
+    heavy = subprocess.check_output([sys.executable, "-c", "import sys, adl.interpreter; print(' '.join(sorted(n for n in ('numpy', 'ply', 'adl.parser') if n in sys.modules)))"], cwd=root).decode().strip()
+
+    print("{0:>24s} {1:>10s}".format("", "best (ms)"))
+    print("{0:>24s} {1:10.1f}".format("python -c pass", 1000 * bare))
+    print("{0:>24s} {1:10.1f}".format("import adl.interpreter", 1000 * full))
+    print("{0:>24s} {1:10.1f}".format("difference", 1000 * (full - bare)))
+
+    if heavy != "":
+        sys.exit("import adl.interpreter loaded {0}".format(heavy))
+    if 1000 * (full - bare) > args.max_ms:
+        sys.exit("import adl.interpreter took {0:.1f} ms more than a bare interpreter (limit {1} ms)".format(1000 * (full - bare), args.max_ms))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+# Time to parse small and large documents with the shared parser, compared with
+# building a new PLY parser for every document (as adl.parser.parse used to).
+#
+#     python benchmarks/parse.py [--repeat N] [--statements N]
+
+import argparse
+import time
+
+import ply.yacc
+
+import adl.parser
+import adl.syntaxtree
+import adl.tokenizer
+
+small = """
+pt := sqrt(px**2 + py**2)
+region "central": abs(eta) < 2.4 {
+  count "pt" by regular(100, 0, 100) <- pt
+}
+"""
+
+def large(statements):
+    # a collect statement has to be closed by a semicolon if another statement follows it
+    out = []
+    for i in range(statements):
+        out.append("x{0} := sqrt(px**2 + py**2) * {0}\ncount \"h{0}\" by regular(100, 0, 100) <- x{0}".format(i))
+    return " ;\n".join(out)
+
+def rebuilt(code):
+    parser = adl.parser.ADLParser()
+    parser.build(write_tables=False, debug=False, debuglog=ply.yacc.NullLogger(), errorlog=ply.yacc.NullLogger())
+    scanner = adl.tokenizer.ADLScanner()
+    scanner.input(code)
+    scanner.positions = adl.syntaxtree.Positions(code, scanner.linepos)
+    return parser.parser.parse(lexer=scanner, tracking=True)
+
+def timeit(function, code, repeat):
+    start = time.time()
+    for i in range(repeat):
+        function(code)
+    return (time.time() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--statements", type=int, default=1000)
+    args = parser.parse_args()
+
+    adl.parser.parse(small)   # build the shared parser before timing
+    print("{0:>10s} {1:>10s} {2:>14s} {3:>14s}".format("document", "bytes", "shared (ms)", "rebuilt (ms)"))
+    for name, code in [("small", small), ("large", large(args.statements))]:
+        shared = timeit(adl.parser.parse, code, args.repeat)
+        fresh = timeit(rebuilt, code, max(1, args.repeat // 4))
+        print("{0:>10s} {1:10d} {2:14.3f} {3:14.3f}".format(name, len(code), 1000 * shared, 1000 * fresh))
+
+if __name__ == "__main__":
+    main()
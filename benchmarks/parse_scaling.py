@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# Parse time for generated documents of 10^3 to 10^6 statements; parsing should scale
+# linearly, so the time per statement should stay flat and the fitted exponent near 1.
+#
+#     python benchmarks/parse_scaling.py [--min N] [--max N]
+
+import argparse
+import math
+import sys
+import time
+
+import adl.parser
+
+def document(statements):
+    # a collect statement has to be closed by a semicolon if another statement follows it
+    out = []
+    for i in range(statements // 2):
+        out.append("x{0} := sqrt(px**2 + py**2) * {0}\ncount \"h{0}\" by regular(100, 0, 100) <- x{0}".format(i))
+    out.append("region " + " ; ".join("\"r{0}\": x > {0}".format(i) for i in range(statements // 100 + 1)) + " { count \"n\" }")
+    return " ;\n".join(out)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min", type=int, default=1000)
+    parser.add_argument("--max", type=int, default=1000000)
+    parser.add_argument("--max-exponent", type=float, default=1.2)
+    args = parser.parse_args()
+
+    adl.parser.parse("x := 1")   # build the shared parser before timing
+    results = []
+    statements = args.min
+    print("{0:>10s} {1:>12s} {2:>10s} {3:>16s}".format("statements", "bytes", "seconds", "us/statement"))
+    while statements <= args.max:
+        code = document(statements)
+        start = time.time()
+        adl.parser.parse(code)
+        seconds = time.time() - start
+        results.append((statements, seconds))
+        print("{0:10d} {1:12d} {2:10.3f} {3:16.2f}".format(statements, len(code), seconds, 1e6 * seconds / statements))
+        statements *= 10
+
+    if len(results) > 1:
+        (n1, t1), (n2, t2) = results[0], results[-1]
+        exponent = math.log(t2 / t1) / math.log(float(n2) / n1)
+        print("time ~ statements^{0:.2f}".format(exponent))
+        if exponent > args.max_exponent:
+            sys.exit("parsing is not near-linear: exponent {0:.2f} > {1}".format(exponent, args.max_exponent))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+# Time of Run.run_threaded for a histogramming document with 1 to N threads, relative to one thread.
+# Events are interpreted in Python with the GIL held, so a standard build should stay near 1; threads
+# only scale on a free-threaded (GIL-free) build.
+#
+#     python benchmarks/threads.py [--events N] [--chunks N] [--max-threads N]
+
+import argparse
+import sys
+import time
+
+import numpy
+
+import adl.interpreter
+
+document = """
+pt := sqrt(px**2 + py**2)
+count "pt" by regular(100, 0, 100) <- pt
+region "central": abs(eta) < 2.4 {
+  count "pt" by regular(100, 0, 100) <- pt
+  profile "eta" pt by regular(48, -2.4, 2.4) <- eta
+}
+vary "nominal": scale := 1.0 ; "scaled": scale := 1.01 {
+  count "pt" by regular(100, 0, 100) <- scale * pt
+}
+"""
+
+def chunks(events, numchunks, seed=12345):
+    random = numpy.random.RandomState(seed)
+    out = []
+    for i in range(numchunks):
+        n = events // numchunks
+        out.append({"px": random.normal(0, 30, n).tolist(), "py": random.normal(0, 30, n).tolist(), "eta": random.normal(0, 2, n).tolist()})
+    return out
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=64000)
+    parser.add_argument("--chunks", type=int, default=64)
+    parser.add_argument("--max-threads", type=int, default=32)
+    args = parser.parse_args()
+
+    data = chunks(args.events, args.chunks)
+    baseline = None
+    threads = 1
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("GIL {0}".format("enabled" if gil else "disabled"))
+    print("{0:>8s} {1:>10s} {2:>8s}".format("threads", "seconds", "ratio"))
+    while threads <= args.max_threads:
+        run = adl.interpreter.Run(document)
+        start = time.time()
+        run.run_threaded(data, threads=threads)
+        seconds = time.time() - start
+        if baseline is None:
+            baseline = seconds
+        print("{0:8d} {1:10.3f} {2:8.2f}".format(threads, seconds, baseline / seconds))
+        threads *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+# Tokenizing time for documents of many unrelated triple-quoted strings and escapes, which used to make
+# the PLY regex rescan the rest of the file; tokenizing should scale linearly, so the fitted exponent
+# should stay near 1.
+#
+#     python benchmarks/tokenize_scaling.py [--min N] [--max N]
+
+import argparse
+import math
+import sys
+import time
+
+import adl.tokenizer
+
+def document(statements):
+    return "\n".join("x{0} := '''a\\nb''' ; y{0} := 'c\\'d'".format(i) for i in range(statements // 2))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min", type=int, default=1000)
+    parser.add_argument("--max", type=int, default=100000)
+    parser.add_argument("--max-exponent", type=float, default=1.2)
+    args = parser.parse_args()
+
+    results = []
+    statements = args.min
+    print("{0:>10s} {1:>12s} {2:>10s} {3:>16s}".format("statements", "bytes", "seconds", "us/statement"))
+    while statements <= args.max:
+        code = document(statements)
+        scanner = adl.tokenizer.ADLScanner()
+        scanner.input(code)
+        start = time.time()
+        for token in scanner:
+            pass
+        seconds = time.time() - start
+        results.append((statements, seconds))
+        print("{0:10d} {1:12d} {2:10.3f} {3:16.2f}".format(statements, len(code), seconds, 1e6 * seconds / statements))
+        statements *= 10
+
+    if len(results) > 1:
+        (n1, t1), (n2, t2) = results[0], results[-1]
+        exponent = math.log(t2 / t1) / math.log(float(n2) / n1)
+        print("time ~ statements^{0:.2f}".format(exponent))
+        if exponent > args.max_exponent:
+            sys.exit("tokenizing is not near-linear: exponent {0:.2f} > {1}".format(exponent, args.max_exponent))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import unittest
+import warnings
+
+import adl.cache
+import adl.interpreter
+import adl.parser
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_memory(self):
+        cache = adl.cache.DocumentCache(maxsize=2)
+        one = cache.parse("x := 1")
+        assert cache.parse("x := 1") is one
+        cache.parse("x := 2")
+        cache.parse("x := 1")
+        cache.parse("x := 3")
+        assert len(cache) == 2
+        assert cache.parse("x := 1") is one
+        assert repr(cache.parse("x := 2")) == repr(adl.parser.parse("x := 2"))
+
+    def test_disk(self):
+        cache = adl.cache.DocumentCache(directory=self.directory)
+        suite = cache.parse("region 'r': x > 1 { count 'c' }")
+        assert len(os.listdir(self.directory)) == 1
+
+        other = adl.cache.DocumentCache(directory=self.directory)
+        original = adl.parser.parse
+        adl.parser.parse = None   # a hit must not parse
+        try:
+            loaded = other.parse("region 'r': x > 1 { count 'c' }")
+        finally:
+            adl.parser.parse = original
+        assert loaded is not suite and repr(loaded) == repr(suite)
+        assert loaded.block[0].code == "region 'r': x > 1 { count 'c' }"
+
+    def test_shared_directory(self):
+        # a directory that others can write to could hold malicious pickles
+        os.chmod(self.directory, 0o777)
+        cache = adl.cache.DocumentCache(directory=self.directory)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            cache.parse("x := 1")
+        assert len(caught) == 1 and os.listdir(self.directory) == []
+
+        # a new directory is created private
+        directory = os.path.join(self.directory, "new")
+        adl.cache.DocumentCache(directory=directory).parse("x := 1")
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700 and len(os.listdir(directory)) == 1
+
+    def test_store_failure(self):
+        # a file that cannot be written does not break parsing or leave a temporary file behind
+        cache = adl.cache.DocumentCache(directory=self.directory)
+        os.mkdir(os.path.join(self.directory, cache.key("x := 1") + cache.suffix))
+        assert repr(cache.parse("x := 1")) == repr(adl.parser.parse("x := 1"))
+        assert os.listdir(self.directory) == [cache.key("x := 1") + cache.suffix]
+
+    def test_disk_eviction(self):
+        cache = adl.cache.DocumentCache(directory=self.directory, maxbytes=1)
+        cache.parse("x := 1")
+        cache.parse("x := 2")
+        assert len(os.listdir(self.directory)) <= 1
+
+    def test_corrupt(self):
+        cache = adl.cache.DocumentCache(directory=self.directory)
+        with open(os.path.join(self.directory, cache.key("x := 1") + cache.suffix), "wb") as file:
+            file.write(b"garbage")
+        assert repr(cache.parse("x := 1")) == repr(adl.parser.parse("x := 1"))
+
+    def test_key(self):
+        assert adl.cache.DocumentCache.key("x := 1") != adl.cache.DocumentCache.key("x := 2")
+
+    def test_run(self):
+        assert adl.interpreter.Run("y := x").ast is adl.interpreter.Run("y := x").ast
+
+    def test_lazy_imports(self):
+        # a worker that only runs cached documents on Python data never imports PLY or NumPy
+        cache = adl.cache.DocumentCache(directory=self.directory)
+        cache.parse("region 'r': x > 1 { sum 's' x }")
+        script = """
+import sys
+import adl.interpreter
+assert not any(n in sys.modules for n in ("ply", "numpy", "adl.parser")), "at import"
+adl.cache.default = adl.cache.DocumentCache(directory={0})
+run = adl.interpreter.Run("region 'r': x > 1 {{ sum 's' x }}")
+run(x=3)
+assert run["r", "s"].value() == 3
+assert not any(n in sys.modules for n in ("ply", "numpy", "adl.parser")), "after a cached run"
+""".format(repr(self.directory))
+        subprocess.check_call([sys.executable, "-c", script], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
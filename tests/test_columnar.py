@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import math
+import unittest
+
+import numpy
+
+import adl.columnar
+import adl.interpreter
+
+class Test(unittest.TestCase):
+    def test_jagged(self):
+        a = adl.columnar.JaggedArray.fromcounts([2, 0, 1], numpy.array([1.1, 2.2, 3.3]))
+        assert len(a) == 3
+        assert a.tolist() == [[1.1, 2.2], [], [3.3]]
+        assert a[1:].tolist() == [[], [3.3]]
+        assert a.localindex.tolist() == [0, 1, 0]
+
+    def test_flat_kinematics(self):
+        v = adl.columnar.LorentzVectorArray(px=[3.0, 0.0], py=[4.0, 1.0], pz=[0.0, 0.0], energy=[10.0, 2.0])
+        assert v.pt.tolist() == [5.0, 1.0]
+        assert v.mass.tolist() == [math.sqrt(75), math.sqrt(3)]
+        assert v.dot(v).tolist() == [75.0, 3.0]
+        assert v.delta_r(v).tolist() == [0.0, 0.0]
+        assert v[0] == {"px": 3.0, "py": 4.0, "pz": 0.0, "energy": 10.0}
+
+    def test_cached_conversion(self):
+        v = adl.columnar.LorentzVectorArray(pt=[5.0], eta=[0.0], phi=[0.0], mass=[0.0])
+        assert v.px is v.px
+        assert round(v.energy[0], 12) == 5.0
+
+    def test_jagged_kinematics(self):
+        pt = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [10.0, 20.0, 30.0])
+        eta = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [0.0, 1.0, -1.0])
+        phi = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [0.0, 0.0, 3.0])
+        mass = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [0.0, 0.0, 0.0])
+        v = adl.columnar.LorentzVectorArray(pt=pt, eta=eta, phi=phi, mass=mass)
+        assert v.counts.tolist() == [2, 0, 1]
+        assert isinstance(v.pt, adl.columnar.JaggedArray)
+        assert numpy.allclose(v.rapidity.content, [0.0, 1.0, -1.0])
+        assert len(v[1]) == 0
+        assert v[2].pt.tolist() == [30.0]
+        s = v + v
+        assert numpy.allclose(s.pt.content, [20.0, 40.0, 60.0])
+
+    def test_interpreter(self):
+        pt = adl.columnar.JaggedArray.fromcounts([2, 1], [10.0, 20.0, 30.0])
+        eta = adl.columnar.JaggedArray.fromcounts([2, 1], [0.0, 0.0, 0.0])
+        phi = adl.columnar.JaggedArray.fromcounts([2, 1], [0.0, 0.0, 0.0])
+        mass = adl.columnar.JaggedArray.fromcounts([2, 1], [0.0, 0.0, 0.0])
+        run = adl.interpreter.Run("n := jets.size ; y := jets.pt.max")
+        out = run(jets=adl.columnar.LorentzVectorArray(pt=pt, eta=eta, phi=phi, mass=mass))
+        assert out["n"] == [2, 1]
+        assert out["y"] == [20.0, 30.0]
+
+    def test_segmented_sum(self):
+        px = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [1.0, 2.0, 3.0])
+        py = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [0.0, 0.0, 0.0])
+        pz = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [0.0, 0.0, 0.0])
+        energy = adl.columnar.JaggedArray.fromcounts([2, 0, 1], [5.0, 5.0, 5.0])
+        v = adl.columnar.LorentzVectorArray(px=px, py=py, pz=pz, energy=energy)
+        s = v.sum()
+        assert s.px.tolist() == [3.0, 0.0, 3.0]
+        assert s.energy.tolist() == [10.0, 0.0, 5.0]
+        assert v[0].sum() == {"px": 3.0, "py": 0.0, "pz": 0.0, "energy": 10.0}
+
+    def test_matching(self):
+        def jagged(counts, pt, eta, phi):
+            return adl.columnar.LorentzVectorArray(pt=adl.columnar.JaggedArray.fromcounts(counts, pt), eta=adl.columnar.JaggedArray.fromcounts(counts, eta), phi=adl.columnar.JaggedArray.fromcounts(counts, phi), mass=adl.columnar.JaggedArray.fromcounts(counts, [0.0] * sum(counts)))
+        jets = jagged([3, 2, 0], [50, 40, 30, 20, 10], [0.0, 1.0, -2.0, 0.0, 0.0], [0.0, 3.1, 1.0, 0.0, 2.0])
+        leptons = jagged([2, 0, 1], [20, 10, 5], [0.1, 1.0, 0.0], [0.05, -3.1, 0.0])
+        assert jets.delta_r_matrix(leptons).counts.tolist() == [6, 0, 0]
+        assert jets.nearest(leptons).tolist() == [[0, 1, 0], [-1, -1], []]
+        isolated = jets.isolated_from(leptons, 0.4)
+        assert isolated.counts.tolist() == [1, 2, 0]
+        assert isolated.pt.tolist() == [[30.0], [20.0, 10.0], []]
+
+        one = jets[0]
+        assert one.nearest(leptons[0]).tolist() == [0, 1, 0]
+        assert one.isolated_from(leptons[0], 0.4).pt.tolist() == [30.0]
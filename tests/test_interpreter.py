@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 
 import math
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 
 import adl.error
 import adl.interpreter
+import adl.version
 
 class Test(unittest.TestCase):
     def test_assign(self):
@@ -356,3 +361,359 @@ class Test(unittest.TestCase):
     def test_lorentz_3(self):
         run = adl.interpreter.Run("b := a.delta_r(a)")
         assert run(a={"px": 3, "py": 4, "pz": 0, "energy": 10})["b"] == 0
+
+    def test_lorentz_cached(self):
+        run = adl.interpreter.Run("b := a.eta ; c := a.delta_r(a) ; d := a.charge")
+        a = {"px": 3, "py": 4, "pz": 0, "energy": 10, "charge": -1}
+        out = run(a=a)
+        assert out["b"] == 0 and out["c"] == 0 and out["d"] == -1
+        assert a == {"px": 3, "py": 4, "pz": 0, "energy": 10, "charge": -1}
+
+        vectors = adl.interpreter.vectorcache.vectors = {}
+        try:
+            assert adl.interpreter.vector(a) is adl.interpreter.vector(a)
+            assert adl.interpreter.ensure_ptetaphi(a, None) is adl.interpreter.ensure_pxpypzE(a, None)
+        finally:
+            adl.interpreter.vectorcache.vectors = None
+
+    def test_lorentz_ptetaphi(self):
+        run = adl.interpreter.Run("b := a.pz ; c := a.mass ; d := a.eta")
+        out = run(a={"pt": 5, "eta": 0, "phi": 0, "mass": 0})
+        assert out["b"] == 0 and out["c"] == 0 and out["d"] == 0
+
+    def test_lorentz_plus(self):
+        run = adl.interpreter.Run("b := (a + a).mass")
+        assert run(a={"px": 3, "py": 4, "pz": 0, "energy": 10})["b"] == math.sqrt(300)
+
+    def test_lorentz_sum(self):
+        run = adl.interpreter.Run("b := a.sum.mass ; c := x.sum")
+        out = run(a=[[{"px": 3, "py": 4, "pz": 0, "energy": 10}, {"pt": 5, "eta": 0, "phi": 0, "mass": 0}, {"px": -3, "py": -4, "pz": 0, "energy": 10}]], x=[[1, 2, 3]])
+        assert out["b"] == [math.sqrt(600)] and out["c"] == [6]
+
+    def test_overlap_removal(self):
+        jets = [{"pt": 50, "eta": 0.0, "phi": 0.0, "mass": 0}, {"pt": 40, "eta": 1.0, "phi": 3.1, "mass": 0}, {"pt": 30, "eta": -2.0, "phi": 1.0, "mass": 0}]
+        leptons = [{"pt": 20, "eta": 0.1, "phi": 0.05, "mass": 0}, {"pt": 10, "eta": 1.0, "phi": -3.1, "mass": 0}]
+        run = adl.interpreter.Run("good := jets.isolated_from(leptons, 0.4) ; n := jets.nearest(leptons) ; m := jets.delta_r_matrix(leptons)")
+        out = run(jets=[jets, jets], leptons=[leptons, []])
+        assert out["good"] == [[jets[2]], jets]
+        assert out["n"] == [[0, 1, 0], [-1, -1, -1]]
+        assert out["m"][0].shape == (3, 2)
+        assert round(out["m"][0][1, 1], 6) == round(2*math.pi - 6.2, 6)
+
+    def test_nearest_columnar(self):
+        # the same document gives the same indices on per-event lists and on columnar arrays
+        import adl.columnar
+        jets = [[{"pt": 50.0, "eta": 0.0, "phi": 0.0, "mass": 0.0}, {"pt": 40.0, "eta": 1.0, "phi": 3.1, "mass": 0.0}], [{"pt": 30.0, "eta": -2.0, "phi": 1.0, "mass": 0.0}]]
+        leptons = [[{"pt": 20.0, "eta": 0.1, "phi": 0.05, "mass": 0.0}, {"pt": 10.0, "eta": 1.0, "phi": -3.1, "mass": 0.0}], []]
+        def columnar(events):
+            counts = [len(x) for x in events]
+            return adl.columnar.LorentzVectorArray(**dict((n, adl.columnar.JaggedArray.fromcounts(counts, [y[n] for x in events for y in x])) for n in ("pt", "eta", "phi", "mass")))
+        run = adl.interpreter.Run("n := jets.nearest(leptons)")
+        fromlists = run(jets=jets, leptons=leptons)["n"]
+        fromarrays = run(jets=columnar(jets), leptons=columnar(leptons))["n"]
+        assert fromlists == [[0, 1], [-1]]
+        assert [list(x) for x in fromarrays] == fromlists
+
+    def test_schema(self):
+        class Muon(object):
+            def __init__(self, pt, eta, phi, charge):
+                self.pt, self.eta, self.phi, self.mass, self.charge = pt, eta, phi, 0.105, charge
+        schema = {"jets": adl.interpreter.ListType(adl.interpreter.RecordType("Jet", ["pt", "eta", "phi", "mass", "btag"], vector=True)),
+                  "muon": adl.interpreter.RecordType("Muon", ["pt", "eta", "phi", "mass", "charge"], vector=True),
+                  "info": adl.interpreter.RecordType("Info", ["run"])}
+        run = adl.interpreter.Run("b := jets.map(j => j.btag) ; q := muon.charge ; r := info.run ; d := jets[0].delta_r(muon) ; m := (jets[0] + muon).pt", schema=schema)
+        jets = [[{"pt": 10.0, "eta": 0.0, "phi": 0.0, "mass": 0.0, "btag": True}]]
+        out = run(jets=jets, muon=[Muon(5.0, 0.0, 0.0, -1)], info=[{"run": 7}])
+        assert out["b"] == [[True]] and out["q"] == [-1] and out["r"] == [7] and out["d"] == [0.0]
+        assert round(out["m"][0], 12) == 15.0
+        assert out["jets"] == jets
+
+        run = adl.interpreter.Run("y := info.lumi", schema=schema)
+        self.assertRaises(adl.error.ADLTypeError, lambda: run(info=[{"run": 7, "lumi": 1}]))
+        run = adl.interpreter.Run("y := info.mass", schema=schema)
+        self.assertRaises(adl.error.ADLTypeError, lambda: run(info=[{"run": 7}]))
+
+        # records of a local class are cached by type, but the cache is not serialized
+        run = adl.interpreter.Run("q := muon.charge", schema=schema)
+        run(muon=[Muon(5.0, 0.0, 0.0, -1)])
+        copy = adl.interpreter.Run.from_bytes(run.to_bytes())
+        assert copy.schema["muon"].accessors == {} and copy(muon=[Muon(5.0, 0.0, 0.0, 1)])["q"] == [1]
+
+        record = schema["info"].bind({"run": 7})
+        assert "run" in record and "lumi" not in record and 0 not in record
+        self.assertRaises(TypeError, lambda: iter(record))
+        run = adl.interpreter.Run("y := info + 1", schema=schema)
+        try:
+            run(info=[{"run": 7}])
+        except adl.error.ADLTypeError as err:
+            assert "not a number" in str(err)
+        else:
+            assert False
+
+        jets = schema["jets"].bind([{"pt": 1.0, "eta": 0.0, "phi": 0.0, "mass": 0.0, "btag": False}, {"pt": 2.0, "eta": 0.0, "phi": 0.0, "mass": 0.0, "btag": True}])
+        assert [x.pt for x in jets] == [1.0, 2.0] and jets[0].getters is jets[1].getters
+
+    def test_merge(self):
+        code = "count 'a' by regular(2, 0.0, 4.0) <- x ; profile 'b' x by variable(0, 2, 4) <- x ; region 'c': x > 1 { fraction 'd' x > 2 }\nvary 'e': y := 1 ; 'f': y := 2 { sum 'g' x * y }"
+        one, two, both = adl.interpreter.Run(code), adl.interpreter.Run(code), adl.interpreter.Run(code)
+        one(x=[1, 2, 3])
+        two(x=[0.5, 3.5, 5])
+        both(x=[1, 2, 3, 0.5, 3.5, 5])
+        merged = one.aggregation + two.aggregation
+        assert float(merged["a", 0]) == 2 and float(merged["a", 1]) == 3 and float(merged["a"].overflow) == 1
+        assert tuple(merged["b", 1]) == tuple(both["b", 1])
+        assert merged["c", "d"].value() == both["c", "d"].value()
+        assert float(merged["f", "g"]) == float(both["f", "g"]) == 30
+        assert float(one["a", 0]) == 1
+
+        one.aggregation.merge(two.aggregation, inplace=True)
+        assert float(one["a", 1]) == 3
+
+        other = adl.interpreter.Run("count 'a' by regular(3, 0.0, 4.0) <- x")
+        self.assertRaises(ValueError, lambda: one["a"] + other["a"])
+        self.assertRaises(ValueError, lambda: one.aggregation + other.aggregation)
+
+    def test_merge_mismatch(self):
+        # a mismatch deep in the tree is found before anything is added
+        one = adl.interpreter.Run("count 'a' by regular(2, 0.0, 2.0) <- x\nregion 'r': x > 0 { count 'b' by regular(2, 0.0, 2.0) <- x }")
+        two = adl.interpreter.Run("count 'a' by regular(2, 0.0, 2.0) <- x\nregion 'r': x > 0 { count 'b' by regular(3, 0.0, 2.0) <- x }")
+        one(x=[0.5])
+        two(x=[0.5, 1.5])
+        def merge():
+            one.aggregation += two.aggregation
+        self.assertRaises(ValueError, merge)
+        assert [float(one["a", i]) for i in range(2)] == [1, 0]
+        assert [float(one["r", "b", i]) for i in range(2)] == [1, 0]
+
+    def test_pickle(self):
+        run = adl.interpreter.Run("f(z) := z**2 ; count 'a' by regular(2, 0.0, 4.0) <- f(x)")
+        run(x=[1, 1.5, 1.9])
+        copy = pickle.loads(pickle.dumps(run))
+        assert float(copy["a", 0]) == 1 and float(copy["a", 1]) == 2
+        copy(x=[0.5])
+        assert float(copy["a", 0]) == 2 and float(run["a", 0]) == 1
+
+    def test_to_bytes(self):
+        run = adl.interpreter.Run("f(z) := z**2 ; count 'a' by regular(2, 0.0, 4.0) <- f(x)")
+        run(x=[1, 1.5, 1.9])
+        blob = run.to_bytes()
+        assert blob.startswith(adl.interpreter.Run.magic)
+        copy = adl.interpreter.Run.from_bytes(blob)
+        assert float(copy["a", 0]) == 1 and float(copy["a", 1]) == 2
+        copy(x=[0.5])
+        assert float(copy["a", 0]) == 2 and float(run["a", 0]) == 1
+
+        self.assertRaises(ValueError, lambda: adl.interpreter.Run.from_bytes(b"garbage"))
+        self.assertRaises(ValueError, lambda: adl.interpreter.Run.from_bytes(b"ADL"))
+        self.assertRaises(ValueError, lambda: adl.interpreter.Run.from_bytes(blob[:11]))
+        self.assertRaises(ValueError, lambda: adl.interpreter.Run.from_bytes(blob[:6] + b"\xff\xff" + blob[8:]))
+        self.assertRaises(ValueError, lambda: adl.interpreter.Run.from_bytes(blob[:6] + blob[6:8] + b"\x05\x009.9.9" + blob[8 + 2 + len(adl.version.__version__):]))
+
+        # a worker reconstructs the Run without the parser
+        script = "import sys, adl.interpreter; run = adl.interpreter.Run.from_bytes(sys.stdin.buffer.read()); run(x=[0.5]); assert float(run['a', 0]) == 2; assert 'adl.parser' not in sys.modules and 'ply' not in sys.modules"
+        process = subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        process.communicate(blob)
+        assert process.returncode == 0
+
+    def test_revise(self):
+        code = "pt := sqrt(px**2 + py**2)\ncount 'a' by regular(4, 0.0, 4.0) <- x ;\nsum 's' pt ;\nregion 'r': x > 1 {\n  count 'n'\n}\ncount 'b' by regular(4, 0.0, 4.0) <- x"
+        run = adl.interpreter.Run(code)
+        run(x=[0.5, 1.5, 2.5], px=[3, 0, 0], py=[4, 1, 1])
+        a, s, r, statements = run["a"], run["s"], run["r"], list(run.ast.block)
+
+        # only the edited histogram is reset
+        code = code.replace("count 'b' by regular(4, 0.0, 4.0)", "count 'b' by regular(8, 0.0, 4.0)")
+        run.revise(code)
+        assert run["a"] is a and run["s"] is s and run["r"] is r and run.ast.block[:4] == statements[:4]
+        assert run["b"].numbins == 8 and float(run["b", 1]) == 0
+        assert float(run["a", 0]) == 1 and float(run["r", "n"]) == 2 and run["s"].value() == 7
+
+        # moved statements keep their storages, which now refer to the new syntax tree; a changed definition resets what depends on it
+        run.revise("# moved down a line\n" + code.replace("px**2", "px**4"))
+        assert run["a"] is a and float(run["a", 0]) == 1 and float(run["r", "n"]) == 2
+        assert run.ast.block[1] is not statements[1] and run.ast.block[1].lineno == 3
+        assert run["a"].expression is run.ast.block[1].axes[0].expression is not statements[1].axes[0].expression
+        assert run["s"] is not s and run["s"].value() == 0
+        run(x=[0.5], px=[2], py=[0])
+        assert float(run["a", 0]) == 2 and run["s"].value() == 4
+
+        self.assertRaises(adl.error.ADLError, lambda: run.revise("count 'a' by"))
+        assert float(run["a", 0]) == 2
+
+        # a definition that shadows a builtin changes its readers, whether it is added, edited, or removed
+        run = adl.interpreter.Run("sum 's' sqrt(x)")
+        run(x=[4])
+        run.revise("sqrt(y) := y * 10\nsum 's' sqrt(x)")
+        run(x=[4])
+        assert run["s"].value() == 40
+        run.revise("sqrt(y) := y * 100\nsum 's' sqrt(x)")
+        assert run["s"].value() == 0
+        run(x=[4])
+        run.revise("sum 's' sqrt(x)")
+        run(x=[4])
+        assert run["s"].value() == 2
+
+        # moving a definition after its reader changes what the reader sees
+        run = adl.interpreter.Run("a := x * 10\nsum 's' a")
+        run(x=[3])
+        run.revise("sum 's' a\na := x * 10")
+        assert run["s"].value() == 0
+        run(a=[1], x=[3])
+        assert run["s"].value() == 1
+
+    def test_run_parallel(self):
+        code = "count 'a' by regular(4, 0.0, 4.0) <- x ; profile 'b' x * y"
+        chunks = [{"x": [i % 5 + 0.5 for i in range(j, j + 7)], "y": [0.1 * i for i in range(j, j + 7)]} for j in range(0, 70, 7)]
+        serial = adl.interpreter.Run(code)
+        for chunk in chunks:
+            serial(**chunk)
+        for workers in (1, 3):
+            parallel = adl.interpreter.Run(code)
+            parallel.run_parallel(chunks, workers=workers)
+            assert [float(parallel["a", i]) for i in range(-1, 5)] == [float(serial["a", i]) for i in range(-1, 5)]
+            assert abs(parallel["b"].value() - serial["b"].value()) < 1e-12
+
+    def test_run_parallel_shared(self):
+        code = "count 'a' by regular(4, 0.0, 4.0) <- x\nregion 'r': x > 1 { fraction 'f' y > 3 }"
+        chunks = [{"x": [i % 5 + 0.5 for i in range(j, j + 7)], "y": [0.1 * i for i in range(j, j + 7)]} for j in range(0, 70, 7)]
+        serial = adl.interpreter.Run(code)
+        for chunk in chunks:
+            serial(**chunk)
+        parallel = adl.interpreter.Run(code)
+        parallel.run_parallel(chunks, workers=3, shared=True)
+        assert [float(parallel["a", i]) for i in range(-1, 5)] == [float(serial["a", i]) for i in range(-1, 5)]
+        assert parallel["r", "f"].value() == serial["r", "f"].value()
+        assert isinstance(parallel["a", 0], adl.interpreter.Count) and type(parallel["a", 0].value()) is type(serial["a", 0].value())
+
+    def test_run_shared_error(self):
+        # a failing worker reports its own error, not a BufferError from closing the shared memory
+        import multiprocessing.shared_memory
+        run = adl.interpreter.Run("count 'a' by regular(2, 0.0, 2.0) <- x")
+        memory = multiprocessing.shared_memory.SharedMemory(create=True, size=run["a"].size * 8)
+        try:
+            share = (run.shard().to_bytes(), None, [{"y": [1.0]}], memory.name)
+            self.assertRaises(adl.error.ADLError, lambda: adl.interpreter.runsharedshare(share))
+            share = (run.shard().to_bytes(), None, [{"x": [0.5, 1.5, 1.7]}], memory.name)
+            partial = adl.interpreter.runsharedshare(share)
+            assert partial["a"].array is None
+            assert memory.buf.cast("d").tolist() == [1.0, 1.0, 2.0, 2.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_binning_array(self):
+        # bins of a storage are views of one array, allocated when first filled or read
+        import pickle
+        run = adl.interpreter.Run("count 'a' by regular(2, 0.0, 2.0) <- x\nprofile 'p' x by variable(0, 1, 2) <- x\nregion 'r': true by regular(2, 0.0, 2.0) <- x { count 'n' }")
+        assert run["a"].array is None and run["a"].size == 10 and run["p"].size == 20
+        run(x=[0.5, 1.5, 1.7, 5.0])
+        assert run["a"].array.tolist() == [1.0, 1.0, 2.0, 2.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0]
+        assert run["a", 1].value() == 2.0 and run["a", 1].name == ("a", 1) and run["a"].overflow.name == ("a", "overflow")
+        assert abs(run["p", 1].value() - 1.6) < 1e-12 and run["r", 1, "n"].value() == 2
+        assert list(adl.interpreter.arraybinnings(run.aggregation)) == [run["a"], run["p"]]
+        copy = pickle.loads(pickle.dumps(run["a", 1]))
+        assert type(copy) is adl.interpreter.Count and copy.value() == 2.0
+
+    def test_run_threaded(self):
+        code = "count 'a' by regular(4, 0.0, 4.0) <- x\nregion 'r': x > 1 { sum 's' y }"
+        chunks = [{"x": [i % 5 + 0.5 for i in range(j, j + 7)], "y": [float(i) for i in range(j, j + 7)]} for j in range(0, 70, 7)]
+        serial = adl.interpreter.Run(code)
+        for chunk in chunks:
+            serial(**chunk)
+        threaded = adl.interpreter.Run(code)
+        threaded.run_threaded(chunks, threads=4)
+        assert [float(threaded["a", i]) for i in range(-1, 5)] == [float(serial["a", i]) for i in range(-1, 5)]
+        assert float(threaded["r", "s"]) == float(serial["r", "s"])
+
+    def test_fill(self):
+        import numpy
+        import adl.columnar
+        def chunks():
+            for j in range(0, 30, 10):
+                yield {"x": numpy.arange(j, j + 10) % 4 + 0.5, "jets": adl.columnar.JaggedArray.fromcounts(numpy.arange(10) % 3, numpy.ones(9))}
+        seen = []
+        run = adl.interpreter.Run("count 'a' by regular(4, 0.0, 4.0) <- x\ncount 'n' by regular(3, -0.5, 2.5) <- jets.size")
+        assert run.fill(chunks(), progress=lambda numchunks, numevents: seen.append((numchunks, numevents))) is run.aggregation
+        assert seen == [(1, 10), (2, 20), (3, 30)]
+        assert [float(run["a", i]) for i in range(4)] == [8, 8, 7, 7]
+        assert [float(run["n", i]) for i in range(3)] == [12, 9, 9]
+        self.assertRaises(ValueError, lambda: run.fill([{"x": [1, 2], "y": [1]}]))
+
+    def test_keep(self):
+        import numpy
+        run = adl.interpreter.Run("y := x * 2\nz := x > 1\ncount 'a' by regular(2, 0.0, 4.0) <- x")
+        assert run.keep(None, {"x": [1, 2, 3]}) == {}
+        assert float(run["a", 0]) == 1 and float(run["a", 1]) == 2
+        out = run.keep(("y", "z"), {"x": [1, 2, 3]})
+        assert set(out) == {"y", "z"}
+        assert out["y"].dtype == numpy.int64 and out["y"].tolist() == [2, 4, 6]
+        assert out["z"].dtype == numpy.bool_ and out["z"].tolist() == [False, True, True]
+        assert run.keep("y", {"x": [1, 2.5]})["y"].tolist() == [2.0, 5.0]
+        assert run(x=[1, 2, 3])["y"] == [2, 4, 6]
+        self.assertRaises(KeyError, lambda: run.keep(("nope",), {"x": [1]}))
+
+        # a single event gives arrays too, and a column may be named keep
+        out = run.keep("y", {"x": 3})
+        assert isinstance(out["y"], numpy.ndarray) and out["y"].tolist() == [6]
+        run = adl.interpreter.Run("y := x")
+        out = run.keep("y", {"x": [1, 2**70, 3]})["y"]
+        assert out.dtype == object and out.tolist() == [1, 2**70, 3]
+        out = run.keep("y", {"x": [1.5, 10**400]})["y"]
+        assert out.dtype == object and out.tolist() == [1.5, 10**400]
+        out = run.keep("y", {"x": list(range(100000)) + [0.5]})["y"]
+        assert out.dtype == numpy.float64 and out[99999] == 99999.0 and out[-1] == 0.5
+
+        run = adl.interpreter.Run("y := keep + 1")
+        assert run.keep("y", {"keep": [1, 2]})["y"].tolist() == [2, 3]
+        assert run(keep=[1, 2])["y"] == [2, 3]
+
+    def test_inputs(self):
+        run = adl.interpreter.Run("""
+met := sqrt(metx**2 + mety**2)
+f(a) := a * scale
+leading := jets[0]
+count 'met' by regular(10, 0, 100) <- f(met)
+region 'r': leading.pt > 30 {
+  count 'n' weight w
+}
+vary 'up': shift := 1.1 ; 'down': shift := 0.9 {
+  sum 's' shift * muons.size
+}
+for j in jets {
+  count 'eta' by regular(10, -5, 5) <- j.eta
+}
+""")
+        assert run.inputs == {"metx", "mety", "scale", "jets", "w", "muons"}
+        assert run.paths == {"metx", "mety", "scale", "jets.pt", "jets.eta", "w", "muons"}
+
+        run = adl.interpreter.Run("sum 'n' jets.filter(j => j.pt > 30).size ; sum 'phi' jets.maxby(j => j.mass).phi ; sum 'eta' jets.map(j => j.eta).sum")
+        assert run.paths == {"jets", "jets.pt", "jets.mass", "jets.phi", "jets.eta"}
+
+    def test_selection(self):
+        class Column(list):
+            touched = 0
+            def __getitem__(self, i):
+                Column.touched += 1
+                return list.__getitem__(self, i)
+
+        code = "good := trigger and nlep >= 1\nregion 'signal': good { count 'x' by regular(4, 0.0, 4.0) <- x }"
+        run = adl.interpreter.Run(code)
+        assert run.selection.columns == {"trigger", "nlep"}
+        chunk = {"trigger": [i % 10 == 0 for i in range(100)], "nlep": [i % 20 for i in range(100)], "x": Column([i % 4 + 0.5 for i in range(100)])}
+        assert run.select(chunk).tolist() == [10, 30, 50, 70, 90]
+        assert Column.touched == 0
+        run.fill([chunk])
+        assert Column.touched == 5
+        serial = adl.interpreter.Run(code)
+        serial(**chunk)
+        assert [float(run["signal", "x", i]) for i in range(4)] == [float(serial["signal", "x", i]) for i in range(4)]
+
+        assert adl.interpreter.Run("count 'n'\nregion 'r': x > 1 { count 'n' }").selection is None
+
+        # a predicate reads the definitions before its region, not ones after it
+        for code, names in [("region 'r': x > 1 { count 'n' }\nx := 0", [("r", "n")]),
+                            ("y := x\nregion 'a': y > 1 { count 'n' }\ny := 0\nregion 'b': y < 1 { count 'n' }", [("a", "n"), ("b", "n")])]:
+            run, serial = adl.interpreter.Run(code), adl.interpreter.Run(code)
+            run.fill([{"x": [0, 2, 3]}])
+            serial(x=[0, 2, 3])
+            assert [float(run[name]) for name in names] == [float(serial[name]) for name in names]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+import ply.yacc
+
+import adl.error
+import adl.interpreter
+import adl.parser
+import adl.parsertable
+import adl.syntaxtree
+
+class Test(unittest.TestCase):
+    def test_shipped_tables(self):
+        # if this fails, the grammar changed: regenerate the tables with "python -m adl.parser"
+        parser = adl.parser.ADLParser()
+        reflect = ply.yacc.ParserReflect(dict((n, getattr(parser, n)) for n in dir(parser)))
+        reflect.get_all()
+        assert reflect.signature() == adl.parsertable._lr_signature
+
+    def test_no_tables_written(self):
+        cwd = os.getcwd()
+        directory = tempfile.mkdtemp()
+        try:
+            os.chdir(directory)
+            adl.parser.parse("x := 1")
+            assert os.listdir(directory) == []
+        finally:
+            os.chdir(cwd)
+            os.rmdir(directory)
+
+    def test_threads(self):
+        codes = ["x{0} := y * {0}\nregion 'r': x{0} > 1 {{ count 'c' }}".format(i) for i in range(50)]
+        expected = [repr(adl.parser.parse(x)) for x in codes]
+        results = [None] * 8
+        def work(i):
+            results[i] = [repr(adl.parser.parse(x)) for x in codes]
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for x in threads:
+            x.start()
+        for x in threads:
+            x.join()
+        assert all(x == expected for x in results)
+
+    def test_positions_after_error(self):
+        self.assertRaises(Exception, lambda: adl.parser.parse("x := \n\n )"))
+        assert adl.parser.parse("\n\ny := 2").block[0].lineno == 3
+
+    def test_blocks(self):
+        suite = adl.parser.parse("for j in jets { count 'a' }\ncount 'b' ; x := 1\nregion 'r': x > 1 { sum 's' x } vary 'v': y := 1 ; 'w': y := 2 { count 'c' }")
+        assert [type(x).__name__ for x in suite.block] == ["For", "Collect", "Define", "Region", "Vary"]
+        assert [x.name.value for x in suite.block[4].variations] == ["v", "w"]
+        self.assertRaises(adl.error.ADLSyntaxError, lambda: adl.parser.parse("region 'r': x > 1 { count 'c' } ; count 'd'"))
+        self.assertRaises(adl.error.ADLSyntaxError, lambda: adl.parser.parse("count 'c' count 'd'"))
+
+    def test_long_lists(self):
+        suite = adl.parser.parse("region " + " ; ".join("'r{0}': x > {0}".format(i) for i in range(3000)) + " { count 'n' }\n" + "\n".join("x{0} := {0}".format(i) for i in range(3000)))
+        assert [x.name.value for x in suite.block[0].namepredicates] == ["r{0}".format(i) for i in range(3000)]
+        assert [x.target.name for x in suite.block[1:]] == ["x{0}".format(i) for i in range(3000)]
+
+    def test_positions(self):
+        suite = adl.parser.parse("x := 1\n\ny := f(x,\n  2)")
+        define = suite.block[1]
+        assert not hasattr(define, "__dict__")
+        assert (define.lineno, define.col_offset) == (3, 2)
+        call = define.expression
+        assert (call.lineno, call.col_offset) == (3, 6)
+        assert (call.arguments[1].lineno, call.arguments[1].col_offset) == (4, 2)
+        assert call.positions is suite.block[0].positions and call.code.startswith("x := 1")
+        copy = pickle.loads(pickle.dumps(suite))
+        assert (copy.block[1].expression.arguments[1].lineno, copy.block[1].expression.arguments[1].col_offset) == (4, 2)
+        try:
+            adl.parser.parse("x := 1\n1(y) := 2")
+        except adl.error.ADLSyntaxError as err:
+            assert str(err).startswith("Line 2: function name in a function definition must be an identifier")
+        else:
+            assert False
+
+    def test_walk(self):
+        suite = adl.parser.parse("f(x) := x + 1\nregion 'r': f(y) > 2 { count 'n' by regular(10, 0, 10) <- y }")
+        def recursive(node, topdown):
+            out = [node] if topdown else []
+            for x in node.children():
+                out.extend(recursive(x, topdown))
+            return out if topdown else out + [node]
+        assert list(suite.walk()) == recursive(suite, True)
+        assert list(suite.walk(topdown=False)) == recursive(suite, False)
+        assert sum(isinstance(x, adl.syntaxtree.Literal) for x in suite.walk()) == 7
+
+        # deeper than the recursion limit
+        depth = 5000
+        deep = adl.parser.parse("z := " + "-(" * depth + "x" + ")" * depth)
+        assert sum(isinstance(x, adl.syntaxtree.Call) for x in deep.walk()) == depth
+        assert list(deep.walk(topdown=False))[-1] is deep
+
+    def test_visitor(self):
+        class Names(adl.syntaxtree.Visitor):
+            def __init__(self):
+                super(Names, self).__init__()
+                self.names = []
+            def visit_Identifier(self, node):
+                self.names.append(node.name)
+            def visit_FunctionDefine(self, node):
+                return False
+        names = Names()
+        names.visit(adl.parser.parse("f(x) := x + a\ny := f(b) + c"))
+        assert names.names == ["y", "f", "b", "c"]
+
+        class Rename(adl.syntaxtree.Transformer):
+            def visit_Identifier(self, node):
+                return adl.syntaxtree.Identifier("w") if node.name == "x" else node
+            def visit_Literal(self, node):
+                return adl.syntaxtree.Literal(node.value * 10)
+        suite = Rename().visit(adl.parser.parse("y := x + 1 ; z := -x"))
+        assert repr(suite) == repr(adl.parser.parse("y := w + 10 ; z := -w"))
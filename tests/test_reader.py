@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import numpy
+
+import adl.asynchronous
+import adl.interpreter
+import adl.reader
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.x = numpy.arange(10, dtype=numpy.float64) % 4 + 0.5
+        self.offsets = numpy.array([0, 2, 2, 3, 6, 6, 6, 7, 9, 9, 10])
+        self.content = numpy.arange(10, dtype=numpy.float64)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check(self, reader):
+        assert len(reader) == 10
+        assert reader.columns == ["jets", "x"]
+        assert isinstance(reader["x"], numpy.memmap)
+        assert isinstance(reader["jets"].content, numpy.memmap)
+        chunks = list(reader.chunks(4))
+        assert [len(x["x"]) for x in chunks] == [4, 4, 2]
+        assert chunks[1]["jets"].tolist() == [[], [], [6.0], [7.0, 8.0]]
+        assert numpy.shares_memory(chunks[1]["x"], reader["x"])
+
+        run = adl.interpreter.Run("count 'a' by regular(4, 0.0, 4.0) <- x\nsum 'n' jets.size")
+        run.fill(reader.chunks(3, columns=["x", "jets"]))
+        assert [float(run["a", i]) for i in range(4)] == [3, 3, 2, 2]
+        assert float(run["n"]) == 10
+
+    def test_directory(self):
+        numpy.save(os.path.join(self.directory, "x.npy"), self.x)
+        numpy.save(os.path.join(self.directory, "jets.offsets.npy"), self.offsets)
+        numpy.save(os.path.join(self.directory, "jets.content.npy"), self.content)
+        self.check(adl.reader.ColumnReader(self.directory))
+
+    def test_npz(self):
+        path = os.path.join(self.directory, "data.npz")
+        numpy.savez(path, **{"x": self.x, "jets.offsets": self.offsets, "jets.content": self.content})
+        self.check(adl.reader.ColumnReader(path))
+
+    def test_npy(self):
+        path = os.path.join(self.directory, "data.npy")
+        array = numpy.zeros(10, dtype=[("x", numpy.float64), ("y", numpy.int64)])
+        array["x"] = self.x
+        numpy.save(path, array)
+        reader = adl.reader.ColumnReader(path)
+        assert reader.columns == ["x", "y"]
+        assert [x["x"].tolist() for x in reader.chunks(5, columns=["x"], start=2, stop=8)] == [self.x[2:7].tolist(), self.x[7:8].tolist()]
+        self.assertRaises(KeyError, lambda: list(reader.chunks(5, columns=["z"])))
+
+    def test_prefetcher(self):
+        # the producer asks for another chunk only after queueing the last one, so whenever the
+        # generator resumes, the queue must already be within its limits
+        def chunks(holder, started, observed):
+            started.wait()
+            for i in range(10):
+                if i > 0:
+                    observed.append((len(holder[0]._queue), holder[0]._bytes))
+                yield {"x": numpy.full(100, i, dtype=numpy.float64)}
+
+        holder, started, observed = [], threading.Event(), []
+        prefetcher = adl.reader.Prefetcher(chunks(holder, started, observed), depth=3)
+        holder.append(prefetcher)
+        started.set()
+        assert [x["x"][0] for x in prefetcher] == list(range(10))
+        assert len(observed) == 9 and max(n for n, size in observed) <= 3
+
+        holder, started, observed = [], threading.Event(), []
+        with adl.reader.Prefetcher(chunks(holder, started, observed), depth=10, maxbytes=2000) as prefetcher:
+            holder.append(prefetcher)
+            started.set()
+            assert len([x for x in prefetcher]) == 10
+        assert len(observed) == 9 and max(size for n, size in observed) <= 2000
+
+    def test_prefetcher_error(self):
+        def chunks():
+            yield {"x": [1, 2, 3]}
+            raise IOError("disk on fire")
+        prefetcher = adl.reader.Prefetcher(chunks())
+        assert next(prefetcher) == {"x": [1, 2, 3]}
+        self.assertRaises(IOError, lambda: next(prefetcher))
+
+    def test_fill_async(self):
+        numpy.save(os.path.join(self.directory, "x.npy"), self.x)
+        reader = adl.reader.ColumnReader(self.directory)
+        run = adl.interpreter.Run("count 'a' by regular(4, 0.0, 4.0) <- x")
+        assert asyncio.run(adl.asynchronous.fill(run, reader.chunks(3), depth=2)) is run.aggregation
+        assert [float(run["a", i]) for i in range(4)] == [3, 3, 2, 2]
+
+    def test_fill_async_cancel(self):
+        filled, gate = threading.Event(), threading.Event()
+        def chunks():
+            yield {"x": [0.5, 1.5]}
+            gate.wait()
+            yield {"x": [2.5]}
+
+        async def cancel(run):
+            task = asyncio.ensure_future(adl.asynchronous.fill(run, chunks(), progress=lambda numchunks, numevents: filled.set()))
+            await asyncio.get_running_loop().run_in_executor(None, filled.wait)
+            task.cancel()
+            gate.set()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            return False
+
+        run = adl.interpreter.Run("count 'a' by regular(4, 0.0, 4.0) <- x")
+        assert asyncio.run(cancel(run))
+        assert [float(run["a", i]) for i in range(4)] == [0, 0, 0, 0]
+        assert not any(x.name == "adl-prefetch" for x in threading.enumerate())
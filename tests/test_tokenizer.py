@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+import unittest
+
+import adl.error
+import adl.tokenizer
+
+documents = [
+    "",
+    "x := 1",
+    "\n\n  x := 1.5e3 + .5 - 3. * 2e-2 ** 007 # comment\n# another\n\ny:=x",
+    "count 'a' by regular(10, 0, 100) <- x weight w ; region 'r': x >= 1 and not y <= 2 or z != 3 { sum \"s\" x }",
+    "f(a, b) := { c := a % b\n  c / 2 }\ng := (a, b) => a == b\nh := x[1, 2].pt.sum",
+    "vary 'up': s := 1 ; 'down': s := -1 { profile 'p' x by variable(0, 1, 2) <- y }",
+    "source 'a*', 'b' { fraction 'f' x > 1 }\nnot source 'c' { count 'c' }\nfor j in jets { count 'n' }",
+    "s := 'it\\'s'\nt := \"tab\\there\"\nu := '''multi\nline \\''' string'''\nv := 12abc",
+    "x := true\ny := false\nin_ := forx\n\r\n\tz := x<-y",
+]
+
+def plytokens(code):
+    lexer = adl.tokenizer.ADLLexer()
+    lexer.build()
+    lexer.lexer.input(code)
+    return [(x.type, x.value, x.lexpos) for x in iter(lexer.lexer.token, None)]
+
+def scannertokens(code):
+    scanner = adl.tokenizer.ADLScanner()
+    scanner.input(code)
+    return [(x.type, x.value, x.lexpos) for x in scanner]
+
+class Test(unittest.TestCase):
+    def test_same_tokens(self):
+        for code in documents:
+            assert scannertokens(code) == plytokens(code), code
+
+    def test_errors(self):
+        for code in ["x := 1\ny := $", "x := 'unterminated\ny := 2", "x := 1\n  = 2"]:
+            try:
+                plytokens(code)
+            except adl.error.ADLSyntaxError as err:
+                expected = str(err)
+            else:
+                assert False, code
+            try:
+                scannertokens(code)
+            except adl.error.ADLSyntaxError as err:
+                assert str(err) == expected
+            else:
+                assert False, code
+
+    def test_linecol(self):
+        scanner = adl.tokenizer.ADLScanner()
+        scanner.input("a\n\nbc\n")
+        assert [scanner.linecol(x) for x in (0, 2, 3, 4)] == [(1, 0), (2, 0), (3, 0), (3, 1)]
+        assert [x.lineno for x in scanner] == [1, 3]
+
+    def test_separate_multiline_strings(self):
+        scanner = adl.tokenizer.ADLScanner()
+        scanner.input("x := '''a'''\ny := '''b'''")
+        assert [x.value for x in scanner if x.type == "MULTILINESTRING"] == ["a", "b"]
+
+    def test_linear(self):
+        # many unrelated triple-quoted strings and escapes used to make the PLY regex rescan the rest of the file;
+        # benchmarks/tokenize_scaling.py times this, and here the tokens must simply be right
+        code = "\n".join("x{0} := '''a\\nb''' ; y{0} := 'c\\'d'".format(i) for i in range(1000))
+        tokens = scannertokens(code)
+        assert len(tokens) == 7 * 1000
+        assert tokens[-5:-3] == [("MULTILINESTRING", "a\nb", code.rindex("'''a")), ("SEMICOLON", ";", code.rindex(";"))]